@@ -3,7 +3,17 @@ from .config import config_by_name
 from .extensions import db, migrate, jwt
 from .api.v1 import v1_bp
 from .middleware.tenant_middleware import tenant_middleware
+from .middleware.auth_context import auth_context
 from .errors import register_error_handlers
+from .utils.page_cache import published_page_cache
+from .utils.snapshots import snapshot_cache
+from .utils.json_provider import init_json_provider
+from .utils.audit_sink import audit_sink
+from .utils.password_hasher import password_hasher
+from .utils.sql_metrics import init_sql_metrics
+from .utils.read_replica import init_read_replica
+from .jobs import init_jobs
+from .commands import register_commands
 from flask_swagger_ui import get_swaggerui_blueprint
 import os
 
@@ -11,6 +21,7 @@ import os
 def create_app(config_name: str = "development") -> Flask:
     app = Flask(__name__)
     app.config.from_object(config_by_name[config_name])
+    init_json_provider(app)
 
     # -------------------------------------------------
     # Extensions
@@ -18,11 +29,22 @@ def create_app(config_name: str = "development") -> Flask:
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
+    audit_sink.init_app(app)
+    password_hasher.init_app(app)
+
+    # -------------------------------------------------
+    # Caches
+    # -------------------------------------------------
+    published_page_cache.init_app(app)
+    snapshot_cache.configure(max_size=app.config.get("SNAPSHOT_CACHE_MAX_SIZE"))
 
     # -------------------------------------------------
     # Middleware
     # -------------------------------------------------
+    init_sql_metrics(app)  # first, so tenant/auth lookups are counted
     tenant_middleware(app)
+    auth_context(app)
+    init_read_replica(app)
 
     # -------------------------------------------------
     # API Blueprints
@@ -30,6 +52,16 @@ def create_app(config_name: str = "development") -> Flask:
     app.register_blueprint(v1_bp, url_prefix="/api/v1")
     register_error_handlers(app)
 
+    # -------------------------------------------------
+    # Background jobs
+    # -------------------------------------------------
+    init_jobs(app)
+
+    # -------------------------------------------------
+    # CLI
+    # -------------------------------------------------
+    register_commands(app)
+
     # -------------------------------------------------
     # Serve OpenAPI YAML (PUBLIC, NO TENANT)
     # -------------------------------------------------
@@ -11,5 +11,8 @@ from . import protected
 from . import admin
 from . import cms
 from . import audit
+from . import jobs
 
-v1_bp.register_blueprint(audit.audit_bp, url_prefix="/audit")
\ No newline at end of file
+v1_bp.register_blueprint(cms.cms_bp)
+v1_bp.register_blueprint(audit.audit_bp, url_prefix="/audit")
+v1_bp.register_blueprint(jobs.jobs_bp, url_prefix="/jobs")
@@ -1,42 +1,88 @@
 # app/api/v1/audit.py
-from flask import Blueprint, request, jsonify, g
+import csv
+import io
+from datetime import datetime
+from flask import Blueprint, request, jsonify, g, current_app, stream_with_context
 from flask_jwt_extended import jwt_required
+from werkzeug.exceptions import BadRequest
 from app.utils.decorators import tenant_required, roles_required
 from app.models.audit_log import AuditLog
 from app.utils.pagination import apply_cursor, paginate_cursor
+from app.utils.read_replica import replica_reads
 from app.normalizers.audit import normalize_audit_log
 
 audit_bp = Blueprint("audit", __name__)
 
+MAX_PAGE_SIZE = 200
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORT_COLUMNS = (
+    "id", "tenant_id", "actor_id", "action",
+    "entity_type", "entity_id", "payload", "created_at",
+)
+
+
+def _filtered_query(tenant_id):
+    """
+    Tenant-scoped audit query with the shared request filters applied:
+    entity_type, entity_id, actor_id, action (equality) and since/until
+    (ISO 8601, half-open range on created_at).
+    """
+    query = AuditLog.query.filter_by(
+        tenant_id=tenant_id,
+    )
+
+    for field in ("entity_type", "entity_id", "actor_id", "action"):
+        value = request.args.get(field)
+        if value:
+            query = query.filter(getattr(AuditLog, field) == value)
+
+    since = _parse_time("since")
+    until = _parse_time("until")
+
+    if since:
+        query = query.filter(AuditLog.created_at >= since)
+
+    if until:
+        query = query.filter(AuditLog.created_at < until)
+
+    return query
+
+
+def _parse_time(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise BadRequest(f"Invalid {name} timestamp") from exc
+
 
 @audit_bp.route("/audit_logs", methods=["GET"])
+@replica_reads
 @jwt_required()
 @tenant_required
 def list_audit_logs():
     tenant = g.current_tenant
 
-    limit = request.args.get("limit", 50, type=int)
+    limit = min(request.args.get("limit", 50, type=int), MAX_PAGE_SIZE)
     cursor = request.args.get("cursor")
     direction = request.args.get("direction", "next")
 
-    entity_type = request.args.get("entity_type")
-    entity_id = request.args.get("entity_id")
-
-    query = AuditLog.query.filter_by(
-        tenant_id=tenant.id,
-    )
-
-    if entity_type:
-        query = query.filter(AuditLog.entity_type == entity_type)
-
-    if entity_id:
-        query = query.filter(AuditLog.entity_id == entity_id)
+    query = _filtered_query(tenant.id)
 
     query = apply_cursor(
         query,
         model=AuditLog,
         cursor=cursor,
         direction=direction,
+        prune_column=AuditLog.created_at,
     )
 
     logs, meta = paginate_cursor(
@@ -50,3 +96,73 @@ def list_audit_logs():
         "items": [normalize_audit_log(l) for l in logs],
         "pagination": meta,
     }), 200
+
+
+@audit_bp.route("/audit_logs/export", methods=["GET"])
+@replica_reads
+@jwt_required()
+@tenant_required
+@roles_required("admin")
+def export_audit_logs():
+    """
+    Stream every matching audit log as NDJSON or CSV.
+
+    Rows come from a server-side cursor in chunks of AUDIT_EXPORT_CHUNK_SIZE
+    and are written out chunk by chunk, so memory stays flat however many
+    rows match. Accepts the same filters as list_audit_logs.
+    """
+    tenant = g.current_tenant
+
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "Invalid export format"}), 400
+
+    query = _filtered_query(tenant.id)
+
+    chunk_size = current_app.config.get("AUDIT_EXPORT_CHUNK_SIZE", 1000)
+
+    # Plain column rows (no identity map), fetched through a named cursor
+    rows = (
+        query.with_entities(*(getattr(AuditLog, c) for c in EXPORT_COLUMNS))
+        .order_by(AuditLog.id.asc())
+        .yield_per(chunk_size)
+    )
+
+    dumps = current_app.json.dumps
+
+    def generate_ndjson():
+        buffer = []
+        for row in rows:
+            buffer.append(dumps(normalize_audit_log(row)))
+            if len(buffer) >= chunk_size:
+                yield "\n".join(buffer) + "\n"
+                buffer.clear()
+
+        if buffer:
+            yield "\n".join(buffer) + "\n"
+
+    def generate_csv():
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(EXPORT_COLUMNS)
+
+        for i, row in enumerate(rows, start=1):
+            item = normalize_audit_log(row)
+            item["payload"] = dumps(item["payload"])
+            writer.writerow([item[c] for c in EXPORT_COLUMNS])
+
+            if i % chunk_size == 0:
+                yield out.getvalue()
+                out.seek(0)
+                out.truncate()
+
+        yield out.getvalue()
+
+    generate = generate_ndjson if fmt == "ndjson" else generate_csv
+    filename = f"audit_logs_{tenant.id}.{fmt}"
+
+    return current_app.response_class(
+        stream_with_context(generate()),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -3,6 +3,7 @@ from flask_jwt_extended import (
     create_access_token,
     create_refresh_token
 )
+from app.extensions import db
 from app.models.user import User
 from . import v1_bp
 
@@ -34,14 +35,18 @@ def login():
     if not user.is_active:
         return jsonify({"error": "User account disabled"}), 403
 
-    identity = {
-        "user_id": user.id,
+    # check_password upgraded an outdated hash
+    if db.session.is_modified(user):
+        db.session.commit()
+
+    # "sub" must be a string; tenant/role ride along as extra claims
+    claims = {
         "tenant_id": tenant.id,
         "role": user.role
     }
 
-    access_token = create_access_token(identity=identity)
-    refresh_token = create_refresh_token(identity=identity)
+    access_token = create_access_token(identity=user.id, additional_claims=claims)
+    refresh_token = create_refresh_token(identity=user.id, additional_claims=claims)
 
     return jsonify({
         "access_token": access_token,
@@ -1,35 +1,38 @@
 # app/api/v1/cms.py
-from flask import Blueprint, g, request, jsonify
+from flask import Blueprint, g, request, jsonify, abort, current_app
 from flask_jwt_extended import jwt_required
 from app.application.cms.publish_page import publish_page
-from app.application.cms.rollback_page import rollback_page
-from app.application.cms.bulk_publish import bulk_publish_pages
 from app.application.cms.autosave_page import autosave_page
 from app.application.cms.unpublish_page import unpublish_page
 from app.application.cms.create_page import create_page
 from app.application.cms.update_page import update_page
-from app.application.cms.delete_page import delete_page
+from app.application.cms.move_block import move_block
 from app.utils.decorators import tenant_required, roles_required, feature_enabled
 from app.utils.media import save_file, delete_file
-from app.utils.order import compact_order
+from app.utils.order import compact_order, defer_order_constraint, order_step, sibling_positions, sparse_ordering
 from app.utils.audit import log_action
 from app.utils.optimistic_lock import enforce_optimistic_lock
 from app.utils.transaction import transactional
 from app.utils.pagination import paginate_cursor, apply_cursor
+from app.utils.page_cache import published_page_cache
+from app.utils.loading import page_tree_options
+from app.utils.version_diff import get_version_diff
+from app.utils.sql_metrics import query_budget
+from app.utils.read_replica import replica_reads
+from app.utils.ids import parse_uuid
+from app.jobs import enqueue_job
 from app.models.page import Page
 from app.models.section import Section
 from app.models.block import Block
 from app.models.page_version import PageVersion
 from app.extensions import db
-from app.normalizers.page import normalize_page
+from app.normalizers.page import normalize_page, normalize_page_snapshot
 from app.normalizers.section import normalize_section
 from app.normalizers.pagination import normalize_pagination
 from app.normalizers.block import normalize_block
-from app.domain.invariants.page import assert_page
-from app.domain.invariants.section import assert_section
-from app.domain.invariants.block import assert_block_order, assert_block_media
+from app.domain.invariants.aggregate import validate_scope
 from datetime import datetime 
-from typing import List, Union, Dict
+from typing import List
 
 cms_bp = Blueprint("cms", __name__)
 
@@ -64,27 +67,69 @@ def create_page_route():
     }), 201
 
 @cms_bp.route("/pages/<slug>", methods=["GET"])
+@query_budget(6)
 @jwt_required()
 @tenant_required
 @feature_enabled("enable_cms")
 def get_page(slug):
     tenant = g.current_tenant
-    page = Page.query.filter_by(
-        tenant_id=tenant.id,
-        slug=slug,
-        status="published"
-    ).first_or_404()
 
-    return jsonify(normalize_page(page, admin=False))
+    # Resolved per request (uq_page_slug_per_tenant), so a publish is
+    # visible on every worker as soon as it commits
+    row = (
+        db.session.query(Page.id, Page.published_version_id)
+        .filter(
+            Page.tenant_id == tenant.id,
+            Page.slug == slug,
+            Page.status == "published",
+            Page.deleted_at.is_(None),
+        )
+        .first()
+    )
+
+    if not row:
+        abort(404)
+
+    if row.published_version_id is None:
+        # Published before the version pointer existed: render the live tree
+        page = Page.query.options(page_tree_options()).filter_by(id=row.id).one()
+        return jsonify(normalize_page(page, admin=False))
+
+    body = published_page_cache.get_or_render(
+        row.published_version_id,
+        lambda: _render_version(row.published_version_id),
+    )
+
+    if body is None:
+        abort(404)
+
+    return current_app.response_class(body, mimetype="application/json")
+
+
+def _render_version(version_id):
+    """
+    Cache-miss path for get_page: serialized JSON of one PageVersion.
+
+    Answers from the immutable snapshot, so unpublished edits to live rows
+    never leak out. Keyframe snapshots need no further queries; deltas
+    replay from snapshot_cache.
+    """
+    version = db.session.get(PageVersion, version_id)
+    if version is None:
+        return None
+
+    return current_app.json.dumps(normalize_page_snapshot(version.snapshot))
 
 @cms_bp.route("/pages/id/<page_id>", methods=["GET"])
+@query_budget(6)
+@replica_reads
 @jwt_required()
 @tenant_required
 @roles_required("admin")
 @feature_enabled("enable_cms")
 def get_page_by_id(page_id):
     tenant = g.current_tenant
-    page = Page.query.filter_by(
+    page = Page.query.options(page_tree_options()).filter_by(
         tenant_id=tenant.id,
         id=page_id
     ).first_or_404()
@@ -112,13 +157,14 @@ def update_page_route(page_id):
     return jsonify({"message": "Page updated successfully"}), 200
 
 @cms_bp.route("/pages/<page_id>/preview", methods=["GET"])
+@replica_reads
 @jwt_required()
 @tenant_required
 @roles_required("admin")
 @feature_enabled("enable_cms")
 def preview_page(page_id):
     tenant = g.current_tenant
-    page = Page.query.filter_by(
+    page = Page.query.options(page_tree_options()).filter_by(
         id=page_id,
         tenant_id=tenant.id
     ).first_or_404()
@@ -184,15 +230,18 @@ def delete_page_route(page_id):
     page = Page.query.filter_by(id=page_id, tenant_id=tenant.id).first_or_404()
     user = g.current_user
 
-    delete_page(
+    job = enqueue_job(
         tenant_id=tenant.id,
-        page_id=page.id,
-        actor_id=user.id
+        job_type="cms.delete_page",
+        payload={"page_id": page.id},
+        actor_id=user.id,
     )
-    
-    return jsonify({"message": "Page deleted successfully"}), 200
+
+    return _job_accepted(job, "Page deletion queued")
 
 @cms_bp.route("/pages", methods=["GET"])
+@query_budget(6)
+@replica_reads
 @jwt_required()
 @tenant_required
 def list_pages():
@@ -200,7 +249,7 @@ def list_pages():
     limit = min(request.args.get("limit", 20, type=int), 100)
     cursor = request.args.get("cursor")
 
-    query = Page.query.filter_by(
+    query = Page.query.options(page_tree_options()).filter_by(
         tenant_id=tenant.id,
         deleted_at=None,
     )
@@ -221,34 +270,41 @@ def list_pages():
     ), 200
 
 
-@cms_bp.get("/pages/<int:page_id>/sections")
+@cms_bp.get("/pages/<page_id>/sections")
+@query_budget(4)
+@replica_reads
 @jwt_required()
 @tenant_required
-def list_sections(page_id: int):
+def list_sections(page_id: str):
     tenant = g.current_tenant
 
     limit = min(request.args.get("limit", 20, type=int), 100)
     cursor = request.args.get("cursor")
 
-    query = Section.query.filter_by(
+    siblings = Section.query.filter_by(
         tenant_id=tenant.id,
         page_id=page_id,
         deleted_at=None,
     )
 
-    query = apply_cursor(query, model=Section, cursor=cursor)
+    query = apply_cursor(siblings, model=Section, cursor=cursor)
     items, meta = paginate_cursor(query, model=Section, limit=limit)
 
+    # Stored keys may be sparse; expose the same 1..N order as page reads
+    positions = sibling_positions(siblings, [s.id for s in items])
+
     return jsonify(
         normalize_pagination(
             items,
-            normalize_fn=normalize_section,
+            normalize_fn=lambda s: normalize_section(s, position=positions.get(s.id)),
             cursor=meta
         )
     ), 200
 
 
 @cms_bp.route("/pages/<page_id>/versions", methods=["GET"])
+@query_budget(4)
+@replica_reads
 @jwt_required()
 @tenant_required
 @roles_required("admin")
@@ -281,7 +337,29 @@ def list_versions(page_id):
     ), 200
 
 
+@cms_bp.route("/pages/<page_id>/versions/<int:from_version>/diff/<int:to_version>", methods=["GET"])
+@replica_reads
+@jwt_required()
+@tenant_required
+@roles_required("admin")
+def diff_versions(page_id, from_version, to_version):
+    tenant = g.current_tenant
+
+    diff = get_version_diff(
+        tenant_id=tenant.id,
+        page_id=page_id,
+        from_version=from_version,
+        to_version=to_version,
+    )
+
+    if diff is None:
+        abort(404)
+
+    return jsonify(diff), 200
+
+
 @cms_bp.route("/pages/<page_id>/rollback/<int:version>", methods=["POST"])
+@query_budget(6)
 @jwt_required()
 @tenant_required
 @roles_required("admin")
@@ -289,18 +367,20 @@ def rollback_page_route(page_id, version):
     tenant = g.current_tenant
     user = g.current_user
 
-    result = rollback_page(
+    PageVersion.query.filter_by(
         tenant_id=tenant.id,
         page_id=page_id,
-        rollback_version=version,
-        actor_id=user.id
+        version=version,
+    ).first_or_404()
+
+    job = enqueue_job(
+        tenant_id=tenant.id,
+        job_type="cms.rollback_page",
+        payload={"page_id": page_id, "version": version},
+        actor_id=user.id,
     )
 
-    return jsonify({
-        "message": f"Page rolled back successfully to version {version}",
-        "page_id": result["page_id"],
-        "new_version": result["new_version"]
-    }), 200
+    return _job_accepted(job, f"Rollback to version {version} queued")
 
 
 # ------------------------
@@ -313,7 +393,6 @@ def rollback_page_route(page_id, version):
 @feature_enabled("enable_cms")
 def create_section(page_id):
     tenant = g.current_tenant
-    page = Page.query.filter_by(id=page_id, tenant_id=tenant.id).first_or_404()
     data = request.get_json()
     
     section_type = data.get("type")
@@ -321,25 +400,26 @@ def create_section(page_id):
         return jsonify({"error": "Invalid section type"}), 400
     
     with transactional():
-        # Determine the current max order for this page
+        # Lock the page so concurrent creates cannot read the same max order
+        page = Page.query.filter_by(id=page_id, tenant_id=tenant.id).with_for_update().first_or_404()
+
         max_order = db.session.query(db.func.max(Section.order))\
-            .filter_by(page_id=page.id, tenant_id=tenant.id)\
+            .filter_by(page_id=page.id, tenant_id=tenant.id, deleted_at=None)\
             .scalar() or 0
         
         section = Section(
             tenant_id=tenant.id,
             page_id=page.id,
             type=section_type,
-            order=max_order + 1,
+            order=max_order + order_step(),
             settings=data.get("settings", {})
         )
 
         db.session.add(section)
         db.session.flush()  # ensure section.id is available
 
-        # Enforce invariants
-        assert_section(section)  # Invariant Enforcement Point
-        assert_page(page)
+        # Enforce invariants on the new section and its page's section order
+        validate_scope(tenant_id=tenant.id, section_ids=[section.id], page_ids=[page.id])
         
         # Audit logging
         log_action(
@@ -377,8 +457,7 @@ def update_section(section_id):
                 setattr(section, field, data[field])
                 changed_fields.append(field)
 
-        assert_section(section)  # Invariant Enforcement Point
-        assert_page(section.page)
+        validate_scope(tenant_id=tenant.id, section_ids=[section.id], page_ids=[section.page_id])  # Invariant Enforcement Point
 
         if changed_fields:
             log_action(
@@ -414,12 +493,13 @@ def delete_section(section_id):
         section.soft_delete()
         db.session.flush()
 
-        # Re-compact section order after deletion
-        compact_order(
-            Section.query.filter_by(page_id=page_id, tenant_id=tenant.id, deleted_at=None)
-        )
+        # Re-compact section order after deletion (sparse keys tolerate gaps)
+        if not sparse_ordering():
+            compact_order(
+                Section.query.filter_by(page_id=page_id, tenant_id=tenant.id, deleted_at=None)
+            )
 
-        assert_page(section.page)
+        validate_scope(tenant_id=tenant.id, page_ids=[page_id])
 
         # Audit
         log_action(
@@ -436,6 +516,8 @@ def delete_section(section_id):
     return jsonify({"message": "Section deleted and order re-compacted"}), 200
 
 @cms_bp.route("/sections/<section_id>/blocks", methods=["GET"])
+@query_budget(4)
+@replica_reads
 @jwt_required()
 @tenant_required
 @roles_required("admin")
@@ -454,19 +536,22 @@ def list_blocks(section_id):
     cursor = request.args.get("cursor")
 
     # Query blocks for htis section
-    query = Block.query.filter_by(
+    siblings = Block.query.filter_by(
         tenant_id=tenant.id,
         section_id=section_id,
         deleted_at=None
     )
 
-    query = apply_cursor(query, model=Block, cursor=cursor)
+    query = apply_cursor(siblings, model=Block, cursor=cursor)
     blocks, meta = paginate_cursor(query, model=Block, limit=limit)
 
+    # Stored keys may be sparse; expose the same 1..N order as page reads
+    positions = sibling_positions(siblings, [b.id for b in blocks])
+
     return jsonify(
         normalize_pagination(
             blocks,
-            normalize_fn=normalize_block,
+            normalize_fn=lambda b: normalize_block(b, position=positions.get(b.id)),
             cursor=meta
         )
     ), 200
@@ -503,20 +588,25 @@ def reorder_sections(page_id):
     with transactional():
         # Map paginated sections by id for validation
         section_map = {s.id: s for s in pagination.items}
+        step = order_step()
 
         for item in data:
             if item["id"] in section_map:
-                section_map[item["id"]].order = item["order"]
+                section_map[item["id"]].order = item["order"] * step
 
+        # Client orders may collide until re-compacted below
+        defer_order_constraint(Section)
         db.session.flush()
 
         # re-compact ALL sections on this page
         compact_order(
-            Section.query.filter_by(page_id=page_id, tenant_id=tenant.id, deleted_at=None)
+            Section.query.filter_by(page_id=page_id, tenant_id=tenant.id, deleted_at=None),
+            step=step,
         )
 
         # Enforce invariants and audit
-        assert_page(Page.query.filter_by(id=page_id, tenant_id=tenant.id).first_or_404())
+        Page.query.filter_by(id=page_id, tenant_id=tenant.id).first_or_404()
+        validate_scope(tenant_id=tenant.id, page_ids=[page_id])
 
         log_action(
             action="section.reorder",
@@ -544,11 +634,6 @@ def reorder_sections(page_id):
 @feature_enabled("enable_cms")
 def create_block(section_id):
     tenant = g.current_tenant
-    section = Section.query.filter_by(
-        id=section_id,
-        tenant_id=tenant.id
-    ).first_or_404()
-
     data = request.form or {}
     file = request.files.get("file")
 
@@ -566,9 +651,15 @@ def create_block(section_id):
             media_url = save_file(file)
 
         with transactional():
+            # Lock the section so concurrent creates cannot read the same max order
+            section = Section.query.filter_by(
+                id=section_id,
+                tenant_id=tenant.id
+            ).with_for_update().first_or_404()
+
             max_order = (
                 db.session.query(db.func.max(Block.order))
-                .filter_by(section_id=section.id, tenant_id=tenant.id)
+                .filter_by(section_id=section.id, tenant_id=tenant.id, deleted_at=None)
                 .scalar()
                 or 0
             )
@@ -577,7 +668,7 @@ def create_block(section_id):
                 tenant_id=tenant.id,
                 section_id=section.id,
                 type=block_type,
-                order=max_order + 1,
+                order=max_order + order_step(),
                 content=data.get("content"),
                 media_url=media_url
             )
@@ -586,9 +677,12 @@ def create_block(section_id):
             db.session.flush()  # ensure block.id is available
 
             # Invariants
-            assert_block_order(block)
-            assert_block_media(block)
-            assert_section(section)
+            validate_scope(tenant_id=tenant.id, section_ids=[section.id])
+
+            position = sibling_positions(
+                Block.query.filter_by(section_id=section.id, tenant_id=tenant.id, deleted_at=None),
+                [block.id],
+            )[block.id]
 
             # Audit
             log_action(
@@ -605,7 +699,7 @@ def create_block(section_id):
         return jsonify(
             {
                 "id": block.id,
-                "order": block.order,
+                "order": position,
                 "message": "Block created successfully",
             }
         ), 201
@@ -648,9 +742,7 @@ def update_block(block_id):
                     setattr(block, field, data[field])
 
             # Invariants
-            assert_block_order(block)
-            assert_block_media(block)
-            assert_section(block.section)
+            validate_scope(tenant_id=tenant.id, section_ids=[block.section_id])
 
             # Audit
             log_action(
@@ -684,7 +776,15 @@ def delete_block(block_id):
 
     with transactional():
         block.soft_delete()
-        assert_section(block.section)
+        db.session.flush()
+
+        # Close the gap left by the deleted block (sparse keys tolerate gaps)
+        if not sparse_ordering():
+            compact_order(
+                Block.query.filter_by(section_id=block.section_id, tenant_id=tenant.id, deleted_at=None)
+            )
+
+        validate_scope(tenant_id=tenant.id, section_ids=[block.section_id])
         log_action(
             action="block.delete",
             entity_type="block",
@@ -724,21 +824,25 @@ def reorder_blocks(section_id):
     with transactional():
         # Map paginated blocks by id for validation
         block_map = {b.id: b for b in pagination.items}
+        step = order_step()
 
         for item in data:
             if item["id"] in block_map:
-                block_map[item["id"]].order = item["order"]
+                block_map[item["id"]].order = item["order"] * step
 
+        # Client orders may collide until re-compacted below
+        defer_order_constraint(Block)
         db.session.flush()
 
         # Re-compact all blocks in section
         compact_order(
-            Block.query.filter_by(section_id=section_id, tenant_id=tenant.id, deleted_at=None)
+            Block.query.filter_by(section_id=section_id, tenant_id=tenant.id, deleted_at=None),
+            step=step,
         )
 
         # Enforce invariants and audit
-        section = Section.query.filter_by(id=section_id, tenant_id=tenant.id).first_or_404()
-        assert_section(section)
+        Section.query.filter_by(id=section_id, tenant_id=tenant.id).first_or_404()
+        validate_scope(tenant_id=tenant.id, section_ids=[section_id])
 
         log_action(
             action="block.reorder",
@@ -754,6 +858,43 @@ def reorder_blocks(section_id):
     return jsonify({"message": f"Blocks reordered and normalized"}), 200
 
 
+@cms_bp.route("/blocks/<block_id>/move", methods=["POST"])
+@jwt_required()
+@tenant_required
+@roles_required("admin")
+@feature_enabled("enable_cms")
+def move_block_route(block_id):
+    tenant = g.current_tenant
+    user = g.current_user
+    data = request.get_json(silent=True) or {}  # {section_id?, before_id? | after_id?}
+
+    Block.query.filter_by(id=block_id, tenant_id=tenant.id, deleted_at=None).first_or_404()
+
+    result = move_block(
+        tenant_id=tenant.id,
+        block_id=block_id,
+        actor_id=user.id,
+        section_id=data.get("section_id"),
+        before_id=data.get("before_id"),
+        after_id=data.get("after_id"),
+    )
+
+    # Keys around the new slot are running out: re-spread them off-request
+    if result["needs_rebalance"]:
+        enqueue_job(
+            tenant_id=tenant.id,
+            job_type="cms.rebalance_blocks",
+            payload={"section_id": result["section_id"]},
+            actor_id=user.id,
+        )
+
+    return jsonify({
+        "message": "Block moved successfully",
+        "block_id": result["block_id"],
+        "section_id": result["section_id"],
+    }), 200
+
+
 @cms_bp.route("/pages/<page_id>/autosave", methods=["POST"])
 @jwt_required()
 @tenant_required
@@ -790,30 +931,27 @@ def bulk_publish_route():
     if action not in {"publish", "unpublish"}:
         return jsonify({"error": "Invalid action"}), 400
 
-    result: Dict[str, Union[int, str]] = {}
-    with transactional():
-        count = 0
-        for page_id in page_ids:
-            if action == "publish":
-                publish_page(tenant_id=tenant.id, page_id=page_id, actor_id=user.id)
-            else:
-                unpublish_page(tenant_id=tenant.id, page_id=page_id, actor_id=user.id)
-            count += 1
-
-        # Audit the bulk operation
-        log_action(
-            action=f"pages.bulk.{action}",
-            entity_type="page",
-            entity_id=None,
-            payload={"page_ids": page_ids, "count": count},
-        )
+    if not isinstance(page_ids, list):
+        return jsonify({"error": "page_ids must be a list"}), 400
+
+    if page_ids and not any(parse_uuid(page_id) for page_id in page_ids):
+        return jsonify({"error": "page_ids contains no valid page id"}), 400
+
+    job = enqueue_job(
+        tenant_id=tenant.id,
+        job_type="cms.bulk_publish",
+        payload={"page_ids": page_ids, "action": action},
+        actor_id=user.id,
+    )
+
+    return _job_accepted(job, f"Bulk {action} queued")
 
-        result["count"] = count
-        result["action"] = action
 
+def _job_accepted(job, message):
+    """202 response for work handed to the job runner; poll status_url."""
     return jsonify({
-        "message": f"Pages {action}ed successfully",
-        "page_ids": page_ids,
-        "count": result["count"],
-        "action": result["action"]
-    }), 200
\ No newline at end of file
+        "message": message,
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/v1/jobs/{job.id}",
+    }), 202
\ No newline at end of file
@@ -1,9 +1,21 @@
 from flask import Blueprint, jsonify
+from app.middleware.tenant_middleware import tenant_cache
+from app.middleware.auth_context import user_cache
+from app.utils.page_cache import published_page_cache
+from app.utils.audit_sink import audit_sink
+from app.utils.password_hasher import password_hasher
 from . import v1_bp
 
 @v1_bp.route('/health', methods=['GET'])
 def health_check():
     return jsonify({
         "status": "ok",
-        "service": "backend-platform"
+        "service": "backend-platform",
+        "caches": {
+            "tenant": tenant_cache.stats(),
+            "users": user_cache.stats(),
+            "published_pages": published_page_cache.stats(),
+        },
+        "audit": audit_sink.stats(),
+        "password_hasher": password_hasher.stats(),
     })
\ No newline at end of file
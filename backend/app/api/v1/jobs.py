@@ -0,0 +1,34 @@
+# app/api/v1/jobs.py
+from flask import Blueprint, jsonify, g
+from flask_jwt_extended import jwt_required
+from app.utils.decorators import tenant_required, roles_required
+from app.models.job import Job
+from app.jobs import request_cancel
+from app.normalizers.job import normalize_job
+
+jobs_bp = Blueprint("jobs", __name__)
+
+
+@jobs_bp.route("/<job_id>", methods=["GET"])
+@jwt_required()
+@tenant_required
+@roles_required("admin")
+def get_job(job_id):
+    tenant = g.current_tenant
+    job = Job.query.filter_by(id=job_id, tenant_id=tenant.id).first_or_404()
+
+    # A "partial" job is reported through status and result.failed
+    return jsonify(normalize_job(job)), 200
+
+
+@jobs_bp.route("/<job_id>/cancel", methods=["POST"])
+@jwt_required()
+@tenant_required
+@roles_required("admin")
+def cancel_job(job_id):
+    tenant = g.current_tenant
+    Job.query.filter_by(id=job_id, tenant_id=tenant.id).first_or_404()
+
+    job = request_cancel(tenant_id=tenant.id, job_id=job_id)
+
+    return jsonify(normalize_job(job)), 202
@@ -5,10 +5,12 @@ from app.utils.decorators import (
     tenant_required,
     roles_required
 )
+from app.utils.read_replica import replica_reads
 from . import v1_bp
 
 
 @v1_bp.route("/users", methods=["GET"])
+@replica_reads
 @jwt_required()
 @tenant_required
 @roles_required("admin")
@@ -5,6 +5,7 @@ from app.models.page_draft import PageDraft
 from app.utils.transaction import transactional
 from app.utils.versioning import snapshot_page
 from app.utils.audit import log_action
+from app.utils.loading import page_tree_options
 
 
 def autosave_page(
@@ -23,6 +24,7 @@ def autosave_page(
     """
     page: Page = (
         Page.query
+        .options(page_tree_options())
         .filter_by(id=page_id, tenant_id=tenant_id, deleted_at=None)
         .first_or_404()
     )
@@ -1,55 +1,213 @@
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional
+from flask import current_app
+from sqlalchemy import select
 from app.extensions import db
 from app.models.page import Page
+from app.models.page_version import PageVersion
 from app.domain.invariants.page import assert_page
+from app.domain.invariants.exceptions import InvariantViolation
+from app.domain.lifecycle.page import assert_page_transition
 from app.utils.transaction import transactional
+from app.utils.versioning import snapshot_page, allocate_versions
+from app.utils.snapshots import get_snapshots, is_keyframe, store_snapshot
 from app.utils.audit import log_action
+from app.utils.loading import page_tree_options
+from app.utils.ids import parse_uuid
 
 ALLOWED_ACTIONS = {"publish", "unpublish"}
 
+# action → (target page status, PageVersion status, audit action)
+ACTION_STATES = {
+    "publish": ("published", "published", "page.publish"),
+    "unpublish": ("draft", "unpublished", "page.unpublish"),
+}
+
+DEFAULT_CHUNK_SIZE = 100
+
+
 def bulk_publish_pages(
     *,
     tenant_id: str,
-    page_ids: List[int],
+    page_ids: List[str],
     action: str,
     actor_id: str,
-) -> Dict[str, int | str]:  # ✅ allow int or str
-
+    chunk_size: Optional[int] = None,
+    on_chunk: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
     """
-    Bulk publish or unpublish pages.
+    Bulk publish or unpublish pages with the same guarantees as
+    publish_page / unpublish_page, but set-based.
 
-    Responsibilities:
-    - Transactional update
-    - Enforce invariants on publish
-    - Audit logging
+    Per chunk:
+    - one SELECT ... FOR UPDATE locking pages in id order (deadlock-safe)
+    - batched tree loads for snapshots and invariants
+    - one UPDATE ... RETURNING allocating the next version for every page
+    - one query loading the previous snapshots that new deltas are based on
+    - batched PageVersion / page / audit writes and a single commit
+
+    Pages failing lifecycle or invariant checks, and ids that are not
+    UUIDs, are skipped and reported in the per-page results and in
+    "failed"; they never abort the rest of the chunk. A non-empty "failed"
+    finishes the job as "partial".
+
+    on_chunk(done, total) is called after each committed chunk; raising
+    from it stops further chunks (used for job progress/cancellation).
     """
     if action not in ALLOWED_ACTIONS:
         raise ValueError(f"Invalid action: {action}")
 
-    pages = (
-        Page.query
-        .filter(
-            Page.id.in_(page_ids),
-            Page.tenant_id == tenant_id,
-            Page.deleted_at.is_(None)  # type: ignore
+    if chunk_size is None:
+        chunk_size = current_app.config.get("BULK_PUBLISH_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+
+    # Canonical ids, de-duplicated in request order. A malformed id would
+    # fail the whole IN query against the uuid column, so it is reported
+    # on its own instead.
+    requested: List[Any] = []
+    unique_ids: List[str] = []
+    results: Dict[Any, Dict[str, Any]] = {}
+    for index, page_id in enumerate(page_ids):
+        canonical = parse_uuid(page_id)
+        if canonical is None:
+            key = ("invalid", index)
+            results[key] = {"page_id": page_id, "status": "error", "error": "Invalid page id"}
+            requested.append(key)
+        elif canonical not in results:
+            results[canonical] = None  # filled in by its chunk
+            requested.append(canonical)
+            unique_ids.append(canonical)
+
+    for start in range(0, len(unique_ids), chunk_size):
+        chunk = unique_ids[start:start + chunk_size]
+        results.update(
+            _process_chunk(
+                tenant_id=tenant_id,
+                page_ids=chunk,
+                action=action,
+                actor_id=actor_id,
+            )
         )
-        .all()
-    )
+
+        if on_chunk:
+            on_chunk(min(start + chunk_size, len(unique_ids)), len(unique_ids))
+
+    ordered = [results[key] for key in requested]
+    failed = [
+        {"page_id": r["page_id"], "error": r["error"]}
+        for r in ordered if r["status"] != "ok"
+    ]
+    count = len(ordered) - len(failed)
+
+    if not failed:
+        message = f"Pages {action}ed successfully"
+    elif count:
+        message = f"{len(failed)} of {len(ordered)} pages could not be {action}ed"
+    else:
+        message = f"No pages were {action}ed"
+
+    return {
+        "action": action,
+        "message": message,
+        "count": count,
+        "failed": failed,
+        "results": ordered,
+    }
+
+
+def _process_chunk(
+    *,
+    tenant_id: str,
+    page_ids: List[str],
+    action: str,
+    actor_id: str,
+) -> Dict[str, Dict[str, Any]]:
+    to_status, version_status, audit_action = ACTION_STATES[action]
+
+    results: Dict[str, Dict[str, Any]] = {
+        page_id: {"page_id": page_id, "status": "error", "error": "Page not found"}
+        for page_id in page_ids
+    }
 
     with transactional():
+        # 1️⃣ Lock all pages of the chunk in one statement, stable order
+        pages: List[Page] = list(
+            db.session.execute(
+                select(Page)
+                .options(page_tree_options())
+                .where(
+                    Page.id.in_(page_ids),
+                    Page.tenant_id == tenant_id,
+                    Page.deleted_at.is_(None),
+                )
+                .order_by(Page.id)
+                .with_for_update(of=Page)
+            )
+            .scalars()
+        )
+
+        # 2️⃣ Lifecycle + invariants, in memory on preloaded trees
+        accepted: List[Page] = []
         for page in pages:
-            if action == "publish":
-                page.status = "published"
-                assert_page(page, publish=True)  # enforce publish invariant
-            else:
-                page.status = "draft"
+            try:
+                assert_page_transition(from_status=page.status, to_status=to_status)
+                assert_page(page, publish=(action == "publish"))
+            except (ValueError, InvariantViolation) as exc:
+                results[page.id] = {"page_id": page.id, "status": "error", "error": str(exc)}
+                continue
+
+            accepted.append(page)
+
+        if not accepted:
+            return results
+
+        # 3️⃣ Allocate versions for every accepted page in one statement
+        accepted_ids = [page.id for page in accepted]
+        allocated = allocate_versions(accepted_ids, tenant_id)
+
+        # Delta bases for the whole chunk: one chain query, not one per page
+        previous = get_snapshots({
+            page_id: version - 1
+            for page_id, version in allocated.items()
+            if not is_keyframe(version)
+        })
+
+        # 4️⃣ Apply state change and build versions
+        versions: List[PageVersion] = []
+        for page in accepted:
+            page.status = to_status
+
+            version = PageVersion()
+            version.page_id = page.id
+            version.tenant_id = tenant_id
+            version.version = allocated[page.id]
+            version.status = version_status
+            store_snapshot(version, snapshot_page(page), previous=previous.get(page.id))
+            version.created_by = actor_id
+            versions.append(version)
+
+        db.session.add_all(versions)
+        db.session.flush()  # one batched INSERT for all versions
+
+        for page, version in zip(accepted, versions):
+            page.published_version_id = version.id if action == "publish" else None
+
+            log_action(
+                action=audit_action,
+                entity_type="page",
+                entity_id=page.id,
+                payload={"version": version.version, "bulk": True},
+            )
+
+            results[page.id] = {"page_id": page.id, "status": "ok", "version": version.version}
 
-        # Audit once per batch
+        # 5️⃣ One summary audit row per chunk
         log_action(
             action=f"page.bulk_{action}",
             entity_type="page",
             entity_id="*",
-            payload={"count": len(pages), "actor_id": actor_id},
+            payload={"page_ids": accepted_ids, "count": len(accepted), "actor_id": actor_id},
         )
 
-    return {"count": len(pages), "action": action}
+    return results
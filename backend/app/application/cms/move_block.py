@@ -0,0 +1,137 @@
+# app/application/cms/move_block.py
+from typing import Any, Dict, Optional
+from sqlalchemy import select
+from app.extensions import db
+from app.models.section import Section
+from app.models.block import Block
+from app.utils.transaction import transactional
+from app.utils.audit import log_action
+from app.utils.order import move_row, compact_order, order_step
+from app.domain.invariants.aggregate import validate_scope
+
+
+def move_block(
+    *,
+    tenant_id: str,
+    block_id: str,
+    actor_id: str,
+    section_id: Optional[str] = None,
+    before_id: Optional[str] = None,
+    after_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Move a block next to an anchor sibling, optionally into another section
+    of the same page.
+
+    Responsibilities:
+    - serialize concurrent moves by locking the affected sections
+    - single-row placement in sparse ordering mode
+    - invariant enforcement on source and target sections
+    - audit logging
+
+    Returns whether the target section is running out of gaps and should be
+    rebalanced in the background.
+    """
+    if before_id and after_id:
+        raise ValueError("Provide either before_id or after_id, not both")
+
+    # 1️⃣ Fetch the block
+    block: Block | None = (
+        Block.query
+        .filter_by(id=block_id, tenant_id=tenant_id, deleted_at=None)
+        .first()
+    )
+
+    if not block:
+        raise ValueError("Block not found")
+
+    source_section_id = block.section_id
+    target_section_id = section_id or source_section_id
+
+    if block.id in (before_id, after_id):
+        raise ValueError("A block cannot be anchored to itself")
+
+    with transactional():
+        # 2️⃣ Lock source and target sections in id order (deadlock-safe)
+        sections = {
+            s.id: s
+            for s in db.session.execute(
+                select(Section)
+                .where(
+                    Section.id.in_({source_section_id, target_section_id}),
+                    Section.tenant_id == tenant_id,
+                    Section.deleted_at.is_(None),
+                )
+                .order_by(Section.id)
+                .with_for_update()
+            ).scalars()
+        }
+
+        if source_section_id not in sections or target_section_id not in sections:
+            raise ValueError("Section not found")
+
+        # Blocks stay on their page: page invariants/snapshots are per page
+        if sections[target_section_id].page_id != sections[source_section_id].page_id:
+            raise ValueError("Blocks can only be moved between sections of the same page")
+
+        # 3️⃣ Place the block between its new neighbours
+        needs_rebalance = move_row(
+            Block,
+            block,
+            parent_field="section_id",
+            parent_id=target_section_id,
+            before_id=before_id,
+            after_id=after_id,
+        )
+
+        # 4️⃣ Enforce invariants on every section touched
+        validate_scope(tenant_id=tenant_id, section_ids=sections.keys())
+
+        # 5️⃣ Audit logging
+        log_action(
+            action="block.move",
+            entity_type="block",
+            entity_id=block.id,
+            payload={
+                "from_section_id": source_section_id,
+                "to_section_id": target_section_id,
+                "before_id": before_id,
+                "after_id": after_id,
+            },
+        )
+
+    return {
+        "block_id": block.id,
+        "section_id": target_section_id,
+        "needs_rebalance": needs_rebalance,
+    }
+
+
+def rebalance_section_blocks(*, tenant_id: str, section_id: str) -> Dict[str, Any]:
+    """
+    Re-spread the block keys of a section ORDER_GAP apart, restoring room
+    for single-row moves. One UPDATE; relative order is unchanged.
+    """
+    with transactional():
+        section = (
+            Section.query
+            .filter_by(id=section_id, tenant_id=tenant_id)
+            .with_for_update()
+            .first()
+        )
+
+        if not section:
+            raise ValueError("Section not found")
+
+        compact_order(
+            Block.query.filter_by(section_id=section.id, tenant_id=tenant_id, deleted_at=None),
+            step=order_step(),
+        )
+
+        log_action(
+            action="block.rebalance",
+            entity_type="section",
+            entity_id=section.id,
+        )
+
+    return {"section_id": section_id}
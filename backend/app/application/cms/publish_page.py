@@ -6,7 +6,9 @@ from app.models.page import Page
 from app.models.page_version import PageVersion
 from app.utils.transaction import transactional
 from app.utils.versioning import snapshot_page, next_version
+from app.utils.snapshots import store_snapshot
 from app.utils.audit import log_action
+from app.utils.loading import page_tree_options
 from app.domain.invariants.page import assert_page
 from app.domain.lifecycle.page import assert_page_transition
 
@@ -31,6 +33,7 @@ def publish_page(
     page = (
         db.session.execute(
             select(Page)
+            .options(page_tree_options())
             .where(Page.id == page_id, Page.tenant_id == tenant_id)
             .with_for_update()
         )
@@ -56,12 +59,15 @@ def publish_page(
         version.tenant_id = tenant_id
         version.version = next_version(page.id, tenant_id)
         version.status = "published"
-        version.snapshot = snapshot_page(page)
+        store_snapshot(version, snapshot_page(page))
         version.created_by = actor_id
 
         db.session.add(version)
         db.session.flush()  # ensures version.version is available
 
+        # Public reads are served from this snapshot from now on
+        page.published_version_id = version.id
+
         # 6️⃣ Audit logging
         log_action(
             action="page.publish",
@@ -1,6 +1,5 @@
 # app/application/cms/rollback_page.py
-from typing import Dict, List
-from datetime import datetime, timezone
+from typing import Any, Dict, List, Set
 from app.extensions import db
 from app.models.page import Page
 from app.models.page_version import PageVersion
@@ -8,13 +7,14 @@ from app.models.section import Section
 from app.models.block import Block
 from app.utils.transaction import transactional
 from app.utils.versioning import snapshot_page, next_version
-from app.utils.order import compact_order
+from app.utils.snapshots import store_snapshot
 from app.utils.audit import log_action
+from app.utils.loading import page_tree_options
 from app.utils.media import delete_file
+from app.utils.order import defer_order_constraint
 from app.domain.invariants.page import assert_page
-from app.domain.invariants.section import assert_section
 from app.domain.lifecycle.page import assert_page_transition
-from sqlalchemy import select
+from sqlalchemy import func, select, update, insert
 
 
 def rollback_page(
@@ -28,9 +28,8 @@ def rollback_page(
     Roll back a page to a previous version.
 
     Responsibilities:
-    - Transactional snapshot restoration
-    - Cleanup deleted media
-    - Re-compact section & block ordering
+    - Transactional snapshot restoration (diff-apply, ids preserved)
+    - Cleanup media no longer referenced
     - Create new rollback version
     - Audit logging
     """
@@ -47,12 +46,13 @@ def rollback_page(
 
     snapshot = pv.snapshot
 
-    # 2️⃣ Fetch live Page with row-level lock
+    # 2️⃣ Fetch live Page (and its live tree) with row-level lock
     page: Page | None = (
         db.session.execute(
             select(Page)
+            .options(page_tree_options())
             .where(Page.id == page_id, Page.tenant_id == tenant_id)
-            .with_for_update()
+            .with_for_update(of=Page)
         )
         .scalar_one_or_none()
     )
@@ -63,70 +63,37 @@ def rollback_page(
     # Ensure lifecycle transition is valid
     assert_page_transition(from_status=page.status, to_status="draft")
     page.status = "draft"
-
-    media_to_cleanup: List[str] = []
+    page.published_version_id = None
 
     with transactional():
-        # 3️⃣ Soft-delete current sections & blocks
-        current_sections = (
-            Section.query
-            .filter_by(page_id=page.id, tenant_id=tenant_id, deleted_at=None)
-            .all()
+        # 3️⃣ Rewrite only the rows that differ from the snapshot
+        media_to_cleanup = apply_snapshot(page, snapshot, tenant_id=tenant_id)
+
+        # 4️⃣ Reload the restored tree in batched queries, then assert invariants
+        page = (
+            db.session.execute(
+                select(Page)
+                .options(page_tree_options())
+                .where(Page.id == page.id)
+                .execution_options(populate_existing=True)
+            )
+            .scalar_one()
         )
 
-        for section in current_sections:
-            for block in section.blocks:
-                if block.media_url:
-                    media_to_cleanup.append(block.media_url)
-                block.soft_delete()
-            section.soft_delete()
-
-        # 4️⃣ Restore sections & blocks from snapshot
-        for s_data in snapshot["sections"]:
-            section = Section()
-            section.tenant_id = tenant_id
-            section.page_id = page.id
-            section.type = s_data["type"]
-            section.order = s_data["order"]
-            section.settings = s_data["settings"]
-
-            db.session.add(section)
-            db.session.flush()  # Ensure section.id
-
-            for b_data in s_data["blocks"]:
-                block = Block()
-                block.tenant_id = tenant_id
-                block.section_id = section.id
-                block.type = b_data["type"]
-                block.order = b_data["order"]
-                block.content = b_data["content"]
-                block.media_url = b_data.get("media_url")
-
-                db.session.add(block)
-
-        # 5️⃣ Normalize ordering
-        sections = Section.query.filter_by(page_id=page.id, tenant_id=tenant_id, deleted_at=None)
-        compact_order(sections)
-
-        for section in sections:
-            blocks_query = Block.query.filter_by(section_id=section.id, tenant_id=tenant_id, deleted_at=None)
-            compact_order(blocks_query)
-
-        # 6️⃣ Assert invariants
         assert_page(page)
 
-        # 7️⃣ Create rollback PageVersion
+        # 5️⃣ Create rollback PageVersion
         new_version = PageVersion()
         new_version.page_id = page.id
         new_version.tenant_id = tenant_id
         new_version.version = next_version(page.id, tenant_id)
         new_version.status = "rollback"
-        new_version.snapshot = snapshot_page(page)
+        store_snapshot(new_version, snapshot_page(page))
         new_version.created_by = actor_id
 
         db.session.add(new_version)
 
-        # 8️⃣ Audit logging
+        # 6️⃣ Audit logging
         log_action(
             action="page.rollback",
             entity_type="page",
@@ -137,7 +104,7 @@ def rollback_page(
             }
         )
 
-    # 9️⃣ Cleanup media outside transaction
+    # 7️⃣ Cleanup media outside transaction
     for media_url in media_to_cleanup:
         delete_file(media_url)
 
@@ -145,3 +112,162 @@ def rollback_page(
         "page_id": page.id,
         "new_version": new_version.version
     }
+
+
+def apply_snapshot(page: Page, snapshot: Dict[str, Any], *, tenant_id: str) -> List[str]:
+    """
+    Make the live tree of `page` match `snapshot` with batched statements.
+
+    Rows are matched by id: surviving rows keep their ids, tombstones named
+    by the snapshot are revived, unknown ids are inserted with the snapshot
+    id, and live rows absent from the snapshot are soft-deleted. Only rows
+    that actually differ are written.
+
+    Sibling-order constraints are deferred to COMMIT, so rows can be moved
+    straight to their final slot in any statement order.
+
+    Expects `page` loaded with page_tree_options(). Returns media URLs that
+    are no longer referenced by the restored tree.
+    """
+    live_sections: Dict[str, Section] = {s.id: s for s in page.sections}
+    live_blocks: Dict[str, Block] = {b.id: b for s in page.sections for b in s.blocks}
+
+    target_sections = {s["id"]: s for s in snapshot["sections"]}
+    target_blocks = {b["id"]: (s["id"], b) for s in snapshot["sections"] for b in s["blocks"]}
+
+    # Tombstones of this page the snapshot brings back
+    revived_sections: Set[str] = set(
+        db.session.scalars(
+            select(Section.id).where(
+                Section.id.in_(list(target_sections.keys() - live_sections.keys())),
+                Section.page_id == page.id,
+                Section.tenant_id == tenant_id,
+            )
+        )
+    )
+    revived_blocks: Set[str] = set(
+        db.session.scalars(
+            select(Block.id)
+            .join(Section, Section.id == Block.section_id)
+            .where(
+                Block.id.in_(list(target_blocks.keys() - live_blocks.keys())),
+                Section.page_id == page.id,
+                Block.tenant_id == tenant_id,
+            )
+        )
+    )
+
+    # -------------------------------
+    # Soft-delete rows not in the snapshot
+    # -------------------------------
+    removed_blocks = [b for bid, b in live_blocks.items() if bid not in target_blocks]
+    removed_sections = [sid for sid in live_sections if sid not in target_sections]
+
+    if removed_blocks:
+        db.session.execute(
+            update(Block)
+            .where(Block.id.in_([b.id for b in removed_blocks]))
+            .values(deleted_at=func.now(), order=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    if removed_sections:
+        db.session.execute(
+            update(Section)
+            .where(Section.id.in_(removed_sections))
+            .values(deleted_at=func.now(), order=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    # -------------------------------
+    # Rows changing slot (checked at COMMIT)
+    # -------------------------------
+    defer_order_constraint(Section)
+    defer_order_constraint(Block)
+
+    moved_section_ids = {
+        sid for sid, s in live_sections.items()
+        if sid in target_sections and s.order != target_sections[sid]["order"]
+    }
+    moved_block_ids = {
+        bid for bid, b in live_blocks.items()
+        if bid in target_blocks
+        and (b.section_id, b.order) != (target_blocks[bid][0], target_blocks[bid][1]["order"])
+    }
+
+    # -------------------------------
+    # Sections: update/revive, then insert
+    # -------------------------------
+    section_updates = []
+    section_inserts = []
+    for sid, s_data in target_sections.items():
+        values = {
+            "id": sid,
+            "page_id": page.id,
+            "type": s_data["type"],
+            "order": s_data["order"],
+            "settings": s_data["settings"],
+            "deleted_at": None,
+        }
+
+        if sid in live_sections:
+            live = live_sections[sid]
+            if sid in moved_section_ids or (live.type, live.settings) != (s_data["type"], s_data["settings"]):
+                section_updates.append(values)
+        elif sid in revived_sections:
+            section_updates.append(values)
+        else:
+            section_inserts.append({**values, "tenant_id": tenant_id})
+
+    if section_updates:
+        db.session.execute(update(Section), section_updates)
+
+    if section_inserts:
+        db.session.execute(insert(Section), section_inserts)
+
+    # -------------------------------
+    # Blocks: update/revive, then insert
+    # -------------------------------
+    block_updates = []
+    block_inserts = []
+    for bid, (sid, b_data) in target_blocks.items():
+        values = {
+            "id": bid,
+            "section_id": sid,
+            "type": b_data["type"],
+            "order": b_data["order"],
+            "content": b_data["content"],
+            "media_url": b_data.get("media_url"),
+            "deleted_at": None,
+        }
+
+        if bid in live_blocks:
+            live = live_blocks[bid]
+            if bid in moved_block_ids or (live.type, live.content, live.media_url) != (
+                b_data["type"], b_data["content"], b_data.get("media_url")
+            ):
+                block_updates.append(values)
+        elif bid in revived_blocks:
+            block_updates.append(values)
+        else:
+            block_inserts.append({**values, "tenant_id": tenant_id})
+
+    if block_updates:
+        db.session.execute(update(Block), block_updates)
+
+    if block_inserts:
+        db.session.execute(insert(Block), block_inserts)
+
+    # -------------------------------
+    # Media no longer referenced by the restored tree
+    # -------------------------------
+    kept_media = {b.get("media_url") for _, b in target_blocks.values()}
+    replaced_media = [
+        b.media_url for bid, b in live_blocks.items()
+        if bid in target_blocks and b.media_url != target_blocks[bid][1].get("media_url")
+    ]
+
+    return [
+        url for url in [b.media_url for b in removed_blocks] + replaced_media
+        if url and url not in kept_media
+    ]
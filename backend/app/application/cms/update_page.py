@@ -1,7 +1,7 @@
 from typing import Any, Dict
 from app.extensions import db
 from app.models.page import Page
-from app.domain.invariants.page import assert_page
+from app.domain.invariants.aggregate import validate_scope
 from app.utils.audit import log_action
 from app.utils.transaction import transactional
 
@@ -48,7 +48,7 @@ def update_page(
         page.updated_by = actor_id
 
         # 🔒 Domain invariant enforcement
-        assert_page(page)
+        validate_scope(tenant_id=tenant_id, page_ids=[page.id])
 
         log_action(
             action="page.update",
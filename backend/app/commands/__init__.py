@@ -0,0 +1,15 @@
+# app/commands/__init__.py
+from .audit import audit_cli
+from .auth import auth_cli
+from .indexes import indexes_cli
+from .replica import replica_cli
+from .serialization import json_cli
+
+
+def register_commands(app) -> None:
+    """Attach maintenance CLI groups to `flask`."""
+    app.cli.add_command(audit_cli)
+    app.cli.add_command(auth_cli)
+    app.cli.add_command(indexes_cli)
+    app.cli.add_command(replica_cli)
+    app.cli.add_command(json_cli)
@@ -0,0 +1,43 @@
+# app/commands/audit.py
+import click
+from flask.cli import AppGroup
+from app.utils.audit_partitions import ensure_partitions, expired_partitions, archive_partition
+
+audit_cli = AppGroup("audit", help="Audit log partition maintenance.")
+
+
+@audit_cli.command("partitions")
+@click.option("--months-ahead", type=int, default=None, help="Months to premake beyond the current one.")
+def partitions(months_ahead):
+    """Create upcoming monthly partitions (idempotent; run daily from cron)."""
+    created = ensure_partitions(months_ahead)
+    click.echo(f"Created: {', '.join(created)}" if created else "All partitions present")
+
+
+@audit_cli.command("archive")
+@click.option("--retention-months", type=int, default=None, help="Months to keep attached.")
+@click.option("--archive-dir", default=None, help="Directory for .csv.gz archives.")
+@click.option("--dry-run", is_flag=True, help="Only list partitions that would be archived.")
+def archive(retention_months, archive_dir, dry_run):
+    """Detach expired partitions, archive them to gzip'd CSV and drop them."""
+    expired = expired_partitions(retention_months)
+
+    if not expired:
+        click.echo("Nothing to archive")
+        return
+
+    for name in expired:
+        if dry_run:
+            click.echo(f"Would archive {name}")
+            continue
+
+        result = archive_partition(name, archive_dir)
+        click.echo(f"Archived {result['partition']} ({result['rows']} rows) → {result['path']}")
+
+
+@audit_cli.command("maintain")
+@click.pass_context
+def maintain(ctx):
+    """Premake partitions, then apply retention."""
+    ctx.invoke(partitions)
+    ctx.invoke(archive)
@@ -0,0 +1,125 @@
+# app/commands/auth.py
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from app.utils.password_hasher import password_hasher
+
+auth_cli = AppGroup("auth", help="Authentication tooling.")
+
+LOGIN_PATH = "/api/v1/auth/login"
+PROBE_PATH = "/api/v1/health"
+
+
+@auth_cli.command("bench-login")
+@click.option("--tenant-id", required=True, help="Tenant of the benchmark user (X-Tenant-ID).")
+@click.option("--email", required=True)
+@click.option("--password", required=True)
+@click.option("--requests", "total", type=int, default=200, show_default=True, help="Login attempts.")
+@click.option("--concurrency", type=int, default=16, show_default=True, help="Concurrent clients.")
+@click.option("--url", default=None, help="Base URL of a running server (default: in-process test client).")
+@click.option("--json", "as_json", is_flag=True, help="Emit the report as JSON.")
+def bench_login(tenant_id, email, password, total, concurrency, url, as_json):
+    """
+    Login throughput under concurrent load.
+
+    Fires `--requests` logins from `--concurrency` clients while one probe
+    client keeps hitting /health, so the report shows both login
+    throughput/latency and how much the other requests on the same worker
+    suffer. Run once with PASSWORD_HASH_MODE=inline and once with pool to
+    compare; against gunicorn, pass --url.
+    """
+    send = _http_sender(url) if url else _client_sender(current_app.test_client())
+    headers = {"X-Tenant-ID": tenant_id, "Content-Type": "application/json"}
+    body = json.dumps({"email": email, "password": password}).encode()
+
+    def login(_):
+        started = time.perf_counter()
+        status = send("POST", LOGIN_PATH, headers, body)
+        return status, time.perf_counter() - started
+
+    # Background probe: latency of a cheap endpoint during the burst
+    probe_latencies = []
+    done = threading.Event()
+
+    def probe():
+        while not done.is_set():
+            started = time.perf_counter()
+            send("GET", PROBE_PATH, {}, None)
+            probe_latencies.append(time.perf_counter() - started)
+            time.sleep(0.01)
+
+    prober = threading.Thread(target=probe, daemon=True)
+    prober.start()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(login, range(total)))
+    elapsed = time.perf_counter() - started
+
+    done.set()
+    prober.join()
+
+    statuses = Counter(status for status, _ in results)
+    ok = [latency for status, latency in results if status == 200]
+
+    report = {
+        "mode": password_hasher.mode if not url else "remote",
+        "requests": total,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else None,
+        "successful_rps": round(len(ok) / elapsed, 1) if elapsed else None,
+        "statuses": dict(sorted(statuses.items())),
+        "login_ms": _percentiles(ok),
+        "probe_ms": _percentiles(probe_latencies),
+        "hasher": password_hasher.stats() if not url else None,
+    }
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    click.echo(
+        f"{report['requests']} logins x{report['concurrency']} in {report['elapsed_s']} s "
+        f"({report['throughput_rps']} req/s, {report['successful_rps']} ok/s) [{report['mode']}]"
+    )
+    click.echo(f"  statuses: {report['statuses']}")
+    click.echo(f"  login  ms: {report['login_ms']}")
+    click.echo(f"  health ms: {report['probe_ms']}")
+
+
+def _client_sender(client):
+    def send(method, path, headers, body):
+        return client.open(path, method=method, headers=headers, data=body).status_code
+    return send
+
+
+def _http_sender(base_url):
+    def send(method, path, headers, body):
+        request = urllib.request.Request(base_url.rstrip("/") + path, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+    return send
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "p50": round(statistics.median(ms), 1),
+        "p95": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 1),
+        "max": round(ms[-1], 1),
+    }
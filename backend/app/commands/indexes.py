@@ -0,0 +1,74 @@
+# app/commands/indexes.py
+import json
+import click
+from flask.cli import AppGroup
+from app.utils.index_advisor import run_advisor
+
+indexes_cli = AppGroup("indexes", help="Index diagnostics.")
+
+
+@indexes_cli.command("advise")
+@click.option("--tenant-id", default=None, help="Tenant whose data parameterizes the queries (default: largest).")
+@click.option("--no-analyze", is_flag=True, help="Plain EXPLAIN; do not execute the queries.")
+@click.option("--min-rows", type=int, default=1000, show_default=True, help="Ignore seq scans on smaller tables.")
+@click.option("--json", "as_json", is_flag=True, help="Emit the full report as JSON.")
+@click.option("--strict", is_flag=True, help="Exit 1 on seq scans or duplicate indexes (for CI).")
+def advise(tenant_id, no_analyze, min_rows, as_json, strict):
+    """
+    EXPLAIN every endpoint's canonical queries and flag index problems.
+
+    CI: migrate and seed a local Postgres, then `flask indexes advise --strict`.
+    """
+    try:
+        report = run_advisor(tenant_id=tenant_id, analyze=not no_analyze, min_rows=min_rows)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2, default=str))
+    else:
+        _print_report(report)
+
+    if strict and (report["seq_scans"] or report["duplicate_indexes"]):
+        raise SystemExit(1)
+
+
+def _print_report(report):
+    click.echo(f"Tenant {report['tenant_id']}\n")
+
+    click.echo("Queries")
+    for q in report["queries"]:
+        if q["skipped"]:
+            click.echo(f"  - {q['name']}: skipped ({q['skipped']})")
+            continue
+
+        marker = "SEQ" if q["seq_scans"] else "ok "
+        click.echo(
+            f"  {marker} {q['name']}: {q['total_ms']:.2f} ms, "
+            f"buffers hit={q['shared_hit']} read={q['shared_read']}, "
+            f"indexes={', '.join(sorted(set(q['indexes']))) or '-'}"
+        )
+
+    click.echo("\nSequential scans")
+    for scan in report["seq_scans"] or [None]:
+        if scan is None:
+            click.echo("  none")
+            break
+        click.echo(f"  {scan['query']}: {scan['relation']} (~{scan['table_rows']} rows) filter={scan['filter']}")
+
+    click.echo("\nDuplicate / redundant indexes")
+    for dup in report["duplicate_indexes"] or [None]:
+        if dup is None:
+            click.echo("  none")
+            break
+        click.echo(
+            f"  {dup['table']}.{dup['index']} {dup['columns']} is a {dup['kind']} of "
+            f"{dup['covered_by']} {dup['covered_columns']}"
+        )
+
+    click.echo("\nIndexes unused by canonical queries")
+    for ix in report["unused_indexes"] or [None]:
+        if ix is None:
+            click.echo("  none")
+            break
+        click.echo(f"  {ix['table']}.{ix['index']} {ix['columns']} (idx_scan={ix['idx_scan']})")
@@ -0,0 +1,37 @@
+# app/commands/replica.py
+import click
+from flask.cli import AppGroup
+from sqlalchemy import text
+from app.extensions import db
+from app.utils.read_replica import REPLICA_BIND, parse_lsn
+
+replica_cli = AppGroup("replica", help="Read replica diagnostics.")
+
+
+@replica_cli.command("status")
+def status():
+    """
+    Compare the primary's WAL position with the replica's replay position.
+
+    Local check: `docker compose --profile replica up`, point
+    REPLICA_DATABASE_URL at db_replica, write something, then run this.
+    """
+    replica = db.engines.get(REPLICA_BIND)
+    if replica is None:
+        raise click.ClickException("No replica configured (REPLICA_DATABASE_URL)")
+
+    with db.engine.connect() as conn:
+        primary_lsn = conn.execute(text("SELECT pg_current_wal_lsn()::text")).scalar()
+
+    with replica.connect() as conn:
+        in_recovery, replay_lsn, replayed_at = conn.execute(
+            text("SELECT pg_is_in_recovery(), pg_last_wal_replay_lsn()::text, pg_last_xact_replay_timestamp()")
+        ).one()
+
+    if not in_recovery:
+        raise click.ClickException("Replica is not in recovery; it is not a standby")
+
+    lag = parse_lsn(primary_lsn) - (parse_lsn(replay_lsn) or 0)
+    click.echo(f"primary  {primary_lsn}")
+    click.echo(f"replica  {replay_lsn} (last replayed transaction at {replayed_at})")
+    click.echo(f"lag      {max(lag, 0)} bytes")
@@ -0,0 +1,121 @@
+# app/commands/serialization.py
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from app.utils.json_provider import OrjsonProvider, StdlibJSONProvider, orjson
+
+json_cli = AppGroup("json", help="JSON serialization tooling.")
+
+
+@json_cli.command("bench")
+@click.option("--sections", type=int, default=40, show_default=True, help="Sections in the page.")
+@click.option("--blocks", type=int, default=25, show_default=True, help="Blocks per section.")
+@click.option("--iterations", type=int, default=200, show_default=True, help="Timed runs per provider.")
+@click.option("--json", "as_json", is_flag=True, help="Emit the report as JSON.")
+def bench(sections, blocks, iterations, as_json):
+    """
+    Compare OrjsonProvider with StdlibJSONProvider on one large page.
+
+    The payload has the admin page shape (datetimes included, so the
+    stdlib `default` hook is exercised). Each provider builds the full
+    response (`provider.response`, what jsonify calls) `--iterations`
+    times; bodies are checked to decode to the same document first.
+    """
+    payload = _page_payload(sections, blocks)
+
+    providers = {"stdlib": StdlibJSONProvider(current_app)}
+    if orjson is not None:
+        providers["orjson"] = OrjsonProvider(current_app)
+    else:
+        click.echo("orjson is not installed; timing the stdlib provider only", err=True)
+
+    bodies = {name: provider.response(payload).get_data() for name, provider in providers.items()}
+    documents = [json.loads(body) for body in bodies.values()]
+    if any(document != documents[0] for document in documents):
+        raise click.ClickException("Providers produced different documents")
+
+    report = {
+        "sections": sections,
+        "blocks": sections * blocks,
+        "iterations": iterations,
+        "providers": {},
+    }
+
+    for name, provider in providers.items():
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            provider.response(payload).get_data()
+            samples.append(time.perf_counter() - started)
+
+        ms = sorted(s * 1000 for s in samples)
+        report["providers"][name] = {
+            "bytes": len(bodies[name]),
+            "p50_ms": round(statistics.median(ms), 3),
+            "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+            "min_ms": round(ms[0], 3),
+            "mb_per_s": round(len(bodies[name]) / statistics.median(samples) / 1e6, 1),
+        }
+
+    results = report["providers"]
+    if "orjson" in results:
+        report["speedup"] = round(results["stdlib"]["p50_ms"] / results["orjson"]["p50_ms"], 1)
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    click.echo(
+        f"page with {report['sections']} sections / {report['blocks']} blocks, "
+        f"{report['iterations']} runs each"
+    )
+    for name, result in results.items():
+        click.echo(
+            f"  {name:<7} {result['bytes']:>9} B  p50 {result['p50_ms']} ms  "
+            f"p95 {result['p95_ms']} ms  ({result['mb_per_s']} MB/s)"
+        )
+    if "speedup" in report:
+        click.echo(f"  orjson is {report['speedup']}x faster at p50")
+
+
+def _page_payload(sections, blocks):
+    """Synthetic admin-shaped page: normalize_page plus block timestamps."""
+    now = datetime.now(timezone.utc)
+
+    return {
+        "id": str(uuid.uuid4()),
+        "title": "Benchmark page",
+        "slug": "benchmark-page",
+        "status": "published",
+        "seo": {"title": "Benchmark page", "description": "Serialization benchmark " * 4},
+        "sections": [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "content",
+                "order": i,
+                "settings": {"background": "#ffffff", "columns": 3, "full_width": False},
+                "blocks": [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "type": "text",
+                        "order": j,
+                        "content": {
+                            "text": f"Section {i}, block {j}. " + "Lorem ipsum dolor sit amet. " * 6,
+                            "align": "left",
+                            "tags": ["news", "featured", "hero"],
+                        },
+                        "media_url": f"https://cdn.example.com/media/{i}/{j}.webp",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for j in range(1, blocks + 1)
+                ],
+            }
+            for i in range(1, sections + 1)
+        ],
+    }
@@ -7,6 +7,86 @@ class BaseConfig:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Per-worker tenant resolution cache (seconds / entries)
+    TENANT_CACHE_TTL = int(os.getenv("TENANT_CACHE_TTL", 60))
+    TENANT_CACHE_MAX_SIZE = int(os.getenv("TENANT_CACHE_MAX_SIZE", 1024))
+
+    # Per-worker auth context cache, keyed by (user id, token iat)
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 60))
+    USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", 2048))
+
+    # Rendered public page cache: "memory" (per worker) or "redis" (shared)
+    PAGE_CACHE_BACKEND = os.getenv("PAGE_CACHE_BACKEND", "memory")
+    PAGE_CACHE_TTL = int(os.getenv("PAGE_CACHE_TTL", 300))
+    PAGE_CACHE_MAX_SIZE = int(os.getenv("PAGE_CACHE_MAX_SIZE", 512))
+    PAGE_CACHE_REDIS_URL = os.getenv("PAGE_CACHE_REDIS_URL")
+
+    # Response serializer: "orjson" (falls back to stdlib if missing) or "stdlib"
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "orjson")
+
+    # Pages locked, versioned and committed together by bulk publish
+    BULK_PUBLISH_CHUNK_SIZE = int(os.getenv("BULK_PUBLISH_CHUNK_SIZE", 100))
+
+    # PageVersion snapshots: "delta" (keyframe every N versions) or "full"
+    SNAPSHOT_STORAGE = os.getenv("SNAPSHOT_STORAGE", "delta")
+    SNAPSHOT_KEYFRAME_INTERVAL = int(os.getenv("SNAPSHOT_KEYFRAME_INTERVAL", 10))
+    SNAPSHOT_CACHE_MAX_SIZE = int(os.getenv("SNAPSHOT_CACHE_MAX_SIZE", 256))
+
+    # Sibling ordering: "dense" (1..N, renumbered on every change) or
+    # "sparse" (keys ORDER_GAP apart, moves write one row)
+    ORDERING_MODE = os.getenv("ORDERING_MODE", "dense")
+    ORDER_GAP = int(os.getenv("ORDER_GAP", 1024))
+    ORDER_REBALANCE_GAP = int(os.getenv("ORDER_REBALANCE_GAP", 4))
+
+    # Invariant checks on edits: "sql" (per-parent aggregates) or "memory"
+    INVARIANT_VALIDATION = os.getenv("INVARIANT_VALIDATION", "sql")
+
+    # Audit writes: "sync", "batched" (one INSERT at commit) or "async"
+    # (background writer; not atomic) - see app/utils/audit_sink.py
+    AUDIT_WRITE_MODE = os.getenv("AUDIT_WRITE_MODE", "batched")
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", 500))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", 1.0))
+    AUDIT_QUEUE_MAX_SIZE = int(os.getenv("AUDIT_QUEUE_MAX_SIZE", 10000))
+
+    # audit_logs partitions: `flask audit maintain` premakes and archives
+    AUDIT_PARTITION_PREMAKE_MONTHS = int(os.getenv("AUDIT_PARTITION_PREMAKE_MONTHS", 3))
+    AUDIT_RETENTION_MONTHS = int(os.getenv("AUDIT_RETENTION_MONTHS", 12))
+    AUDIT_ARCHIVE_DIR = os.getenv("AUDIT_ARCHIVE_DIR", "archive/audit_logs")
+
+    # Rows per server-side cursor fetch for /audit/audit_logs/export
+    AUDIT_EXPORT_CHUNK_SIZE = int(os.getenv("AUDIT_EXPORT_CHUNK_SIZE", 1000))
+
+    # Password KDF: "inline" (request thread) or "pool" (per-worker process
+    # pool, 503 past WORKERS + QUEUE_SIZE in flight; production default).
+    # Hashes made with any other METHOD are upgraded on the next successful login.
+    PASSWORD_HASH_MODE = os.getenv("PASSWORD_HASH_MODE", "inline")
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", 8))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 5.0))
+
+    # Per-request SQL metrics (Server-Timing header + log line); requests
+    # with at least SQL_SLOW_DB_MS of DB time log at WARNING. Enforced
+    # budgets turn @query_budget overruns into errors (tests/CI).
+    SQL_INSTRUMENTATION = os.getenv("SQL_INSTRUMENTATION", "true").lower() == "true"
+    SQL_SERVER_TIMING = os.getenv("SQL_SERVER_TIMING", "true").lower() == "true"
+    SQL_SLOW_DB_MS = float(os.getenv("SQL_SLOW_DB_MS", 200))
+    SQL_QUERY_BUDGET_ENFORCE = os.getenv("SQL_QUERY_BUDGET_ENFORCE", "false").lower() == "true"
+
+    # Optional streaming replica for @replica_reads GETs; clients echo the
+    # X-Consistency-Token (primary WAL LSN) to read their own writes
+    REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+    SQLALCHEMY_BINDS = {"replica": REPLICA_DATABASE_URL} if REPLICA_DATABASE_URL else {}
+    REPLICA_LSN_CACHE_SECONDS = float(os.getenv("REPLICA_LSN_CACHE_SECONDS", 0.1))
+
+    # Background jobs: `flask jobs worker`, or an in-process pool started by
+    # the server entry point (run.py / wsgi.py), never by CLI commands
+    JOBS_IN_PROCESS_WORKER = os.getenv("JOBS_IN_PROCESS_WORKER", "false").lower() == "true"
+    JOBS_CONCURRENCY = int(os.getenv("JOBS_CONCURRENCY", 2))
+    JOBS_POLL_INTERVAL = float(os.getenv("JOBS_POLL_INTERVAL", 1.0))
+    # Running jobs not heartbeated for this long are reclaimed by other workers
+    JOBS_LEASE_SECONDS = float(os.getenv("JOBS_LEASE_SECONDS", 60))
+
 class DevelopmentConfig(BaseConfig):
     UPLOAD_FOLDER = 'uploads'
     DEBUG = True
@@ -15,8 +95,16 @@ class DevelopmentConfig(BaseConfig):
 class ProductionConfig(BaseConfig):
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
+    PASSWORD_HASH_MODE = os.getenv("PASSWORD_HASH_MODE", "pool")
+
+class TestingConfig(BaseConfig):
+    # Integration tests run against a real, disposable Postgres database
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.getenv("TEST_DATABASE_URL")
+    SQL_QUERY_BUDGET_ENFORCE = True
 
 config_by_name = {
     "development": DevelopmentConfig,
-    "production": ProductionConfig
+    "production": ProductionConfig,
+    "testing": TestingConfig,
 }
\ No newline at end of file
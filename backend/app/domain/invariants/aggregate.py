@@ -0,0 +1,142 @@
+# app/domain/invariants/aggregate.py
+from typing import Iterable
+from flask import current_app
+from sqlalchemy import select, func, and_, distinct
+from app.extensions import db
+from app.models.page import Page
+from app.models.section import Section
+from app.models.block import Block
+from .exceptions import InvariantViolation
+from .order import assert_order_stats
+from .block import MEDIA_BLOCK_TYPES
+from .page import assert_page
+from .section import assert_section
+
+
+def validate_scope(
+    *,
+    tenant_id: str,
+    section_ids: Iterable[str] = (),
+    page_ids: Iterable[str] = (),
+    publish: bool = False,
+) -> None:
+    """
+    Enforce invariants for the parents changed in the current unit of work.
+
+    - section_ids: sections whose blocks were added, removed, moved or edited
+    - page_ids: pages whose sections were added, removed or reordered
+
+    INVARIANT_VALIDATION="sql" (default) checks per-parent aggregates without
+    loading trees. "memory" loads the parents and runs assert_section /
+    assert_page, the reference implementation.
+    """
+    section_ids = {sid for sid in section_ids if sid}
+    page_ids = {pid for pid in page_ids if pid}
+
+    db.session.flush()
+
+    if current_app.config.get("INVARIANT_VALIDATION", "sql") == "memory":
+        sections = Section.query.filter(
+            Section.id.in_(section_ids),
+            Section.tenant_id == tenant_id,
+            Section.deleted_at.is_(None),
+        )
+        for section in sections:
+            assert_section(section)
+        for page in Page.query.filter(Page.id.in_(page_ids), Page.tenant_id == tenant_id):
+            assert_page(page, publish=publish)
+        return
+
+    if section_ids:
+        assert_sections_sql(section_ids, tenant_id=tenant_id)
+    if page_ids:
+        assert_pages_sql(page_ids, tenant_id=tenant_id, publish=publish)
+
+
+def assert_sections_sql(section_ids: Iterable[str], *, tenant_id: str) -> None:
+    """
+    assert_section for many sections in one grouped query over live blocks:
+    non-empty, order keys, and media_url rules via conditional counts.
+    """
+    is_media = Block.type.in_(MEDIA_BLOCK_TYPES)
+    # Same truthiness as assert_block_media: NULL and "" both mean "no media"
+    has_media = func.coalesce(Block.media_url, "") != ""
+
+    rows = db.session.execute(
+        select(
+            Section.id,
+            func.count(Block.id).label("count"),
+            func.count(Block.order).label("ordered"),
+            func.count(distinct(Block.order)).label("distinct"),
+            func.min(Block.order).label("low"),
+            func.max(Block.order).label("high"),
+            func.count(Block.id).filter(and_(is_media, ~has_media)).label("missing_media"),
+            func.count(Block.id).filter(and_(~is_media, has_media)).label("stray_media"),
+        )
+        .select_from(Section)
+        .outerjoin(Block, and_(Block.section_id == Section.id, Block.deleted_at.is_(None)))
+        .where(
+            Section.id.in_(list(section_ids)),
+            Section.tenant_id == tenant_id,
+            Section.deleted_at.is_(None),
+        )
+        .group_by(Section.id)
+    )
+
+    for row in rows:
+        if not row.count:
+            raise InvariantViolation("Section must contain at least one block.")
+
+        assert_order_stats(
+            count=row.count,
+            ordered=row.ordered,
+            distinct=row.distinct,
+            low=row.low,
+            high=row.high,
+            label="Block",
+            parent_id=row.id,
+        )
+
+        if row.missing_media:
+            raise InvariantViolation(
+                f"{row.missing_media} media block(s) in section {row.id} must have media_url set."
+            )
+        if row.stray_media:
+            raise InvariantViolation(
+                f"{row.stray_media} non-media block(s) in section {row.id} should not have media_url set."
+            )
+
+
+def assert_pages_sql(page_ids: Iterable[str], *, tenant_id: str, publish: bool = False) -> None:
+    """
+    Page-level part of assert_page (section order, non-empty on publish) in
+    one grouped query. Sections are only checked when listed in the scope.
+    """
+    rows = db.session.execute(
+        select(
+            Page.id,
+            func.count(Section.id).label("count"),
+            func.count(Section.order).label("ordered"),
+            func.count(distinct(Section.order)).label("distinct"),
+            func.min(Section.order).label("low"),
+            func.max(Section.order).label("high"),
+        )
+        .select_from(Page)
+        .outerjoin(Section, and_(Section.page_id == Page.id, Section.deleted_at.is_(None)))
+        .where(Page.id.in_(list(page_ids)), Page.tenant_id == tenant_id)
+        .group_by(Page.id)
+    )
+
+    for row in rows:
+        if publish and not row.count:
+            raise InvariantViolation("Cannot publish page without sections.")
+
+        assert_order_stats(
+            count=row.count,
+            ordered=row.ordered,
+            distinct=row.distinct,
+            low=row.low,
+            high=row.high,
+            label="Section",
+            parent_id=row.id,
+        )
@@ -1,18 +1,14 @@
 from .exceptions import InvariantViolation
+from .order import assert_sibling_order
+
+# Block types that must carry a media_url; every other type must not
+MEDIA_BLOCK_TYPES = ("image", "video")
 
 def assert_block_order(blocks):
-    orders = [block.order for block in blocks]
-    if not orders:
-        return
-    
-    expected = list(range(1, len(orders) + 1))
-    if sorted(orders) != expected:
-        raise InvariantViolation(
-            f"Block orders are not consecutive starting from 1: {orders}"
-        )
+    assert_sibling_order([block.order for block in blocks], "Block")
     
 def assert_block_media(block):
-    if block.type in ("image", "video"):
+    if block.type in MEDIA_BLOCK_TYPES:
         if not block.media_url:
             raise InvariantViolation(
                 f"{block.type} block must have media_url set."
@@ -0,0 +1,48 @@
+from flask import current_app, has_app_context
+from .exceptions import InvariantViolation
+
+def _sparse():
+    return has_app_context() and current_app.config.get("ORDERING_MODE", "dense") == "sparse"
+
+
+def assert_sibling_order(orders, label):
+    """
+    Dense ordering: keys are exactly 1..N.
+    Sparse ordering (ORDERING_MODE="sparse"): keys are distinct and positive;
+    gaps are expected and the public 1..N order is derived at read time.
+    """
+    if not orders:
+        return
+
+    if _sparse():
+        if None in orders or min(orders) < 1 or len(set(orders)) != len(orders):
+            raise InvariantViolation(
+                f"{label} orders must be distinct positive keys: {orders}"
+            )
+        return
+
+    expected = list(range(1, len(orders) + 1))
+    if sorted(orders) != expected:
+        raise InvariantViolation(
+            f"{label} orders are not consecutive starting from 1: {orders}"
+        )
+
+
+def assert_order_stats(*, count, ordered, distinct, low, high, label, parent_id):
+    """
+    Same rule as assert_sibling_order, decided from per-parent aggregates:
+    COUNT(*), COUNT(order), COUNT(DISTINCT order), MIN(order), MAX(order).
+    """
+    if not count:
+        return
+
+    valid = ordered == count and distinct == count and low >= 1
+    if not _sparse():
+        valid = valid and low == 1 and high == count
+
+    if not valid:
+        raise InvariantViolation(
+            f"{label} orders of {parent_id} are not "
+            + ("distinct positive keys" if _sparse() else "consecutive starting from 1")
+            + f" (count={count}, distinct={distinct}, min={low}, max={high})"
+        )
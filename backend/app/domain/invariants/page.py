@@ -1,5 +1,6 @@
 from .section import assert_section
 from .exceptions import InvariantViolation
+from .order import assert_sibling_order
 
 def assert_page(page, publish=False):
     sections = page.sections
@@ -7,13 +8,7 @@ def assert_page(page, publish=False):
     if publish and not sections:
         raise InvariantViolation("Cannot publish page without sections.")
     
-    orders = [section.order for section in sections]
-    expected = list(range(1, len(orders) + 1))
-
-    if sorted(orders) != expected:
-        raise InvariantViolation(
-            f"Section orders are not consecutive starting from 1: {orders}"
-        )
+    assert_sibling_order([section.order for section in sections], "Section")
     
     for section in sections:
         assert_section(section)
\ No newline at end of file
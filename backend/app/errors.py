@@ -1,5 +1,8 @@
 from flask import jsonify
+from sqlalchemy.exc import DataError
+from app.extensions import db
 from app.domain.invariants.exceptions import InvariantViolation
+from app.utils.password_hasher import PasswordHasherBusy
 
 def register_error_handlers(app):
     @app.errorhandler(InvariantViolation)
@@ -9,4 +12,38 @@ def register_error_handlers(app):
             "message": str(error)
         })
         response.status_code = 400
+        return response
+
+    @app.errorhandler(ValueError)
+    def handle_value_error(error):
+        # Services reject bad input and missing rows with ValueError
+        db.session.rollback()
+        message = str(error)
+        not_found = message.lower().endswith("not found")
+        response = jsonify({
+            "error": "NotFound" if not_found else "InvalidRequest",
+            "message": message
+        })
+        response.status_code = 404 if not_found else 400
+        return response
+
+    @app.errorhandler(PasswordHasherBusy)
+    def handle_password_hasher_busy(error):
+        response = jsonify({
+            "error": "ServiceBusy",
+            "message": str(error)
+        })
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+        return response
+
+    @app.errorhandler(DataError)
+    def handle_data_error(error):
+        # e.g. a malformed UUID in the URL reaching a native uuid column
+        db.session.rollback()
+        response = jsonify({
+            "error": "InvalidInput",
+            "message": "Malformed identifier or value"
+        })
+        response.status_code = 400
         return response
\ No newline at end of file
@@ -0,0 +1,38 @@
+# app/jobs/__init__.py
+from typing import Optional
+from .context import JobContext, JobCancelled
+from .registry import job_handler
+from .queue import enqueue_job, request_cancel
+from .runner import JobRunner
+from . import handlers  # noqa: F401  (registers CMS job handlers)
+
+
+def init_jobs(app) -> None:
+    """Register the `flask jobs` CLI. Workers are started by entry points."""
+    from .cli import jobs_cli
+
+    app.cli.add_command(jobs_cli)
+
+
+def start_job_runner(app) -> Optional[JobRunner]:
+    """
+    Start an in-process worker pool if JOBS_IN_PROCESS_WORKER is set.
+
+    Called by the server entry point only, never from create_app: every
+    `flask` CLI command builds an app too, and must not start polling.
+    """
+    if not app.config.get("JOBS_IN_PROCESS_WORKER"):
+        return None
+
+    if "job_runner" in app.extensions:
+        return app.extensions["job_runner"]
+
+    runner = JobRunner(
+        app,
+        concurrency=app.config.get("JOBS_CONCURRENCY", 2),
+        poll_interval=app.config.get("JOBS_POLL_INTERVAL", 1.0),
+        lease_seconds=app.config.get("JOBS_LEASE_SECONDS", 60.0),
+    )
+    runner.start()
+    app.extensions["job_runner"] = runner
+    return runner
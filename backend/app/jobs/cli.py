@@ -0,0 +1,25 @@
+# app/jobs/cli.py
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from .runner import JobRunner
+
+jobs_cli = AppGroup("jobs", help="Background job commands.")
+
+
+@jobs_cli.command("worker")
+@click.option("--concurrency", type=int, default=None, help="Worker threads.")
+@click.option("--poll-interval", type=float, default=None, help="Seconds between polls when idle.")
+def worker(concurrency, poll_interval):
+    """Run a standalone job worker until interrupted."""
+    app = current_app._get_current_object()
+
+    runner = JobRunner(
+        app,
+        concurrency=concurrency or app.config.get("JOBS_CONCURRENCY", 2),
+        poll_interval=poll_interval or app.config.get("JOBS_POLL_INTERVAL", 1.0),
+        lease_seconds=app.config.get("JOBS_LEASE_SECONDS", 60.0),
+    )
+
+    click.echo(f"Job worker {runner.worker_id} started ({runner.concurrency} threads)")
+    runner.run_forever()
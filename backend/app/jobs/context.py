@@ -0,0 +1,51 @@
+# app/jobs/context.py
+from typing import Optional
+from sqlalchemy import select, update
+from app.extensions import db
+from app.models.job import Job
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when cancellation was requested."""
+    pass
+
+
+class JobContext:
+    """
+    Handle passed to job handlers for progress reporting and cancellation.
+
+    Progress and cancel flags go through their own short transactions on
+    the engine, so they are visible while the handler's work is still
+    uncommitted (and survive a handler rollback).
+    """
+
+    def __init__(self, job_id: str, tenant_id: str, actor_id: Optional[str]):
+        self.job_id = job_id
+        self.tenant_id = tenant_id
+        self.actor_id = actor_id
+
+    def progress(self, done: int, total: Optional[int] = None) -> None:
+        values = {"progress_done": done}
+        if total is not None:
+            values["progress_total"] = total
+
+        with db.engine.begin() as conn:
+            conn.execute(
+                update(Job.__table__)
+                .where(Job.__table__.c.id == self.job_id)
+                .values(**values)
+            )
+
+    def is_cancelled(self) -> bool:
+        with db.engine.connect() as conn:
+            return bool(
+                conn.execute(
+                    select(Job.__table__.c.cancel_requested)
+                    .where(Job.__table__.c.id == self.job_id)
+                ).scalar()
+            )
+
+    def check_cancelled(self) -> None:
+        """Call between chunks of work; aborts the job if cancelled."""
+        if self.is_cancelled():
+            raise JobCancelled()
@@ -0,0 +1,70 @@
+# app/jobs/handlers.py
+from typing import Any, Dict
+from app.application.cms.bulk_publish import bulk_publish_pages
+from app.application.cms.rollback_page import rollback_page
+from app.application.cms.delete_page import delete_page
+from app.application.cms.move_block import rebalance_section_blocks
+from .context import JobContext
+from .registry import job_handler
+
+
+@job_handler("cms.bulk_publish")
+def bulk_publish_job(ctx: JobContext, payload: Dict[str, Any]):
+    def on_chunk(done: int, total: int) -> None:
+        ctx.progress(done, total)
+        ctx.check_cancelled()
+
+    ctx.progress(0, len(payload["page_ids"]))
+
+    return bulk_publish_pages(
+        tenant_id=ctx.tenant_id,
+        page_ids=payload["page_ids"],
+        action=payload["action"],
+        actor_id=ctx.actor_id,
+        on_chunk=on_chunk,
+    )
+
+
+@job_handler("cms.rollback_page")
+def rollback_page_job(ctx: JobContext, payload: Dict[str, Any]):
+    ctx.progress(0, 1)
+    ctx.check_cancelled()
+
+    result = rollback_page(
+        tenant_id=ctx.tenant_id,
+        page_id=payload["page_id"],
+        rollback_version=payload["version"],
+        actor_id=ctx.actor_id,
+    )
+
+    ctx.progress(1)
+    return result
+
+
+@job_handler("cms.delete_page")
+def delete_page_job(ctx: JobContext, payload: Dict[str, Any]):
+    ctx.progress(0, 1)
+    ctx.check_cancelled()
+
+    delete_page(
+        tenant_id=ctx.tenant_id,
+        page_id=payload["page_id"],
+        actor_id=ctx.actor_id,
+    )
+
+    ctx.progress(1)
+    return {"page_id": payload["page_id"]}
+
+
+@job_handler("cms.rebalance_blocks")
+def rebalance_blocks_job(ctx: JobContext, payload: Dict[str, Any]):
+    ctx.progress(0, 1)
+    ctx.check_cancelled()
+
+    result = rebalance_section_blocks(
+        tenant_id=ctx.tenant_id,
+        section_id=payload["section_id"],
+    )
+
+    ctx.progress(1)
+    return result
@@ -0,0 +1,68 @@
+# app/jobs/queue.py
+from typing import Any, Dict, Optional
+from app.extensions import db
+from app.models.job import Job
+from app.utils.transaction import transactional
+from app.utils.audit import log_action
+from .registry import get_handler
+
+
+def enqueue_job(
+    *,
+    tenant_id: str,
+    job_type: str,
+    payload: Dict[str, Any],
+    actor_id: Optional[str],
+) -> Job:
+    """
+    Persist a queued job; any worker polling the jobs table picks it up.
+    """
+    get_handler(job_type)  # fail fast on unknown types
+
+    job = Job()
+    job.tenant_id = tenant_id
+    job.type = job_type
+    job.status = "queued"
+    job.payload = payload
+    job.created_by = actor_id
+
+    with transactional():
+        db.session.add(job)
+        db.session.flush()
+
+        log_action(
+            action="job.enqueue",
+            entity_type="job",
+            entity_id=job.id,
+            payload={"type": job_type},
+        )
+
+    return job
+
+
+def request_cancel(*, tenant_id: str, job_id: str) -> Job:
+    """
+    Flag a job for cancellation.
+
+    Queued jobs are cancelled immediately; running jobs stop at their next
+    check_cancelled() call.
+    """
+    job = Job.query.filter_by(id=job_id, tenant_id=tenant_id).with_for_update().first()
+    if not job:
+        raise ValueError("Job not found")
+
+    if job.is_finished:
+        return job
+
+    with transactional():
+        job.cancel_requested = True
+        if job.status == "queued":
+            job.status = "cancelled"
+
+        log_action(
+            action="job.cancel",
+            entity_type="job",
+            entity_id=job.id,
+        )
+
+    return job
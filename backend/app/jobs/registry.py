@@ -0,0 +1,22 @@
+# app/jobs/registry.py
+from typing import Any, Callable, Dict
+
+# job type → handler(ctx, payload) → JSON-serializable result
+JOB_HANDLERS: Dict[str, Callable[..., Any]] = {}
+
+
+def job_handler(job_type: str):
+    """Register a function as the handler for a job type."""
+    def decorator(fn):
+        if job_type in JOB_HANDLERS:
+            raise ValueError(f"Duplicate job handler: {job_type}")
+        JOB_HANDLERS[job_type] = fn
+        return fn
+    return decorator
+
+
+def get_handler(job_type: str) -> Callable[..., Any]:
+    try:
+        return JOB_HANDLERS[job_type]
+    except KeyError:
+        raise ValueError(f"Unknown job type: {job_type}")
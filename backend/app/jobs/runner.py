@@ -0,0 +1,214 @@
+# app/jobs/runner.py
+import logging
+import os
+import socket
+import threading
+from datetime import timedelta
+from typing import List, Optional
+from flask import g
+from sqlalchemy import and_, func, or_, select, update
+from app.extensions import db
+from app.models.job import Job
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.middleware.auth_context import AuthContext
+from app.middleware.tenant_middleware import TenantContext
+from .context import JobContext, JobCancelled
+from .registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+def claim_next_job(worker_id: str, lease_seconds: float = 60.0) -> Optional[str]:
+    """
+    Atomically claim the oldest queued job, or a running job whose lease
+    expired (its worker crashed or was killed).
+
+    FOR UPDATE SKIP LOCKED lets any number of worker threads/processes
+    poll the same table without handing out a job twice. The claimant
+    holds the job until locked_until and keeps extending it while the
+    handler runs (see Heartbeat); leases use the database clock.
+    """
+    job = (
+        db.session.execute(
+            select(Job)
+            .where(
+                or_(
+                    Job.status == "queued",
+                    and_(Job.status == "running", Job.locked_until < func.now()),
+                )
+            )
+            .order_by(Job.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        .scalar_one_or_none()
+    )
+
+    if not job:
+        db.session.rollback()
+        return None
+
+    if job.status == "running":
+        logger.warning("Reclaiming job %s from %s (lease expired)", job.id, job.worker_id)
+
+    job.status = "running"
+    job.worker_id = worker_id
+    job.started_at = func.now()
+    job.locked_until = func.now() + timedelta(seconds=lease_seconds)
+    job_id = job.id
+    db.session.commit()
+
+    return job_id
+
+
+class Heartbeat:
+    """
+    Extends a claimed job's lease every third of the lease while it runs.
+
+    Own thread and short transactions on the engine, like JobContext, so
+    it keeps beating during long handler transactions.
+    """
+
+    def __init__(self, engine, job_id: str, worker_id: str, lease_seconds: float):
+        self.engine = engine
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f"job-heartbeat-{job_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _beat(self) -> None:
+        jobs = Job.__table__
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(
+                        update(jobs)
+                        .where(jobs.c.id == self.job_id, jobs.c.worker_id == self.worker_id)
+                        .values(locked_until=func.now() + timedelta(seconds=self.lease_seconds))
+                    )
+            except Exception:
+                logger.warning("Heartbeat for job %s failed", self.job_id, exc_info=True)
+
+
+def run_job(job_id: str, worker_id: Optional[str] = None) -> None:
+    """
+    Execute a claimed job and record its outcome.
+
+    With `worker_id`, the outcome is only written if this worker still
+    owns the job (it was not reclaimed after a lost lease).
+    """
+    job = db.session.get(Job, job_id)
+    ctx = JobContext(job.id, job.tenant_id, job.created_by)
+
+    # Services audit through flask.g, exactly as in a request
+    tenant = db.session.get(Tenant, job.tenant_id)
+    g.current_tenant = TenantContext.from_tenant(tenant) if tenant else None
+    if job.created_by:
+        user = db.session.get(User, job.created_by)
+        g.current_user = AuthContext.from_user(user) if user else None
+
+    status, result, error = "succeeded", None, None
+    try:
+        result = get_handler(job.type)(ctx, job.payload or {})
+
+        # Handlers report per-item failures as a "failed" list
+        if isinstance(result, dict) and result.get("failed"):
+            status = "partial"
+    except JobCancelled:
+        db.session.rollback()
+        status = "cancelled"
+    except Exception as exc:
+        db.session.rollback()
+        logger.exception("Job %s (%s) failed", job_id, job.type)
+        status, error = "failed", str(exc)
+
+    job = db.session.get(Job, job_id, with_for_update=True, populate_existing=True)
+    if worker_id is not None and job.worker_id != worker_id:
+        logger.warning("Job %s was reclaimed by %s; dropping outcome %s", job_id, job.worker_id, status)
+        db.session.rollback()
+        return
+
+    job.status = status
+    job.result = result
+    job.error = error
+    job.finished_at = func.now()
+    job.locked_until = None
+    db.session.commit()
+
+
+class JobRunner:
+    """
+    Local worker pool polling the jobs table.
+
+    Runs inside the web process (JOBS_IN_PROCESS_WORKER) or standalone
+    through `flask jobs worker`.
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        concurrency: int = 2,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+    ):
+        self.app = app
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        for i in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._loop,
+                args=(f"{self.worker_id}:{i}",),
+                name=f"job-worker-{i}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def run_forever(self) -> None:
+        self.start()
+        try:
+            while not self._stop.wait(self.poll_interval):
+                pass
+        except KeyboardInterrupt:
+            self.stop()
+
+    def _loop(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            with self.app.app_context():
+                try:
+                    job_id = claim_next_job(worker_id, self.lease_seconds)
+                    if job_id:
+                        with Heartbeat(db.engine, job_id, worker_id, self.lease_seconds):
+                            run_job(job_id, worker_id)
+                except Exception:
+                    logger.exception("Job worker %s crashed while polling", worker_id)
+                    job_id = None
+                finally:
+                    db.session.remove()
+
+            if not job_id:
+                self._stop.wait(self.poll_interval)
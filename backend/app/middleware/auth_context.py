@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from flask import g, jsonify
+from sqlalchemy import event
+from app.extensions import db, jwt
+from app.models.user import User
+from app.utils.cache import TTLCache, MISSING
+
+# Per-worker cache: (user_id, token iat) → AuthContext (or None for "not found").
+# Keying on iat means a fresh login always re-reads the user row.
+user_cache = TTLCache(max_size=2048, ttl=60)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthContext:
+    """
+    Authenticated principal for one request, exposed as g.current_user.
+
+    Immutable and detached from the session, so it can be cached across
+    requests and shared by decorators, routes and services.
+    """
+    id: str
+    tenant_id: str
+    role: str
+    email: str
+    is_active: bool
+    issued_at: int = 0
+
+    @classmethod
+    def from_user(cls, user: User, issued_at: int = 0) -> "AuthContext":
+        return cls(
+            id=user.id,
+            tenant_id=user.tenant_id,
+            role=user.role,
+            email=user.email,
+            is_active=bool(user.is_active),
+            issued_at=issued_at,
+        )
+
+
+def load_auth_context(user_id: str, issued_at: int) -> AuthContext | None:
+    """Resolve the token's user, going to the database only on a cache miss."""
+    key = (user_id, issued_at)
+
+    context = user_cache.get(key)
+    if context is not MISSING:
+        return context
+
+    user = db.session.get(User, user_id)
+    context = AuthContext.from_user(user, issued_at) if user is not None else None
+
+    user_cache.set(key, context)
+    return context
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_user_cache(mapper, connection, target):
+    user_cache.invalidate_where(lambda key: key[0] == target.id)
+
+
+def auth_context(app):
+    user_cache.configure(
+        max_size=app.config.get("USER_CACHE_MAX_SIZE"),
+        ttl=app.config.get("USER_CACHE_TTL"),
+    )
+
+    # Runs once per request, right after jwt_required() verifies the token
+    @jwt.user_lookup_loader
+    def resolve_user(jwt_header, jwt_data):
+        context = load_auth_context(jwt_data["sub"], jwt_data.get("iat", 0))
+
+        if context is None or not context.is_active:
+            return None  # → user_lookup_error_loader
+
+        g.current_user = context
+        return context
+
+    @jwt.user_lookup_error_loader
+    def user_lookup_error(jwt_header, jwt_data):
+        return jsonify({"error": "User not found or disabled"}), 401
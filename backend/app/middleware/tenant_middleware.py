@@ -1,6 +1,12 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
 from flask import request, g, abort
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from app.models.tenant import Tenant
-from app.extensions import db
+from app.utils.cache import TTLCache, MISSING
+from app.utils.ids import parse_uuid
 
 # Routes that do NOT require tenant context
 EXEMPT_PATH_PREFIXES = (
@@ -10,7 +16,89 @@ EXEMPT_PATH_PREFIXES = (
     "/favicon.ico",
 )
 
+# Per-worker cache: canonical tenant id → TenantContext (or None for "not found")
+tenant_cache = TTLCache()
+
+
+@dataclass(frozen=True, slots=True)
+class TenantContext:
+    """
+    Read-only snapshot of a tenant row, exposed as g.current_tenant.
+
+    Not bound to any session, so commits never expire it and reading it
+    never issues SQL. `features` holds the enabled feature names (without
+    the enable_ prefix), with JSON overrides already applied.
+    """
+    id: str
+    slug: str
+    name: str
+    is_active: bool
+    features: frozenset[str]
+
+    @classmethod
+    def from_tenant(cls, tenant: Tenant) -> "TenantContext":
+        return cls(
+            id=tenant.id,
+            slug=tenant.slug,
+            name=tenant.name,
+            is_active=bool(tenant.is_active),
+            features=frozenset(tenant.enabled_features()),
+        )
+
+    def has_feature(self, feature_name: str) -> bool:
+        return feature_name in self.features
+
+
+def load_tenant(tenant_id):
+    """
+    Resolve an active tenant, going to the database only on a cache miss.
+
+    `tenant_id` must be canonical (see parse_uuid): invalidation drops
+    entries by the row's own id, so any other spelling would never expire.
+    """
+    context = tenant_cache.get(tenant_id)
+    if context is not MISSING:
+        return context
+
+    tenant = Tenant.query.filter_by(id=tenant_id, is_active=True).first()
+    context = TenantContext.from_tenant(tenant) if tenant is not None else None
+
+    tenant_cache.set(tenant_id, context)
+    return context
+
+
+# session.info key: tenant ids written in the current transaction
+INVALIDATE_KEY = "tenant_cache_invalidate"
+
+
+@event.listens_for(Tenant, "after_insert")
+@event.listens_for(Tenant, "after_update")
+@event.listens_for(Tenant, "after_delete")
+def mark_tenant_changed(mapper, connection, target):
+    # Dropping the entry at flush would let a concurrent request refill it
+    # with the pre-commit row; wait until the change is visible.
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(INVALIDATE_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_tenant_cache(session):
+    for tenant_id in session.info.pop(INVALIDATE_KEY, ()):
+        tenant_cache.invalidate(tenant_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_tenant_changes(session, previous_transaction):
+    session.info.pop(INVALIDATE_KEY, None)
+
+
 def tenant_middleware(app):
+    tenant_cache.configure(
+        max_size=app.config.get("TENANT_CACHE_MAX_SIZE"),
+        ttl=app.config.get("TENANT_CACHE_TTL"),
+    )
+
     @app.before_request
     def resolve_tenant():
         # ---------------------------------------------
@@ -20,13 +108,17 @@ def tenant_middleware(app):
             if request.path.startswith(prefix):
                 return  # allow through without tenant
 
-        tenant_id = request.headers.get("X-Tenant-ID")
-        if not tenant_id:
+        header = request.headers.get("X-Tenant-ID")
+        if not header:
             abort(400, description="X-Tenant-ID header is missing")
 
-        tenant = Tenant.query.filter_by(id=tenant_id, is_active=True).first()
+        tenant_id = parse_uuid(header)
+        if tenant_id is None:
+            abort(400, description="X-Tenant-ID is not a valid tenant id")
+
+        tenant = load_tenant(tenant_id)
 
         if not tenant:
             abort(404, description="Tenant not found")
 
-        g.current_tenant = tenant
\ No newline at end of file
+        g.current_tenant = tenant
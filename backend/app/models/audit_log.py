@@ -1,5 +1,6 @@
 # app/models/audit_log.py
 from app.extensions import db
+from app.utils.ids import uuid7
 from .base import BaseModel
 from .tenant_mixin import TenantMixin
 from sqlalchemy import event 
@@ -7,16 +8,45 @@ from sqlalchemy import event
 class AuditLog(BaseModel, TenantMixin):
     __tablename__ = "audit_logs"
 
+    # Every list filter maps to one index: equality columns first, then the
+    # id keyset (time-ordered), so each page is a bounded range scan.
+    # since/until bound created_at, which prunes partitions. Combinations across
+    # groups (e.g. actor + entity) use the most selective index and filter
+    # the rest.
+    #
+    #   (none)                    ix_audit_cursor
+    #   entity_type               ix_audit_entity_type_cursor
+    #   entity_id (+entity_type)  ix_audit_entity_cursor
+    #   actor_id                  ix_audit_actor_cursor
+    #   action                    ix_audit_action_cursor
+    #   actor_id + action         ix_audit_actor_action_cursor
+    #
+    # Monthly RANGE partitions on created_at (see app/utils/audit_partitions.py);
+    # Postgres requires the partition key in the primary key.
     __table_args__ = (
-        db.Index("ix_audit_cursor", "tenant_id", "created_at", "id"),
-        db.Index("ix_audit_actor_action", "tenant_id", "actor_id", "action"),
+        db.Index("ix_audit_cursor", "tenant_id", "id"),
+        db.Index("ix_audit_entity_type_cursor", "tenant_id", "entity_type", "id"),
+        db.Index("ix_audit_entity_cursor", "tenant_id", "entity_id", "id"),
+        db.Index("ix_audit_actor_cursor", "tenant_id", "actor_id", "id"),
+        db.Index("ix_audit_action_cursor", "tenant_id", "action", "id"),
+        db.Index("ix_audit_actor_action_cursor", "tenant_id", "actor_id", "action", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
-    actor_id = db.Column(db.String(36), nullable=False, index=True)
-    action = db.Column(db.String(50), nullable=False, index=True)
+    # Single-column indexes inherited from BaseModel/TenantMixin are all
+    # prefixes or suffixes of the composites above; redeclared without them.
+    # created_at is the event time captured by log_action, and the id is
+    # minted from that same instant (see apply_cursor's prune_column).
+    id = db.Column(db.Uuid(as_uuid=False), primary_key=True, default=uuid7)
+    created_at = db.Column(db.DateTime, primary_key=True, nullable=False, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now())
+    tenant_id = db.Column(db.Uuid(as_uuid=False), db.ForeignKey("tenants.id"), nullable=False)
 
-    entity_type = db.Column(db.String(50), nullable=False, index=True)
-    entity_id = db.Column(db.String(36), nullable=False, index=True)
+    actor_id = db.Column(db.Uuid(as_uuid=False), nullable=False)
+    action = db.Column(db.String(50), nullable=False)
+
+    entity_type = db.Column(db.String(50), nullable=False)
+    entity_id = db.Column(db.String(36), nullable=False)  # id, or "*" for bulk summaries
 
     payload = db.Column(db.JSON, nullable=False, default=dict)  # ✅ renamed
 
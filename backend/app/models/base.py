@@ -1,15 +1,20 @@
-from datetime import datetime, timezone
-import uuid
 from app.extensions import db
-
-local_time_now = datetime.now(timezone.utc).astimezone()
+from app.utils.ids import uuid7
 
 class BaseModel(db.Model):
     __abstract__ = True
 
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
-    created_at = db.Column(db.DateTime, default=local_time_now, index=True)
-    updated_at = db.Column(db.DateTime, default=local_time_now, onupdate=local_time_now, index=True)
+    # Native 16-byte UUIDs; values are time-ordered (UUIDv7) and exposed as str
+    id = db.Column(db.Uuid(as_uuid=False), primary_key=True, default=uuid7)
+
+    # Assigned by the database (transaction timestamp)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now(), index=True)
+    updated_at = db.Column(
+        db.DateTime, nullable=False, server_default=db.func.now(), onupdate=db.func.now(), index=True
+    )
+
+    # Fetch server-generated timestamps with INSERT/UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     def __init__(self, **kwargs):
         """
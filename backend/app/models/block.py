@@ -6,9 +6,9 @@ from .soft_delete_mixin import SoftDeleteMixin
 class Block(BaseModel, TenantMixin, SoftDeleteMixin):
     __tablename__ = "blocks"
 
-    section_id = db.Column(db.String(36), db.ForeignKey("sections.id"), nullable=False, index=True)
+    section_id = db.Column(db.Uuid(as_uuid=False), db.ForeignKey("sections.id"), nullable=False, index=True)
     type = db.Column(db.String(100), nullable=False)  # text, image, video, button
-    order = db.Column(db.Integer, nullable=False, default=0, index=True)
+    order = db.Column(db.Integer, nullable=True, default=0, index=True)  # NULL once soft-deleted
     content = db.Column(db.JSON, default=dict) # JSON for text/button data
     media_url = db.Column(db.String(512), nullable=True) # URL for images/videos if applicable
 
@@ -16,10 +16,20 @@ class Block(BaseModel, TenantMixin, SoftDeleteMixin):
     section = db.relationship("Section", back_populates="blocks")
 
     __table_args__ = (
-        db.UniqueConstraint("section_id", "order", name="uq_section_block_order"),
+        db.UniqueConstraint(
+            "section_id", "order",
+            name="uq_section_block_order",
+            deferrable=True,
+            initially="IMMEDIATE",
+        ),
         db.Index("idx_block_section_order", "section_id", "order"),
     )
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    def soft_delete(self):
+        super().soft_delete()
+        # Tombstones release their order slot (NULLs never collide in uq_section_block_order)
+        self.order = None
+
@@ -0,0 +1,39 @@
+# app/models/job.py
+from app.extensions import db
+from .base import BaseModel
+from .tenant_mixin import TenantMixin
+
+
+class Job(BaseModel, TenantMixin):
+    __tablename__ = "jobs"
+
+    type = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    # queued | running | succeeded | partial | failed | cancelled
+
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    result = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+
+    progress_done = db.Column(db.Integer, nullable=False, default=0)
+    progress_total = db.Column(db.Integer, nullable=True)
+
+    cancel_requested = db.Column(db.Boolean, nullable=False, default=False)
+
+    created_by = db.Column(db.Uuid(as_uuid=False), nullable=True)
+    worker_id = db.Column(db.String(100), nullable=True)
+    started_at = db.Column(db.DateTime, nullable=True)
+    # Lease of a running job; extended by the worker's heartbeat
+    locked_until = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        # Claim query: oldest queued job first
+        db.Index("ix_job_status_created", "status", "created_at"),
+        # Reclaim: running jobs with an expired lease
+        db.Index("ix_job_status_locked_until", "status", "locked_until"),
+    )
+
+    @property
+    def is_finished(self):
+        return self.status in ("succeeded", "partial", "failed", "cancelled")
@@ -11,14 +11,25 @@ class Page(BaseModel, TenantMixin, SoftDeleteMixin):
     status = db.Column(db.String(50), default='draft', index=True)
     seo = db.Column(db.JSON(none_as_null=True), default=dict)
 
+    # Last allocated PageVersion.version (see utils.versioning.allocate_versions)
+    version_counter = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    # PageVersion served on public reads; set by publish, cleared by unpublish/rollback
+    published_version_id = db.Column(
+        db.Uuid(as_uuid=False),
+        db.ForeignKey("page_versions.id", use_alter=True, name="fk_page_published_version"),
+        nullable=True,
+    )
+
     __table_args__ = (
         db.UniqueConstraint("tenant_id", "slug", name="uq_page_slug_per_tenant"),
     )
 
-    # Relationship to Sections (ordered, cascade deletes)
+    # Relationship to Sections (live rows only, ordered, cascade deletes)
     sections = db.relationship(
         "Section",
         back_populates="page",
+        primaryjoin="and_(Page.id == Section.page_id, Section.deleted_at.is_(None))",
         order_by="Section.order",
         cascade="all, delete-orphan"
     )
\ No newline at end of file
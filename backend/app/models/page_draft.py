@@ -7,7 +7,7 @@ from .soft_delete_mixin import SoftDeleteMixin
 class PageDraft(BaseModel, TenantMixin):
     __tablename__ = "page_drafts"
 
-    page_id = db.Column(db.String(36), db.ForeignKey("pages.id"), nullable=False, index=True)
+    page_id = db.Column(db.Uuid(as_uuid=False), db.ForeignKey("pages.id"), nullable=False, index=True)
     snapshot = db.Column(db.JSON, nullable=False)
     updated_at = db.Column(db.DateTime, nullable=False, index=True)
-    updated_by = db.Column(db.String(36), nullable=False)
+    updated_by = db.Column(db.Uuid(as_uuid=False), nullable=False)
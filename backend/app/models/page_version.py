@@ -6,7 +6,7 @@ class PageVersion(BaseModel, TenantMixin):
     __tablename__ = "page_versions"
 
     page_id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         db.ForeignKey("pages.id"),
         nullable=False,
         index=True
@@ -16,11 +16,27 @@ class PageVersion(BaseModel, TenantMixin):
     status = db.Column(db.String(20), nullable=False)  
     # draft | published | archived | rollback
 
-    snapshot = db.Column(db.JSON, nullable=False)
+    # Raw stored payload: full snapshot (storage="full") or a structural
+    # delta against base_version (storage="delta"). Read through .snapshot.
+    snapshot_data = db.Column("snapshot", db.JSON, nullable=False)
+    storage = db.Column(db.String(10), nullable=False, default="full", server_default="full")
+    base_version = db.Column(db.Integer, nullable=True)
 
-    created_by = db.Column(db.String(36), nullable=True)
+    created_by = db.Column(db.Uuid(as_uuid=False), nullable=True)
 
     __table_args__ = (
         db.UniqueConstraint("page_id", "version", name="uq_page_version"),
         db.Index("idx_page_version_page", "page_id"),
     )
+
+    @property
+    def snapshot(self):
+        """Full page snapshot, transparently reconstructed from deltas."""
+        from app.utils.snapshots import load_snapshot
+        return load_snapshot(self)
+
+    @snapshot.setter
+    def snapshot(self, value):
+        self.snapshot_data = value
+        self.storage = "full"
+        self.base_version = None
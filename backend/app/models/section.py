@@ -6,9 +6,9 @@ from .soft_delete_mixin import SoftDeleteMixin
 class Section(BaseModel, TenantMixin, SoftDeleteMixin):
     __tablename__ = "sections"
     
-    page_id = db.Column(db.String(36), db.ForeignKey("pages.id"), nullable=False, index=True)
+    page_id = db.Column(db.Uuid(as_uuid=False), db.ForeignKey("pages.id"), nullable=False, index=True)
     type = db.Column(db.String(100), nullable=False)  # hero, features, gallery
-    order = db.Column(db.Integer, nullable=False, default=0, index=True)
+    order = db.Column(db.Integer, nullable=True, default=0, index=True)  # NULL once soft-deleted
     settings = db.Column(db.JSON, default=dict)
 
     # Relationship to parent Page
@@ -17,15 +17,26 @@ class Section(BaseModel, TenantMixin, SoftDeleteMixin):
         back_populates="sections"
     )
 
-    # Relationship to child Blocks
+    # Relationship to child Blocks (live rows only)
     blocks = db.relationship(
         "Block",
         back_populates="section",
+        primaryjoin="and_(Section.id == Block.section_id, Block.deleted_at.is_(None))",
         order_by="Block.order",
         cascade="all, delete-orphan"
     )
 
     __table_args__ = (
-        db.UniqueConstraint("page_id", "order", name="uq_page_section_order"),
+        db.UniqueConstraint(
+            "page_id", "order",
+            name="uq_page_section_order",
+            deferrable=True,
+            initially="IMMEDIATE",
+        ),
         db.Index("idx_section_page_order", "page_id", "order"),
     )
+
+    def soft_delete(self):
+        super().soft_delete()
+        # Tombstones release their order slot (NULLs never collide in uq_page_section_order)
+        self.order = None
@@ -1,4 +1,3 @@
-from datetime import datetime, timezone
 from app.extensions import db
 from .base import BaseModel
 
@@ -35,12 +34,12 @@ class Tenant(BaseModel):
     # JSON field for future toggles (flexible)
     features = db.Column(db.JSON, default=dict)
 
-    # Timestamps (timezone-aware)
+    # Timestamps (timezone-aware, assigned by the database)
     created_at = db.Column(
-        db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        db.DateTime(timezone=True), nullable=False, server_default=db.func.now()
     )
     updated_at = db.Column(
-        db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc)
+        db.DateTime(timezone=True), nullable=False, server_default=db.func.now(), onupdate=db.func.now()
     )
 
     def has_feature(self, feature_name: str) -> bool:
@@ -48,9 +47,23 @@ class Tenant(BaseModel):
         Check if a feature is enabled for this tenant.
         """
         # Check JSON overrides first
-        if self.features.get(feature_name) is not None:
-            return self.features.get(feature_name)
+        overrides = self.features or {}
+        if overrides.get(feature_name) is not None:
+            return bool(overrides.get(feature_name))
 
         # Fallback to attribute toggles
         attr_name = f"enable_{feature_name}"
-        return getattr(self, attr_name, False)
+        return bool(getattr(self, attr_name, False))
+
+    def enabled_features(self) -> set:
+        """Names of every enabled feature: toggles plus JSON-only flags."""
+        names = FEATURE_FLAGS | set(self.features or {})
+        return {name for name in names if self.has_feature(name)}
+
+
+# Feature names backed by an enable_<name> column
+FEATURE_FLAGS = frozenset(
+    column.key.removeprefix("enable_")
+    for column in Tenant.__table__.columns
+    if column.key.startswith("enable_")
+)
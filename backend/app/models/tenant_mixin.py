@@ -2,8 +2,8 @@ from app.extensions import db
 
 class TenantMixin:
     tenant_id = db.Column(
-        db.String(36),
-        db.ForeignKey('tenant.id'),
+        db.Uuid(as_uuid=False),
+        db.ForeignKey('tenants.id'),
         nullable=False,
         index=True
-    )
\ No newline at end of file
+    )
@@ -1,5 +1,5 @@
-from werkzeug.security import generate_password_hash, check_password_hash
 from app.extensions import db
+from app.utils.password_hasher import password_hasher
 from .base import BaseModel
 from .tenant_mixin import TenantMixin
 
@@ -7,7 +7,7 @@ class User(BaseModel, TenantMixin):
     __tablename__ = 'users'
 
     email = db.Column(db.String(120), nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
     last_login_at = db.Column(db.DateTime)
 
     role = db.Column(db.String(50), nullable=False, default='user', index=True)
@@ -21,8 +21,16 @@ class User(BaseModel, TenantMixin):
     )
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """
+        Verify `password`, upgrading a hash with outdated parameters in
+        place (the caller commits). Raises PasswordHasherBusy when no
+        hashing capacity is left.
+        """
+        valid, new_hash = password_hasher.verify(self.password_hash, password)
+        if new_hash:
+            self.password_hash = new_hash
+        return valid
 
@@ -1,8 +1,9 @@
-def normalize_block(block, admin=False):
+def normalize_block(block, admin=False, position=None):
+    """`position` is the public 1-based order; stored keys may be sparse."""
     base = {
         "id": block.id,
         "type": block.type,
-        "order": block.order,
+        "order": position if position is not None else block.order,
         "content": block.content,
         "media_url": block.media_url
     }
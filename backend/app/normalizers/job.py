@@ -0,0 +1,30 @@
+# app/normalizers/job.py
+from __future__ import annotations
+
+from typing import Dict, Any
+from app.models.job import Job
+
+
+def normalize_job(job: Job) -> Dict[str, Any]:
+    """
+    Normalizes a Job model into API-safe JSON for status polling.
+    """
+
+    if not job:
+        raise ValueError("Job cannot be None")
+
+    return {
+        "id": job.id,
+        "type": job.type,
+        "status": job.status,
+        "progress": {
+            "done": job.progress_done,
+            "total": job.progress_total,
+        },
+        "cancel_requested": job.cancel_requested,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
@@ -13,8 +13,46 @@ def normalize_page(page, admin=False, preview=False):
             normalize_section(
                 s,
                 admin=admin,
-                include_blocks=True
+                include_blocks=True,
+                position=i
             )
-            for s in sections
+            for i, s in enumerate(sections, start=1)
         ]
     }
+
+
+def normalize_page_snapshot(snapshot):
+    """
+    Public (admin=False) page shape built from a PageVersion snapshot.
+
+    Mirrors normalize_page so published reads never touch live rows.
+    """
+    page = snapshot["page"]
+    sections = sorted(snapshot["sections"], key=lambda s: s["order"])
+
+    return {
+        "id": page["id"],
+        "title": page["title"],
+        "slug": page["slug"],
+        "status": None,
+        "seo": page.get("seo") or {},
+        "sections": [
+            {
+                "id": s["id"],
+                "type": s["type"],
+                "order": i,
+                "settings": s.get("settings") or {},
+                "blocks": [
+                    {
+                        "id": b["id"],
+                        "type": b["type"],
+                        "order": j,
+                        "content": b["content"],
+                        "media_url": b.get("media_url"),
+                    }
+                    for j, b in enumerate(sorted(s["blocks"], key=lambda b: b["order"]), start=1)
+                ],
+            }
+            for i, s in enumerate(sections, start=1)
+        ],
+    }
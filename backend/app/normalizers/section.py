@@ -1,17 +1,19 @@
 from .block import normalize_block
 
-def normalize_section(section, admin=False, include_blocks=False):
+def normalize_section(section, admin=False, include_blocks=False, position=None):
+    """`position` is the public 1-based order; stored keys may be sparse."""
     data = {
         "id": section.id,
         "type": section.type,
-        "order": section.order,
+        "order": position if position is not None else section.order,
         "settings": section.settings or {}
     }
 
     if include_blocks:
         blocks = sorted(section.blocks, key=lambda b: b.order)
         data["blocks"] = [
-            normalize_block(b, admin=admin) for b in blocks
+            normalize_block(b, admin=admin, position=i)
+            for i, b in enumerate(blocks, start=1)
         ]
 
     return data
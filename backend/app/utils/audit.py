@@ -1,6 +1,7 @@
+from datetime import datetime, timezone
 from flask import g
-from app.extensions import db
-from app.models.audit_log import AuditLog
+from app.utils.audit_sink import audit_sink
+from app.utils.ids import uuid7
 from typing import Optional
 
 def log_action(
@@ -10,15 +11,25 @@ def log_action(
     entity_id: Optional[str],
     payload: dict | None = None
 ):
+    """
+    Record an audit entry for the current unit of work.
+
+    How and when it reaches audit_logs depends on AUDIT_WRITE_MODE
+    (see app.utils.audit_sink); actor, tenant and timestamp are captured now,
+    and the id is minted from that same timestamp.
+    """
     if not hasattr(g, "current_tenant") or not hasattr(g, "current_user"):
         return  # Skip logging if user or tenant context is missing
-    log = AuditLog()
 
-    log.actor_id = getattr(g, "current_user", None) and g.current_user.id
-    log.tenant_id = g.current_tenant.id
-    log.action = action
-    log.entity_type = entity_type
-    log.entity_id = entity_id
-    log.payload = payload or {}
+    now = datetime.now(timezone.utc).astimezone()
 
-    db.session.add(log)
+    audit_sink.add({
+        "id": uuid7(now),
+        "actor_id": getattr(g, "current_user", None) and g.current_user.id,
+        "tenant_id": g.current_tenant.id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "payload": payload or {},
+        "created_at": now,
+    })
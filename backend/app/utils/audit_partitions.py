@@ -0,0 +1,182 @@
+# app/utils/audit_partitions.py
+"""
+Monthly RANGE partitions of audit_logs on created_at.
+
+Partitions are named audit_logs_pYYYYMM and cover [month, next month).
+audit_logs_default catches rows outside every range so an insert never
+fails if premaking lapses; ensure_partitions() moves such rows into their
+month partition when it creates it, by copying the whole default through
+the parent into a fresh default inside one locked transaction.
+
+Retention never DELETEs audit rows: expired partitions are detached,
+copied to gzip'd CSV in AUDIT_ARCHIVE_DIR, fsynced, and only then dropped.
+"""
+from __future__ import annotations
+
+import gzip
+import os
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import text
+
+from app.extensions import db
+
+PARENT = "audit_logs"
+DEFAULT_PARTITION = f"{PARENT}_default"
+PARTITION_RE = re.compile(rf"^{PARENT}_p(\d{{4}})(\d{{2}})$")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month.year:04d}{month.month:02d}"
+
+
+def list_partitions() -> Dict[date, str]:
+    """Month partitions currently attached to audit_logs, keyed by month."""
+    rows = db.session.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = :parent
+            """
+        ),
+        {"parent": PARENT},
+    ).scalars()
+
+    partitions = {}
+    for name in rows:
+        match = PARTITION_RE.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def ensure_partitions(months_ahead: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+    """
+    Create partitions from the current month up to `months_ahead` months
+    ahead (AUDIT_PARTITION_PREMAKE_MONTHS). Idempotent; returns new names.
+    """
+    if months_ahead is None:
+        months_ahead = current_app.config.get("AUDIT_PARTITION_PREMAKE_MONTHS", 3)
+
+    current = month_start(today or datetime.now(timezone.utc).date())
+    existing = list_partitions()
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            _create_partition(month)
+            created.append(partition_name(month))
+
+    db.session.commit()
+    return created
+
+
+def _create_partition(month: date) -> None:
+    name = partition_name(month)
+    bounds = {"lo": month, "hi": add_months(month, 1)}
+    create = (
+        f"CREATE TABLE {name} PARTITION OF {PARENT} "
+        f"FOR VALUES FROM ('{bounds['lo']}') TO ('{bounds['hi']}')"
+    )
+
+    # Rows that landed in the default partition for this month must move
+    # first, otherwise Postgres rejects the new range.
+    stray = db.session.execute(
+        text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE created_at >= :lo AND created_at < :hi"),
+        bounds,
+    ).scalar()
+
+    if not stray:
+        db.session.execute(text(create))
+        return
+
+    # Swap in a fresh default and re-route the old one's rows through the
+    # parent, all under one ACCESS EXCLUSIVE lock held until commit. Rows
+    # are copied, never DELETEd; the old default is dropped only once
+    # every row is accounted for.
+    moving = f"{DEFAULT_PARTITION}_moving"
+
+    db.session.execute(text(f"LOCK TABLE {PARENT} IN ACCESS EXCLUSIVE MODE"))
+    db.session.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {DEFAULT_PARTITION}"))
+    db.session.execute(text(f"ALTER TABLE {DEFAULT_PARTITION} RENAME TO {moving}"))
+    db.session.execute(text(create))
+    db.session.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT"))
+
+    total = db.session.execute(text(f"SELECT count(*) FROM {moving}")).scalar()
+    copied = db.session.execute(text(f"INSERT INTO {PARENT} SELECT * FROM {moving}")).rowcount
+
+    if copied != total:
+        # Rolled back by the caller's session; the original default is intact
+        raise RuntimeError(f"{moving}: copied {copied} of {total} rows; partition {name} not created")
+
+    db.session.execute(text(f"DROP TABLE {moving}"))
+
+
+def expired_partitions(retention_months: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+    """Partitions whose whole range is older than the retention window."""
+    if retention_months is None:
+        retention_months = current_app.config.get("AUDIT_RETENTION_MONTHS", 12)
+
+    cutoff = add_months(month_start(today or datetime.now(timezone.utc).date()), -retention_months)
+
+    return [
+        name for month, name in sorted(list_partitions().items())
+        if add_months(month, 1) <= cutoff
+    ]
+
+
+def archive_partition(name: str, archive_dir: Optional[str] = None) -> Dict[str, object]:
+    """
+    Detach `name`, dump it to <archive_dir>/<name>.csv.gz and drop it.
+
+    The file is written under a temporary name, fsynced and renamed before
+    the table is dropped, so a crash leaves either the table or the archive.
+    """
+    if not PARTITION_RE.match(name):
+        raise ValueError(f"Not an audit partition: {name}")
+
+    archive_dir = archive_dir or current_app.config.get("AUDIT_ARCHIVE_DIR", "archive/audit_logs")
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{name}.csv.gz")
+    tmp_path = f"{path}.tmp"
+
+    # Detached tables keep their rows; nothing is deleted from audit_logs
+    if name in list_partitions().values():
+        db.session.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        db.session.commit()
+
+    rows = db.session.execute(text(f"SELECT count(*) FROM {name}")).scalar()
+    db.session.commit()
+
+    raw = db.engine.raw_connection()
+    try:
+        with gzip.open(tmp_path, "wb") as fh:
+            raw.cursor().copy_expert(f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER true)", fh)
+        raw.commit()
+    finally:
+        raw.close()
+
+    with open(tmp_path, "rb") as fh:
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+
+    db.session.execute(text(f"DROP TABLE {name}"))
+    db.session.commit()
+
+    return {"partition": name, "rows": rows, "path": path}
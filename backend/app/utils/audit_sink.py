@@ -0,0 +1,207 @@
+# app/utils/audit_sink.py
+"""
+Audit write paths, selected with AUDIT_WRITE_MODE:
+
+sync
+    One AuditLog row per action, added to the caller's session and flushed
+    with its other changes. Atomic with the business write; one INSERT
+    (and one round of index maintenance) per entry.
+
+batched (default)
+    Entries are buffered on the session and written with a single
+    multi-row INSERT right before COMMIT, inside the same transaction.
+    Same durability and atomicity as sync: a rollback discards them.
+
+async
+    Entries are handed to a bounded in-process queue once the business
+    transaction has committed, and a background thread writes them in
+    batches of AUDIT_BATCH_SIZE (or every AUDIT_FLUSH_INTERVAL seconds).
+    Lowest request latency, but NOT atomic: entries still queued are lost
+    if the process dies, and rows appear shortly after the change. When
+    the queue is full the entry is written inline instead of dropped.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+from app.extensions import db
+from app.models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+WRITE_MODES = ("sync", "batched", "async")
+
+# session.info key holding entries logged in the current transaction
+BUFFER_KEY = "audit_buffer"
+
+
+class AuditSink:
+    def __init__(self):
+        self.app = None
+        self.mode = "batched"
+        self.batch_size = 500
+        self.flush_interval = 1.0
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10_000)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._lock = threading.Lock()
+        self._written = 0
+        self._batches = 0
+        self._inline_writes = 0
+        self._errors = 0
+        self._latency_last = 0.0
+        self._latency_max = 0.0
+        self._latency_total = 0.0
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.mode = app.config.get("AUDIT_WRITE_MODE", "batched")
+        self.batch_size = app.config.get("AUDIT_BATCH_SIZE", 500)
+        self.flush_interval = app.config.get("AUDIT_FLUSH_INTERVAL", 1.0)
+
+        if self.mode not in WRITE_MODES:
+            raise ValueError(f"Unknown AUDIT_WRITE_MODE: {self.mode}")
+
+        if self.mode == "async" and self._thread is None:
+            self._queue = queue.Queue(maxsize=app.config.get("AUDIT_QUEUE_MAX_SIZE", 10_000))
+            self._thread = threading.Thread(target=self._loop, name="audit-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    # -------------------------------
+    # Producer side
+    # -------------------------------
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Record one audit entry in the current unit of work."""
+        if self.mode == "sync":
+            db.session.add(AuditLog(**entry))
+            return
+
+        db.session.info.setdefault(BUFFER_KEY, []).append(entry)
+
+    def _before_commit(self, session) -> None:
+        if self.mode != "batched":
+            return
+
+        entries = session.info.pop(BUFFER_KEY, None)
+        if entries:
+            started = time.perf_counter()
+            session.execute(insert(AuditLog), entries)
+            self._record(len(entries), time.perf_counter() - started)
+
+    def _after_commit(self, session) -> None:
+        entries = session.info.pop(BUFFER_KEY, None)
+        if not entries:
+            return
+
+        for entry in entries:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                self._write([entry])
+                with self._lock:
+                    self._inline_writes += 1
+
+    def _after_rollback(self, session, previous_transaction) -> None:
+        session.info.pop(BUFFER_KEY, None)
+
+    # -------------------------------
+    # Background writer (async mode)
+    # -------------------------------
+    def _loop(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._drain()
+            if batch:
+                self._write(batch)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Block until an entry arrives (or the interval passes), then take up to batch_size."""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _write(self, entries: List[Dict[str, Any]]) -> None:
+        """Write entries in their own transaction, outside any request session."""
+        started = time.perf_counter()
+        try:
+            with self.app.app_context():
+                with db.engine.begin() as conn:
+                    conn.execute(insert(AuditLog.__table__), entries)
+        except Exception:
+            logger.exception("Failed to write %d audit entries", len(entries))
+            with self._lock:
+                self._errors += len(entries)
+            return
+
+        self._record(len(entries), time.perf_counter() - started)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain the queue and stop the writer (registered atexit)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # -------------------------------
+    # Metrics
+    # -------------------------------
+    def _record(self, count: int, seconds: float) -> None:
+        with self._lock:
+            self._written += count
+            self._batches += 1
+            self._latency_last = seconds
+            self._latency_max = max(self._latency_max, seconds)
+            self._latency_total += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "queue_depth": self._queue.qsize() if self.mode == "async" else 0,
+                "queue_max_size": self._queue.maxsize if self.mode == "async" else 0,
+                "written": self._written,
+                "batches": self._batches,
+                "inline_writes": self._inline_writes,
+                "errors": self._errors,
+                "flush_latency_ms": {
+                    "last": round(self._latency_last * 1000, 3),
+                    "max": round(self._latency_max * 1000, 3),
+                    "avg": round(self._latency_total / self._batches * 1000, 3) if self._batches else 0.0,
+                },
+            }
+
+
+audit_sink = AuditSink()
+
+
+# -------------------------------------------------
+# Session hooks (all sessions; no-ops unless entries are buffered)
+# -------------------------------------------------
+@event.listens_for(Session, "before_commit")
+def _audit_before_commit(session):
+    audit_sink._before_commit(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _audit_after_commit(session):
+    audit_sink._after_commit(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _audit_after_rollback(session, previous_transaction):
+    audit_sink._after_rollback(session, previous_transaction)
@@ -0,0 +1,103 @@
+# app/utils/cache.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# Sentinel returned by TTLCache.get() when a key is absent or expired.
+# Distinct from None so negative results ("not found") can be cached too.
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe, per-process cache with TTL expiry and LRU eviction.
+
+    Notes:
+    - Lives in worker memory; every gunicorn worker has its own copy
+    - Values are stored as-is, so callers must only cache immutable
+      or detached objects
+    - Hit/miss counters are exposed through stats() for monitoring
+    """
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 60.0):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than zero")
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, *, max_size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """Apply app config to a module-level cache instance."""
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if ttl is not None:
+                self.ttl = ttl
+            self._evict()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate) -> None:
+        """Drop every entry whose key satisfies predicate(key)."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        # Caller must hold the lock
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
@@ -1,6 +1,6 @@
 from functools import wraps
 from flask import g, jsonify
-from flask_jwt_extended import get_jwt_identity
+from app.models.tenant import FEATURE_FLAGS
 
 def tenant_required(fn):
     @wraps(fn)
@@ -9,8 +9,8 @@ def tenant_required(fn):
         if not tenant:
             return jsonify({"error": "Tenant context missing"}), 400
 
-        identity = get_jwt_identity()
-        if identity.get("tenant_id") != tenant.id:
+        # g.current_user is the AuthContext resolved after JWT verification
+        if g.current_user.tenant_id != tenant.id:
             return jsonify({"error": "Tenant mismatch"}), 403
 
         return fn(*args, **kwargs)
@@ -20,9 +20,7 @@ def roles_required(*allowed_roles):
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            identity = get_jwt_identity()
-
-            if identity.get("role") not in allowed_roles:
+            if g.current_user.role not in allowed_roles:
                 return jsonify({"error": "Insufficient permissions"}), 403
             
             return fn(*args, **kwargs)
@@ -34,11 +32,12 @@ def feature_enabled(feature_name):
         @wraps(fn)
         def wrapper(*args, **kwargs):
             tenant = g.current_tenant
+            name = feature_name.removeprefix("enable_")
 
-            if not hasattr(tenant, feature_name):
+            if name not in FEATURE_FLAGS:
                 return jsonify({"error": "Feature not recognized"}), 400
 
-            if not getattr(tenant, feature_name):
+            if not tenant.has_feature(name):
                 return jsonify({
                     "error": f"Feature '{feature_name}' is disabled for this tenant"
                 }), 403
@@ -0,0 +1,66 @@
+# app/utils/ids.py
+"""
+Time-ordered primary keys (UUIDv7, RFC 9562).
+
+48-bit Unix millisecond timestamp, then a 12-bit counter that keeps ids
+monotonic within a millisecond in this process, then 62 random bits. Ids
+sort by creation time, so B-tree inserts append to the right edge and the
+id alone is a valid keyset cursor.
+"""
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7(at: Optional[datetime] = None) -> str:
+    """New UUIDv7 string; `at` pins the timestamp (defaults to now)."""
+    global _last_ms, _counter
+
+    ms = int(at.timestamp() * 1000) if at is not None else time.time_ns() // 1_000_000
+
+    with _lock:
+        if ms <= _last_ms and at is None:
+            # Same (or skewed-back) millisecond: bump the counter instead
+            ms = _last_ms
+            _counter = (_counter + 1) & 0xFFF
+            if _counter == 0:
+                ms = _last_ms = ms + 1
+        else:
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF  # leave headroom
+            if at is None:
+                _last_ms = ms
+        counter = _counter
+
+    rand = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+
+    value = (ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76            # version
+    value |= counter << 64
+    value |= 0b10 << 62           # RFC 4122 variant
+    value |= rand
+
+    return str(uuid.UUID(int=value))
+
+
+def parse_uuid(value) -> Optional[str]:
+    """Canonical string form of a client-supplied UUID, None if malformed."""
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return None
+
+
+def uuid7_time(value: str) -> datetime:
+    """Millisecond timestamp embedded in a UUIDv7 (UTC)."""
+    ms = uuid.UUID(str(value)).int >> 80
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
@@ -0,0 +1,364 @@
+# app/utils/index_advisor.py
+"""
+Index advisor: EXPLAIN (ANALYZE, BUFFERS) the canonical query shape of each
+list/read endpoint against a seeded database and report
+
+- sequential scans on tables above a row threshold
+- indexes no canonical query used (excluding PK/unique constraint indexes)
+- duplicate indexes (same keys) and left-prefix redundant ones
+
+Queries are built from the same models and filters as the endpoints, with
+parameters sampled from one tenant's data. Everything runs in a transaction
+that is rolled back.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.extensions import db
+from app.models.tenant import Tenant
+from app.models.page import Page
+from app.models.section import Section
+from app.models.block import Block
+from app.models.page_version import PageVersion
+from app.models.audit_log import AuditLog
+from app.models.job import Job
+
+LIST_LIMIT = 21  # default page size + 1, as paginate_cursor fetches
+
+
+@dataclass
+class PlanReport:
+    name: str
+    total_ms: float = 0.0
+    shared_hit: int = 0
+    shared_read: int = 0
+    seq_scans: List[Dict[str, Any]] = field(default_factory=list)
+    indexes: List[str] = field(default_factory=list)
+    skipped: Optional[str] = None
+
+
+# -------------------------------------------------
+# Canonical queries
+# -------------------------------------------------
+
+def _samples(tenant_id: str) -> Dict[str, Any]:
+    """Representative ids from the seeded tenant (largest page/section)."""
+    page = (
+        db.session.query(Page.id, Page.slug)
+        .outerjoin(Section, Section.page_id == Page.id)
+        .filter(Page.tenant_id == tenant_id, Page.deleted_at.is_(None))
+        .group_by(Page.id, Page.slug)
+        .order_by(func.count(Section.id).desc())
+        .first()
+    )
+    section_id = (
+        db.session.query(Section.id)
+        .outerjoin(Block, Block.section_id == Section.id)
+        .filter(Section.tenant_id == tenant_id, Section.deleted_at.is_(None))
+        .group_by(Section.id)
+        .order_by(func.count(Block.id).desc())
+        .limit(1)
+        .scalar()
+    )
+    actor_id, action, entity_type, entity_id = (
+        db.session.query(AuditLog.actor_id, AuditLog.action, AuditLog.entity_type, AuditLog.entity_id)
+        .filter(AuditLog.tenant_id == tenant_id)
+        .order_by(AuditLog.id.desc())
+        .first()
+    ) or (None, None, None, None)
+
+    return {
+        "tenant_id": tenant_id,
+        "page_id": page.id if page else None,
+        "slug": page.slug if page else None,
+        "section_id": section_id,
+        "actor_id": actor_id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+    }
+
+
+def canonical_queries(s: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """Endpoint name → statement builder, mirroring the route's filters and ordering."""
+    tenant_id = s["tenant_id"]
+
+    def audit(**filters):
+        stmt = select(AuditLog).where(AuditLog.tenant_id == tenant_id)
+        for column, value in filters.items():
+            stmt = stmt.where(getattr(AuditLog, column) == value)
+        return stmt.order_by(AuditLog.id.desc()).limit(LIST_LIMIT)
+
+    return {
+        "tenant_middleware.load_tenant": lambda: (
+            select(Tenant).where(Tenant.id == tenant_id, Tenant.is_active.is_(True)).limit(1)
+        ),
+        "cms.get_page (published)": lambda: (
+            select(Page.id, PageVersion)
+            .outerjoin(PageVersion, PageVersion.id == Page.published_version_id)
+            .where(Page.tenant_id == tenant_id, Page.slug == s["slug"], Page.status == "published")
+            .limit(1)
+        ),
+        "cms.get_page_by_id": lambda: (
+            select(Page).where(Page.id == s["page_id"], Page.tenant_id == tenant_id).limit(1)
+        ),
+        "cms.list_pages": lambda: (
+            select(Page)
+            .where(Page.tenant_id == tenant_id, Page.deleted_at.is_(None))
+            .order_by(Page.id.desc())
+            .limit(LIST_LIMIT)
+        ),
+        "loading.page_tree_options (sections)": lambda: (
+            select(Section)
+            .where(Section.page_id.in_([s["page_id"]]), Section.deleted_at.is_(None))
+            .order_by(Section.order)
+        ),
+        "loading.page_tree_options (blocks)": lambda: (
+            select(Block)
+            .where(Block.section_id.in_([s["section_id"]]), Block.deleted_at.is_(None))
+            .order_by(Block.order)
+        ),
+        "cms.list_sections": lambda: (
+            select(Section)
+            .where(Section.tenant_id == tenant_id, Section.page_id == s["page_id"], Section.deleted_at.is_(None))
+            .order_by(Section.id.desc())
+            .limit(LIST_LIMIT)
+        ),
+        "cms.list_blocks": lambda: (
+            select(Block)
+            .where(Block.tenant_id == tenant_id, Block.section_id == s["section_id"], Block.deleted_at.is_(None))
+            .order_by(Block.id.desc())
+            .limit(LIST_LIMIT)
+        ),
+        "cms.list_versions": lambda: (
+            select(PageVersion)
+            .where(PageVersion.tenant_id == tenant_id, PageVersion.page_id == s["page_id"])
+            .order_by(PageVersion.id.desc())
+            .limit(11)
+        ),
+        "snapshots.get_snapshot (chain)": lambda: (
+            select(PageVersion.version, PageVersion.storage, PageVersion.snapshot_data)
+            .where(
+                PageVersion.page_id == s["page_id"],
+                PageVersion.version >= (
+                    select(func.max(PageVersion.version))
+                    .where(PageVersion.page_id == s["page_id"], PageVersion.storage == "full")
+                    .scalar_subquery()
+                ),
+            )
+            .order_by(PageVersion.version.asc())
+        ),
+        "audit.list_audit_logs": lambda: audit(),
+        "audit.list_audit_logs (entity_type)": lambda: audit(entity_type=s["entity_type"]),
+        "audit.list_audit_logs (entity_id)": lambda: audit(entity_type=s["entity_type"], entity_id=s["entity_id"]),
+        "audit.list_audit_logs (actor_id)": lambda: audit(actor_id=s["actor_id"]),
+        "audit.list_audit_logs (action)": lambda: audit(action=s["action"]),
+        "audit.list_audit_logs (actor_id+action)": lambda: audit(actor_id=s["actor_id"], action=s["action"]),
+        "jobs.claim_next_job": lambda: (
+            select(Job).where(Job.status == "queued").order_by(Job.created_at).limit(1)
+        ),
+    }
+
+
+# -------------------------------------------------
+# EXPLAIN
+# -------------------------------------------------
+
+def explain(stmt, *, analyze: bool = True) -> Dict[str, Any]:
+    """EXPLAIN (FORMAT JSON) plan of `stmt`, with ANALYZE/BUFFERS if requested."""
+    compiled = stmt.compile(
+        dialect=postgresql.psycopg2.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+
+    conn = db.session.connection()
+    result = conn.exec_driver_sql(f"EXPLAIN ({options}) {compiled.string}", compiled.params)
+    return result.scalar()[0]
+
+
+def summarize_plan(name: str, plan: Dict[str, Any], *, min_rows: int, table_rows: Dict[str, float]) -> PlanReport:
+    report = PlanReport(name=name, total_ms=plan.get("Execution Time", 0.0))
+
+    def walk(node):
+        report.shared_hit += node.get("Shared Hit Blocks", 0)
+        report.shared_read += node.get("Shared Read Blocks", 0)
+
+        if node.get("Index Name"):
+            report.indexes.append(node["Index Name"])
+
+        if node["Node Type"] == "Seq Scan":
+            relation = node.get("Relation Name")
+            rows = table_rows.get(relation, 0)
+            if rows >= min_rows:
+                report.seq_scans.append({
+                    "relation": relation,
+                    "table_rows": int(rows),
+                    "filter": node.get("Filter"),
+                })
+
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan["Plan"])
+    return report
+
+
+# -------------------------------------------------
+# Catalog checks
+# -------------------------------------------------
+
+def table_row_estimates() -> Dict[str, float]:
+    rows = db.session.execute(
+        text("SELECT relname, reltuples FROM pg_class WHERE relkind IN ('r', 'p') AND relnamespace = 'public'::regnamespace")
+    )
+    return {name: max(tuples, 0) for name, tuples in rows}
+
+
+def list_indexes() -> List[Dict[str, Any]]:
+    """
+    Plain-column indexes of partitioned parents and ordinary tables.
+
+    Partitions are skipped: their indexes are copies of the parent's and
+    plans name the partition-level index, which is mapped back via
+    `parent_index`.
+    """
+    rows = db.session.execute(
+        text(
+            """
+            SELECT
+                t.relname AS table_name,
+                i.relname AS index_name,
+                ix.indisunique AS is_unique,
+                ix.indisprimary AS is_primary,
+                ix.indpred IS NOT NULL AS is_partial,
+                ix.indexprs IS NOT NULL AS has_expressions,
+                ARRAY(
+                    SELECT a.attname
+                    FROM unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord)
+                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                    ORDER BY k.ord
+                ) AS columns,
+                COALESCE(s.idx_scan, 0) AS idx_scan
+            FROM pg_index ix
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            JOIN pg_class t ON t.oid = ix.indrelid
+            LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = ix.indexrelid
+            WHERE t.relnamespace = 'public'::regnamespace
+              AND NOT t.relispartition
+            ORDER BY t.relname, i.relname
+            """
+        )
+    )
+    return [dict(row._mapping) for row in rows]
+
+
+def partition_index_parents() -> Dict[str, str]:
+    """Partition-level index name → parent index name."""
+    rows = db.session.execute(
+        text(
+            """
+            SELECT c.relname, p.relname
+            FROM pg_inherits inh
+            JOIN pg_class c ON c.oid = inh.inhrelid AND c.relkind = 'i'
+            JOIN pg_class p ON p.oid = inh.inhparent
+            """
+        )
+    )
+    return {child: parent for child, parent in rows}
+
+
+def duplicate_indexes(indexes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Pairs where one index is made redundant by another on the same table:
+    identical key columns, or a left prefix of a wider index. Unique,
+    partial and expression indexes are never reported as the redundant side.
+    """
+    findings = []
+    for index in indexes:
+        if index["is_unique"] or index["is_partial"] or index["has_expressions"]:
+            continue
+
+        for other in indexes:
+            if other is index or other["table_name"] != index["table_name"]:
+                continue
+            if other["is_partial"] or other["has_expressions"]:
+                continue
+
+            cols, other_cols = index["columns"], other["columns"]
+            if other_cols[:len(cols)] != cols:
+                continue
+
+            same = len(cols) == len(other_cols)
+            if same and not other["is_unique"] and other["index_name"] > index["index_name"]:
+                continue  # report identical non-unique pairs once
+
+            findings.append({
+                "table": index["table_name"],
+                "index": index["index_name"],
+                "columns": cols,
+                "covered_by": other["index_name"],
+                "covered_columns": other_cols,
+                "kind": "duplicate" if same else "prefix",
+            })
+            break
+
+    return findings
+
+
+# -------------------------------------------------
+# Report
+# -------------------------------------------------
+
+def run_advisor(*, tenant_id: Optional[str] = None, analyze: bool = True, min_rows: int = 1000) -> Dict[str, Any]:
+    if tenant_id is None:
+        tenant_id = (
+            db.session.query(Page.tenant_id)
+            .group_by(Page.tenant_id)
+            .order_by(func.count(Page.id).desc())
+            .limit(1)
+            .scalar()
+        )
+        if tenant_id is None:
+            raise ValueError("No seeded tenant found; pass --tenant-id or seed the database")
+
+    samples = _samples(tenant_id)
+    table_rows = table_row_estimates()
+    partition_parents = partition_index_parents()
+
+    reports: List[PlanReport] = []
+    try:
+        for name, build in canonical_queries(samples).items():
+            stmt = build()
+            if stmt is None or None in stmt.compile().params.values():
+                reports.append(PlanReport(name=name, skipped="no sample data"))
+                continue
+
+            plan = explain(stmt, analyze=analyze)
+            reports.append(summarize_plan(name, plan, min_rows=min_rows, table_rows=table_rows))
+    finally:
+        db.session.rollback()
+
+    used = {partition_parents.get(ix, ix) for report in reports for ix in report.indexes}
+    indexes = list_indexes()
+
+    unused = [
+        {"table": ix["table_name"], "index": ix["index_name"], "columns": ix["columns"], "idx_scan": ix["idx_scan"]}
+        for ix in indexes
+        if ix["index_name"] not in used and not ix["is_primary"] and not ix["is_unique"]
+    ]
+
+    return {
+        "tenant_id": tenant_id,
+        "queries": [report.__dict__ for report in reports],
+        "seq_scans": [
+            {"query": report.name, **scan} for report in reports for scan in report.seq_scans
+        ],
+        "unused_indexes": unused,
+        "duplicate_indexes": duplicate_indexes(indexes),
+    }
@@ -0,0 +1,108 @@
+# app/utils/json_provider.py
+from __future__ import annotations
+
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(o: Any) -> Any:
+    """Types orjson does not serialize natively."""
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """
+    Stdlib fallback that still emits ISO 8601 datetimes, so switching
+    providers never changes the API's timestamp format.
+    """
+
+    sort_keys = False
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, date):
+            return o.isoformat()
+
+        if isinstance(o, uuid.UUID):
+            return str(o)
+
+        return _default(o)
+
+
+class OrjsonProvider(StdlibJSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    Notes:
+    - datetime/date/UUID are serialized natively (ISO 8601 / canonical str)
+    - Calls with stdlib-only kwargs (indent, cls, ...) and values orjson
+      rejects (e.g. ints over 64 bits) fall back to the stdlib provider
+    """
+
+    option = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+
+        return self._dumpb(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumpb(obj), mimetype=self.mimetype)
+
+    def _dumpb(self, obj: Any) -> bytes:
+        option = self.option
+        if self._app.debug:
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj).encode("utf-8")
+
+
+def init_json_provider(app) -> None:
+    """
+    Install the JSON provider selected by JSON_PROVIDER.
+
+    "orjson" (default) silently falls back to the stdlib provider when the
+    package is not installed; "stdlib" forces the fallback.
+    """
+    name = app.config.get("JSON_PROVIDER", "orjson")
+
+    if name not in ("orjson", "stdlib"):
+        raise ValueError(f"Unknown JSON_PROVIDER: {name}")
+
+    if name == "orjson" and orjson is not None:
+        app.json = OrjsonProvider(app)
+    else:
+        app.json = StdlibJSONProvider(app)
@@ -0,0 +1,27 @@
+# app/utils/loading.py
+from sqlalchemy.orm import selectinload
+from app.models.page import Page
+from app.models.section import Section
+from app.models.block import Block
+
+
+def page_tree_options():
+    """
+    Loader option that eagerly fetches a page's live sections and blocks.
+
+    Notes:
+    - SELECT ... IN batching: one query for sections, one for blocks,
+      regardless of how many sections/blocks (or pages) are loaded
+    - Soft-deleted sections and blocks are filtered out in SQL
+    - Safe to combine with FOR UPDATE (only the page row is locked)
+    """
+    return selectinload(
+        Page.sections.and_(Section.deleted_at.is_(None))
+    ).selectinload(
+        Section.blocks.and_(Block.deleted_at.is_(None))
+    )
+
+
+def section_blocks_options():
+    """Loader option for a batch of sections and their live blocks."""
+    return selectinload(Section.blocks.and_(Block.deleted_at.is_(None)))
@@ -1,10 +1,184 @@
+from flask import current_app
+from sqlalchemy import func, select, text, update
 from app.extensions import db
 
-def compact_order(query, order_field="order"):
+# Sibling-order unique constraints (DEFERRABLE INITIALLY IMMEDIATE)
+ORDER_CONSTRAINTS = {
+    "sections": "uq_page_section_order",
+    "blocks": "uq_section_block_order",
+}
+
+
+def defer_order_constraint(model):
+    """
+    Defer the (parent, order) unique check to COMMIT for the rest of the
+    current transaction, so multi-statement renumbering may pass through
+    transient duplicates.
+    """
+    name = ORDER_CONSTRAINTS.get(model.__tablename__)
+    if name:
+        db.session.execute(text(f"SET CONSTRAINTS {name} DEFERRED"))
+
+
+def sparse_ordering():
+    """True when ORDERING_MODE="sparse": order keys are spaced ORDER_GAP apart."""
+    return current_app.config.get("ORDERING_MODE", "dense") == "sparse"
+
+
+def order_step():
+    """Distance between consecutive keys after compaction/rebalancing."""
+    return current_app.config.get("ORDER_GAP", 1024) if sparse_ordering() else 1
+
+
+def compact_order(query, order_field="order", partition_by=None, step=1):
+    """
+    Renumber the rows matched by `query` to 1..N (times `step`) in a single
+    UPDATE. step=order_step() spreads sparse keys back out (rebalancing).
+
+    Ranks are computed by a ROW_NUMBER() window over (order, id); only rows
+    whose order actually changes are written, and their count is returned. Pass `partition_by` (e.g.
+    Block.section_id) to compact many parents at once, such as every
+    section of a page:
+
+        compact_order(
+            Block.query.join(Section, Section.id == Block.section_id)
+            .filter(Section.page_id == page_id, Block.deleted_at.is_(None)),
+            partition_by=Block.section_id,
+        )
+    """
     model = query.column_descriptions[0]["entity"]
-    items = query.order_by(getattr(model, order_field).asc()).all()
+    order_col = getattr(model, order_field)
+
+    rank = func.row_number().over(
+        partition_by=partition_by,
+        order_by=(order_col.asc(), model.id.asc()),
+    )
+
+    ranked = (
+        query.order_by(None)
+        .with_entities(model.id.label("id"), rank.label("rn"))
+        .subquery()
+    )
+
+    db.session.flush()
+    defer_order_constraint(model)
+
+    result = db.session.execute(
+        update(model)
+        .where(model.id == ranked.c.id, order_col.is_distinct_from(ranked.c.rn * step))
+        .values({order_field: ranked.c.rn * step})
+        .execution_options(synchronize_session="fetch")
+    )
+    return result.rowcount
+
+
+def sibling_positions(query, ids, order_field="order"):
+    """
+    Public 1-based position of each row in `ids` among the rows matched by
+    `query` (its live siblings), whatever the stored keys look like. One
+    SELECT, ranked exactly as compact_order would renumber them.
+    """
+    if not ids:
+        return {}
+
+    model = query.column_descriptions[0]["entity"]
+    order_col = getattr(model, order_field)
+
+    rank = func.row_number().over(order_by=(order_col.asc(), model.id.asc()))
+
+    ranked = (
+        query.order_by(None)
+        .with_entities(model.id.label("id"), rank.label("position"))
+        .subquery()
+    )
+
+    rows = db.session.execute(
+        select(ranked.c.id, ranked.c.position).where(ranked.c.id.in_(list(ids)))
+    )
+    return dict(rows.all())
+
+
+def move_row(model, row, *, parent_field, parent_id, before_id=None, after_id=None, order_field="order"):
+    """
+    Place `row` under `parent_id`, directly after `after_id` or before
+    `before_id` (default: last), and return True if the parent should be
+    rebalanced in the background.
+
+    Sparse mode writes a single row: the new key is the midpoint of its
+    neighbours, and the parent is renumbered synchronously only when no
+    key is left between them. Dense mode shifts following siblings and
+    re-compacts the affected parents, one statement each.
+    """
+    parent_col = getattr(model, parent_field)
+    order_col = getattr(model, order_field)
+    source_parent_id = getattr(row, parent_field)
+
+    def siblings():
+        return model.query.filter(
+            parent_col == parent_id,
+            model.deleted_at.is_(None),
+            model.id != row.id,
+        )
+
+    def neighbours():
+        if after_id:
+            low = siblings().filter(model.id == after_id).with_entities(order_col).scalar()
+            if low is None:
+                raise ValueError("Anchor not found")
+            high = siblings().filter(order_col > low).with_entities(func.min(order_col)).scalar()
+        elif before_id:
+            high = siblings().filter(model.id == before_id).with_entities(order_col).scalar()
+            if high is None:
+                raise ValueError("Anchor not found")
+            low = siblings().filter(order_col < high).with_entities(func.max(order_col)).scalar()
+        else:
+            low = siblings().with_entities(func.max(order_col)).scalar()
+            high = None
+        return low or 0, high
+
+    defer_order_constraint(model)
+    low, high = neighbours()
+    needs_rebalance = False
+
+    if sparse_ordering():
+        step = order_step()
+
+        if high is not None and high - low < 2:
+            compact_order(siblings(), order_field=order_field, step=step)
+            low, high = neighbours()
+
+        if high is None:
+            new_order = low + step
+        else:
+            new_order = low + (high - low) // 2
+            min_gap = current_app.config.get("ORDER_REBALANCE_GAP", 4)
+            needs_rebalance = (high - low) // 2 < min_gap
+    else:
+        new_order = low + 1
+        db.session.execute(
+            update(model)
+            .where(
+                parent_col == parent_id,
+                model.deleted_at.is_(None),
+                model.id != row.id,
+                order_col >= new_order,
+            )
+            .values({order_field: order_col + 1})
+            .execution_options(synchronize_session="fetch")
+        )
+
+    setattr(row, parent_field, parent_id)
+    setattr(row, order_field, new_order)
+    db.session.flush()
 
-    for idx, item in enumerate(items, start=1):
-        setattr(item, order_field, idx)
+    if not sparse_ordering():
+        compact_order(
+            model.query.filter(
+                parent_col.in_({parent_id, source_parent_id}),
+                model.deleted_at.is_(None),
+            ),
+            order_field=order_field,
+            partition_by=parent_col,
+        )
 
-    db.session.flush()
\ No newline at end of file
+    return needs_rebalance
@@ -0,0 +1,166 @@
+# app/utils/page_cache.py
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.utils.cache import TTLCache, MISSING
+
+# render() contract: serialized JSON for the given PageVersion, or None
+Render = Callable[[], Optional[str]]
+
+
+class MemoryPageCacheBackend:
+    """Bounded in-process backend (default)."""
+
+    def __init__(self, *, max_size: int = 512, ttl: float = 300.0):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._cache.get(key)
+        return None if value is MISSING else value
+
+    def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._cache.invalidate(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", **self._cache.stats()}
+
+
+class RedisPageCacheBackend:
+    """
+    Shared backend so all workers see the same entries and invalidations.
+
+    Requires the optional `redis` package.
+    """
+
+    def __init__(self, *, url: str, ttl: float = 300.0, prefix: str = "page_cache:"):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "PAGE_CACHE_BACKEND='redis' requires the 'redis' package"
+            ) from exc
+
+        self._client = redis.Redis.from_url(url)
+        self._ttl = int(ttl)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(self._prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        self._client.set(self._prefix + key, value, ex=self._ttl)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis"}
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one execution.
+
+    The first caller runs fn(); callers arriving while it is in flight wait
+    and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "_Call"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+
+
+class PublishedPageCache:
+    """
+    Cache of serialized public page JSON keyed by PageVersion id.
+
+    Which version a slug serves is NOT cached: callers read
+    Page.published_version_id (one indexed lookup) on every request and
+    ask for that version's body. A body never changes once rendered, so
+    entries need no invalidation and every worker (and the Redis backend)
+    stays correct the moment a publish commits. Bodies of superseded
+    versions age out through the backend's TTL/LRU bound.
+    """
+
+    def __init__(self):
+        self.backend: Any = MemoryPageCacheBackend()
+        self._flight = SingleFlight()
+
+    def init_app(self, app) -> None:
+        backend = app.config.get("PAGE_CACHE_BACKEND", "memory")
+        ttl = app.config.get("PAGE_CACHE_TTL", 300)
+
+        if backend == "memory":
+            self.backend = MemoryPageCacheBackend(
+                max_size=app.config.get("PAGE_CACHE_MAX_SIZE", 512),
+                ttl=ttl,
+            )
+        elif backend == "redis":
+            self.backend = RedisPageCacheBackend(
+                url=app.config["PAGE_CACHE_REDIS_URL"],
+                ttl=ttl,
+            )
+        else:
+            raise ValueError(f"Unknown PAGE_CACHE_BACKEND: {backend}")
+
+    def get_or_render(self, version_id: str, render: Render) -> Optional[str]:
+        body = self.backend.get(self._body_key(version_id))
+        if body is not None:
+            return body
+
+        return self._flight.do(version_id, lambda: self._fill(version_id, render))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.backend.stats()
+
+    def _fill(self, version_id: str, render: Render) -> Optional[str]:
+        body = render()
+        if body is not None:
+            self.backend.set(self._body_key(version_id), body)
+        return body
+
+    @staticmethod
+    def _body_key(version_id: str) -> str:
+        return f"body:{version_id}"
+
+
+published_page_cache = PublishedPageCache()
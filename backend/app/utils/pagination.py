@@ -1,13 +1,15 @@
 # app/utils/pagination.py
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Tuple, TypedDict, Type, Any
+import uuid
+from datetime import timedelta
+from typing import Optional, TypedDict, Type, Any
 
 from sqlalchemy.orm import Query
-from sqlalchemy.sql import or_, and_
 from werkzeug.exceptions import BadRequest
 
+from app.utils.ids import uuid7_time
+
 
 class CursorMeta(TypedDict):
     """
@@ -20,36 +22,29 @@ class CursorMeta(TypedDict):
     prev_cursor: Optional[str]
 
 
-def encode_cursor(created_at: datetime, row_id: Any) -> str:
+def encode_cursor(row_id: Any) -> str:
     """
-    Encode a cursor using a stable, deterministic sort key.
-
-    Format: ISO8601|<id>
+    Encode a cursor from a row id.
 
-    Notes:
-    - Human-readable for debugging/admin tooling
-    - Assumes created_at is timezone-consistent across rows
+    Ids are time-ordered UUIDv7s, so the id alone is a stable, unique sort
+    key; the cursor is simply its canonical string form.
     """
-    if not isinstance(created_at, datetime) or row_id is None:
-        raise ValueError("created_at and row_id are required to encode cursor")
+    if row_id is None:
+        raise ValueError("row_id is required to encode cursor")
 
-    return f"{created_at.isoformat()}|{row_id}"
+    return str(row_id)
 
 
-def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+def decode_cursor(cursor: str) -> str:
     """
-    Decode a cursor into (created_at, id).
+    Decode a cursor into a row id.
 
     Raises:
-    - BadRequest if cursor format or timestamp is invalid
+    - BadRequest if the cursor is not a UUID
     """
-    if not cursor or "|" not in cursor:
-        raise BadRequest("Invalid cursor format")
-
     try:
-        ts_str, row_id = cursor.split("|", 1)
-        return datetime.fromisoformat(ts_str), row_id
-    except Exception as exc:
+        return str(uuid.UUID(cursor))
+    except (TypeError, ValueError) as exc:
         # Ensures clean API error instead of 500
         raise BadRequest("Invalid cursor format") from exc
 
@@ -60,47 +55,41 @@ def apply_cursor(
     model: Type[Any],
     cursor: Optional[str],
     direction: str = "next",
+    prune_column: Any = None,
 ) -> Query:
     """
     Apply cursor-based filtering to a SQLAlchemy query.
 
     Ordering contract (MANDATORY):
-      ORDER BY created_at DESC, id DESC
+      ORDER BY id DESC
 
     Direction semantics:
-    - next: fetch records *after* the cursor
-    - prev: fetch records *before* the cursor
+    - next: fetch records *after* the cursor (older)
+    - prev: fetch records *before* the cursor (newer)
+
+    prune_column: a timestamp column whose value always falls in the same
+    millisecond as the id's embedded time (audit_logs.created_at). A range
+    bound on it is added so time-partitioned tables prune partitions.
 
     Required model attributes:
-    - created_at
     - id
     """
     if not cursor:
         return query
 
-    cursor_ts, cursor_id = decode_cursor(cursor)
+    cursor_id = decode_cursor(cursor)
 
     if direction == "next":
-        return query.filter(
-            or_(
-                model.created_at < cursor_ts,
-                and_(
-                    model.created_at == cursor_ts,
-                    model.id < cursor_id,
-                ),
-            )
-        )
+        query = query.filter(model.id < cursor_id)
+        if prune_column is not None:
+            query = query.filter(prune_column < uuid7_time(cursor_id) + timedelta(milliseconds=1))
+        return query
 
     if direction == "prev":
-        return query.filter(
-            or_(
-                model.created_at > cursor_ts,
-                and_(
-                    model.created_at == cursor_ts,
-                    model.id > cursor_id,
-                ),
-            )
-        )
+        query = query.filter(model.id > cursor_id)
+        if prune_column is not None:
+            query = query.filter(prune_column >= uuid7_time(cursor_id))
+        return query
 
     raise BadRequest("Invalid pagination direction")
 
@@ -129,7 +118,6 @@ def paginate_cursor(
 
     # Enforce canonical ordering
     ordered_query = query.order_by(
-        model.created_at.desc(),
         model.id.desc(),
     )
 
@@ -144,13 +132,11 @@ def paginate_cursor(
     if items:
         # Cursor for fetching older records
         if direction == "next" and has_more:
-            last = items[-1]
-            next_cursor = encode_cursor(last.created_at, last.id)
+            next_cursor = encode_cursor(items[-1].id)
 
         # Cursor for fetching newer records
         if direction == "prev":
-            first = items[0]
-            prev_cursor = encode_cursor(first.created_at, first.id)
+            prev_cursor = encode_cursor(items[0].id)
 
     return items, {
         "has_more": has_more,
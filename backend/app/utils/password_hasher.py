@@ -0,0 +1,169 @@
+# app/utils/password_hasher.py
+"""
+Password hashing off the request thread.
+
+werkzeug's KDFs are deliberately slow; run inline, every login pins a
+gunicorn worker thread for the whole hash. With PASSWORD_HASH_MODE="pool"
+hashes run in a small per-worker process pool instead. At most
+PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE hashes are in flight per
+worker; beyond that calls fail fast with PasswordHasherBusy (served as 503)
+rather than queueing behind a login burst or a credential-stuffing run.
+
+Stored hashes whose parameters differ from PASSWORD_HASH_METHOD are
+re-hashed in the same pool call after a successful verification.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+from werkzeug.security import check_password_hash, generate_password_hash
+
+HASH_MODES = ("inline", "pool")
+
+# werkzeug 3.x default, spelled out so stored hashes can be compared to it
+DEFAULT_METHOD = "scrypt:32768:8:1"
+
+
+class PasswordHasherBusy(Exception):
+    """No hashing capacity left (pool saturated or hash timed out)."""
+
+
+def needs_rehash(password_hash: str, method: str) -> bool:
+    """True if `password_hash` was not produced with exactly `method`."""
+    return password_hash.split("$", 1)[0] != method
+
+
+def hash_password(password: str, method: str) -> str:
+    return generate_password_hash(password, method=method)
+
+
+def verify_password(password_hash: str, password: str, method: str) -> Tuple[bool, Optional[str]]:
+    """(valid, replacement hash if the stored one uses outdated parameters)."""
+    if not check_password_hash(password_hash, password):
+        return False, None
+
+    if needs_rehash(password_hash, method):
+        return True, generate_password_hash(password, method=method)
+
+    return True, None
+
+
+class PasswordHasher:
+    def __init__(self):
+        self.mode = "inline"
+        self.method = DEFAULT_METHOD
+        self.workers = 2
+        self.queue_size = 8
+        self.timeout = 5.0
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+
+        self._lock = threading.Lock()
+        self._verified = 0
+        self._rehashed = 0
+        self._rejected = 0
+        self._timeouts = 0
+
+    def init_app(self, app) -> None:
+        self.mode = app.config.get("PASSWORD_HASH_MODE", "inline")
+        self.method = app.config.get("PASSWORD_HASH_METHOD", DEFAULT_METHOD)
+        self.workers = app.config.get("PASSWORD_HASH_WORKERS", 2)
+        self.queue_size = app.config.get("PASSWORD_HASH_QUEUE_SIZE", 8)
+        self.timeout = app.config.get("PASSWORD_HASH_TIMEOUT", 5.0)
+
+        if self.mode not in HASH_MODES:
+            raise ValueError(f"Unknown PASSWORD_HASH_MODE: {self.mode}")
+
+        # "scrypt" alone would never match a stored "scrypt:32768:8:1$..."
+        if self.method.count(":") != 2:
+            raise ValueError("PASSWORD_HASH_METHOD must be fully specified, e.g. scrypt:32768:8:1")
+
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        atexit.register(self.shutdown)
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+    def hash(self, password: str) -> str:
+        return self._run(hash_password, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> Tuple[bool, Optional[str]]:
+        valid, new_hash = self._run(verify_password, password_hash, password, self.method)
+
+        with self._lock:
+            self._verified += 1
+            self._rehashed += new_hash is not None
+
+        return valid, new_hash
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "capacity": self.workers + self.queue_size,
+                "verified": self._verified,
+                "rehashed": self._rehashed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+            }
+
+    def shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------------
+    # Pool
+    # -------------------------------
+    def _pool(self) -> ProcessPoolExecutor:
+        # Created lazily in each gunicorn worker; an executor inherited
+        # through fork (preload_app) is never reused.
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _run(self, fn, *args):
+        if self.mode == "inline":
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise PasswordHasherBusy("Password hashing capacity exhausted")
+
+        try:
+            future = self._pool().submit(fn, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._executor = None
+            raise PasswordHasherBusy("Password hashing pool restarting")
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # The slot is held until the hash really finishes, even after a timeout
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            with self._lock:
+                self._timeouts += 1
+            raise PasswordHasherBusy("Password hashing timed out")
+        except BrokenProcessPool:
+            self._executor = None
+            raise PasswordHasherBusy("Password hashing pool restarting")
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,165 @@
+# app/utils/read_replica.py
+"""
+Read-replica routing with read-your-writes consistency.
+
+Views marked @replica_reads send their plain SELECTs to the "replica" bind
+(REPLICA_DATABASE_URL); everything else, flushes, SELECT ... FOR UPDATE,
+raw SQL and anything after a commit in the same request, stays on the
+primary. Without a replica configured the decorator is a no-op.
+
+Consistency: every request that commits returns the primary's WAL
+position as an X-Consistency-Token header. A client that sends it back on
+a later read is served by the replica only once the replica has replayed
+up to that LSN; until then the read goes to the primary. The replica's
+replay LSN is cached per worker for REPLICA_LSN_CACHE_SECONDS.
+
+Only mark views whose results are not cached server-side: a lagging read
+that fills a shared cache would outlive the lag.
+"""
+import logging
+import threading
+import time
+from functools import wraps
+from typing import Optional
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+REPLICA_BIND = "replica"
+TOKEN_HEADER = "X-Consistency-Token"
+
+# session.info key: route plain SELECTs of this session to the replica
+ROUTE_KEY = "read_replica"
+
+
+def parse_lsn(value: Optional[str]) -> Optional[int]:
+    """Postgres pg_lsn text ("16/B374D848") → comparable int, None if malformed."""
+    try:
+        high, low = value.split("/")
+        return (int(high, 16) << 32) + int(low, 16)
+    except (AttributeError, ValueError):
+        return None
+
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and self.info.get(ROUTE_KEY)
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _after_commit(session):
+    # Reads after our own write must see it: back to the primary
+    session.info.pop(ROUTE_KEY, None)
+    if has_request_context():
+        g.db_committed = True
+
+
+# -------------------------------
+# Replica lag
+# -------------------------------
+
+class ReplicaMonitor:
+    """Per-worker view of how far the replica has replayed."""
+
+    def __init__(self):
+        self.cache_seconds = 0.1
+        self._lock = threading.Lock()
+        self._replayed: Optional[int] = None
+        self._fetched_at = 0.0
+
+    def caught_up(self, engine, token: str) -> bool:
+        target = parse_lsn(token)
+        if target is None:
+            return False  # unreadable token: stay safe on the primary
+
+        replayed = self._replay_lsn(engine, max_age=self.cache_seconds)
+        if replayed is not None and replayed >= target:
+            return True
+
+        # The cached position may just be old; look once more
+        replayed = self._replay_lsn(engine, max_age=0)
+        return replayed is not None and replayed >= target
+
+    def _replay_lsn(self, engine, *, max_age: float) -> Optional[int]:
+        with self._lock:
+            if self._replayed is not None and time.monotonic() - self._fetched_at <= max_age:
+                return self._replayed
+
+        try:
+            with engine.connect() as conn:
+                value = conn.execute(text("SELECT pg_last_wal_replay_lsn()::text")).scalar()
+        except Exception:
+            logger.warning("Replica replay position unavailable", exc_info=True)
+            return None
+
+        replayed = parse_lsn(value)
+        with self._lock:
+            self._replayed, self._fetched_at = replayed, time.monotonic()
+        return replayed
+
+
+replica_monitor = ReplicaMonitor()
+
+
+# -------------------------------
+# Flask wiring
+# -------------------------------
+
+def replica_reads(fn):
+    """
+    Serve this view's plain SELECTs from the replica, unless the client's
+    consistency token has not been replayed there yet. Place it above
+    @jwt_required() so its user lookup is routed too. The tenant lookup runs
+    in a before_request hook, ahead of any view decorator, and always reads
+    from the primary.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        db = current_app.extensions["sqlalchemy"]
+        replica = db.engines.get(REPLICA_BIND)
+
+        if replica is not None:
+            token = request.headers.get(TOKEN_HEADER)
+            if not token or replica_monitor.caught_up(replica, token):
+                db.session.info[ROUTE_KEY] = True
+                g.read_source = REPLICA_BIND
+
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def init_read_replica(app) -> None:
+    replica_monitor.cache_seconds = app.config.get("REPLICA_LSN_CACHE_SECONDS", 0.1)
+
+    if REPLICA_BIND not in app.config.get("SQLALCHEMY_BINDS", {}):
+        return
+
+    @app.after_request
+    def issue_consistency_token(response):
+        if not g.pop("db_committed", False):
+            return response
+
+        db = app.extensions["sqlalchemy"]
+        try:
+            with db.engine.connect() as conn:
+                lsn = conn.execute(text("SELECT pg_current_wal_lsn()::text")).scalar()
+        except Exception:
+            logger.warning("Could not read primary WAL position", exc_info=True)
+            return response
+
+        response.headers[TOKEN_HEADER] = lsn
+        return response
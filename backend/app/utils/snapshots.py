@@ -0,0 +1,293 @@
+# app/utils/snapshots.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import Integer, String, and_, cast, column, func, select, values
+
+from app.utils.cache import TTLCache, MISSING
+
+SECTION_FIELDS = ("type", "order", "settings")
+BLOCK_FIELDS = ("type", "order", "content", "media_url")
+
+# (page_id, version) → reconstructed snapshot. Versions are immutable, so
+# entries never need invalidation; the bound only caps memory.
+snapshot_cache = TTLCache(max_size=256, ttl=3600)
+
+
+# -------------------------------------------------
+# Structural delta encoding
+# -------------------------------------------------
+
+def diff_snapshots(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode `new` as a structural delta against `old`.
+
+    Sections and blocks are matched by id. The delta always carries the
+    section id order; block id lists are only stored for sections whose
+    membership/ordering changed, and field values only where they differ.
+
+    Delta shape:
+    {
+        "page": {...}            # omitted when unchanged
+        "sections": [sid, ...],
+        "section_changes": {sid: {field: value}},
+        "blocks": {sid: [bid, ...]},
+        "block_changes": {bid: {field: value}},
+    }
+    """
+    old_sections = {s["id"]: s for s in old["sections"]}
+    old_blocks = {b["id"]: b for s in old["sections"] for b in s["blocks"]}
+
+    delta: Dict[str, Any] = {
+        "sections": [s["id"] for s in new["sections"]],
+        "section_changes": {},
+        "blocks": {},
+        "block_changes": {},
+    }
+
+    if new["page"] != old["page"]:
+        delta["page"] = new["page"]
+
+    for section in new["sections"]:
+        sid = section["id"]
+        before = old_sections.get(sid)
+
+        changes = _changed_fields(before, section, SECTION_FIELDS)
+        if changes:
+            delta["section_changes"][sid] = changes
+
+        block_ids = [b["id"] for b in section["blocks"]]
+        if before is None or block_ids != [b["id"] for b in before["blocks"]]:
+            delta["blocks"][sid] = block_ids
+
+        for block in section["blocks"]:
+            changes = _changed_fields(old_blocks.get(block["id"]), block, BLOCK_FIELDS)
+            if changes:
+                delta["block_changes"][block["id"]] = changes
+
+    return delta
+
+
+def apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a full snapshot from its base snapshot and delta (base is not mutated)."""
+    base_sections = {s["id"]: s for s in base["sections"]}
+    base_blocks = {b["id"]: b for s in base["sections"] for b in s["blocks"]}
+
+    sections: List[Dict[str, Any]] = []
+    for sid in delta["sections"]:
+        before = base_sections.get(sid, {})
+
+        section = {"id": sid}
+        section.update({f: before[f] for f in SECTION_FIELDS if f in before})
+        section.update(delta["section_changes"].get(sid, {}))
+
+        if sid in delta["blocks"]:
+            block_ids = delta["blocks"][sid]
+        else:
+            block_ids = [b["id"] for b in before.get("blocks", [])]
+
+        section["blocks"] = [
+            {"id": bid, **_without_id(base_blocks.get(bid, {})), **delta["block_changes"].get(bid, {})}
+            for bid in block_ids
+        ]
+        sections.append(section)
+
+    return {
+        "page": delta.get("page", base["page"]),
+        "sections": sections,
+    }
+
+
+def _changed_fields(before: Optional[Dict[str, Any]], after: Dict[str, Any], fields) -> Dict[str, Any]:
+    if before is None:
+        return {f: after.get(f) for f in fields}
+
+    return {f: after.get(f) for f in fields if before.get(f) != after.get(f)}
+
+
+def _without_id(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in data.items() if k != "id"}
+
+
+# -------------------------------------------------
+# PageVersion storage
+# -------------------------------------------------
+
+def is_keyframe(version_number: int) -> bool:
+    """Full snapshot every SNAPSHOT_KEYFRAME_INTERVAL versions (1, N+1, 2N+1, ...)."""
+    if current_app.config.get("SNAPSHOT_STORAGE", "delta") != "delta":
+        return True
+
+    interval = current_app.config.get("SNAPSHOT_KEYFRAME_INTERVAL", 10)
+    return interval <= 1 or (version_number - 1) % interval == 0
+
+
+def store_snapshot(version, snapshot: Dict[str, Any], previous: Any = MISSING) -> None:
+    """
+    Persist `snapshot` on a new PageVersion as a keyframe or as a delta
+    against the previous version. version.version must already be set.
+
+    Callers that already loaded the previous full snapshot (e.g. with
+    get_snapshots for a batch) pass it as `previous`; None stores a keyframe.
+    """
+    if is_keyframe(version.version):
+        previous = None
+    elif previous is MISSING:
+        previous = get_snapshot(version.page_id, version.version - 1)
+
+    if previous is None:
+        version.snapshot_data = snapshot
+        version.storage = "full"
+        version.base_version = None
+        return
+
+    version.snapshot_data = diff_snapshots(previous, snapshot)
+    version.storage = "delta"
+    version.base_version = version.version - 1
+
+
+def load_snapshot(version) -> Dict[str, Any]:
+    """Full snapshot of a PageVersion, reconstructing deltas as needed."""
+    if version.storage != "delta":
+        return version.snapshot_data
+
+    return get_snapshot(version.page_id, version.version)
+
+
+def get_snapshot(page_id: str, version_number: int) -> Optional[Dict[str, Any]]:
+    """
+    Full snapshot for (page, version), or None if the version does not exist.
+
+    Loads the chain from the nearest keyframe in one query and replays
+    deltas; results are kept in snapshot_cache.
+
+    Returned snapshots are shared with the cache and must be treated as
+    read-only.
+    """
+    cached = snapshot_cache.get((page_id, version_number))
+    if cached is not MISSING:
+        return cached
+
+    from app.extensions import db
+    from app.models.page_version import PageVersion
+
+    keyframe = (
+        db.session.query(db.func.max(PageVersion.version))
+        .filter(
+            PageVersion.page_id == page_id,
+            PageVersion.version <= version_number,
+            PageVersion.storage == "full",
+        )
+        .scalar_subquery()
+    )
+
+    chain = (
+        db.session.query(PageVersion.version, PageVersion.storage, PageVersion.snapshot_data)
+        .filter(
+            PageVersion.page_id == page_id,
+            PageVersion.version >= keyframe,
+            PageVersion.version <= version_number,
+        )
+        .order_by(PageVersion.version.asc())
+        .all()
+    )
+
+    if not chain or chain[-1].version != version_number:
+        return None
+
+    snapshot = _replay(chain)
+    snapshot_cache.set((page_id, version_number), snapshot)
+    return snapshot
+
+
+def get_snapshots(targets: Dict[str, int]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    get_snapshot for many pages at once: {page_id: version} → {page_id: snapshot}.
+
+    The chains of all uncached targets are loaded in a single query, each
+    from its own nearest keyframe. Same read-only caveat as get_snapshot.
+    """
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    misses: Dict[str, int] = {}
+
+    for page_id, version_number in targets.items():
+        cached = snapshot_cache.get((page_id, version_number))
+        if cached is MISSING:
+            misses[page_id] = version_number
+        else:
+            results[page_id] = cached
+
+    if not misses:
+        return results
+
+    from app.extensions import db
+    from app.models.page_version import PageVersion
+
+    wanted = values(
+        column("page_id", String),
+        column("version", Integer),
+        name="wanted",
+    ).data(list(misses.items()))
+
+    # VALUES literals are text to Postgres
+    wanted_page_id = cast(wanted.c.page_id, PageVersion.page_id.type)
+
+    keyframes = (
+        select(
+            wanted_page_id.label("page_id"),
+            wanted.c.version.label("target"),
+            func.max(PageVersion.version).label("keyframe"),
+        )
+        .join(
+            PageVersion,
+            and_(
+                PageVersion.page_id == wanted_page_id,
+                PageVersion.version <= wanted.c.version,
+                PageVersion.storage == "full",
+            ),
+        )
+        .group_by(wanted_page_id, wanted.c.version)
+        .subquery()
+    )
+
+    rows = db.session.execute(
+        select(PageVersion.page_id, PageVersion.version, PageVersion.storage, PageVersion.snapshot_data)
+        .join(
+            keyframes,
+            and_(
+                PageVersion.page_id == keyframes.c.page_id,
+                PageVersion.version >= keyframes.c.keyframe,
+                PageVersion.version <= keyframes.c.target,
+            ),
+        )
+        .order_by(PageVersion.page_id, PageVersion.version)
+    ).all()
+
+    chains: Dict[str, List[Any]] = {}
+    for row in rows:
+        chains.setdefault(row.page_id, []).append(row)
+
+    for page_id, version_number in misses.items():
+        chain = chains.get(page_id)
+        if not chain or chain[-1].version != version_number:
+            results[page_id] = None
+            continue
+
+        results[page_id] = _replay(chain)
+        snapshot_cache.set((page_id, version_number), results[page_id])
+
+    return results
+
+
+def _replay(chain) -> Dict[str, Any]:
+    """Fold a keyframe-first chain of (storage, snapshot_data) rows."""
+    snapshot = None
+    for row in chain:
+        if row.storage == "full":
+            snapshot = row.snapshot_data
+        else:
+            snapshot = apply_delta(snapshot, row.snapshot_data)
+
+    return snapshot
@@ -0,0 +1,228 @@
+# app/utils/sql_metrics.py
+"""
+Per-request SQL instrumentation.
+
+Engine events time every statement run while a collector is active on the
+current thread. Each request gets one: its statement count, total DB time
+and slowest statement go out as a Server-Timing header (shown by browser
+devtools) and as one structured log line:
+
+    Server-Timing: db;dur=12.4;desc="7 queries", db-slowest;dur=5.1, app;dur=31.0
+
+@query_budget(n) declares the most statements a view may run. With
+SQL_QUERY_BUDGET_ENFORCE on (tests/CI) going over raises
+QueryBudgetExceeded, so an N+1 regression fails the build; otherwise it is
+logged as a warning. Only the view itself is budgeted, not before_request
+hooks. assert_max_queries(n) does the same around any block of test code,
+including test-client requests made inside it.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Iterator, List, Optional
+from flask import current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# conn.info key: start times of statements in flight on that connection
+START_KEY = "sql_metrics_start"
+
+SLOWEST_STATEMENT_CHARS = 300
+
+_local = threading.local()
+_listening = False
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    __slots__ = ("count", "total", "slowest", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed >= self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total * 1000, 2),
+            "slowest_ms": round(self.slowest * 1000, 2),
+            "slowest_statement": (self.slowest_statement or "")[:SLOWEST_STATEMENT_CHARS] or None,
+        }
+
+
+# -------------------------------
+# Collectors
+# -------------------------------
+
+def _collectors() -> List[QueryStats]:
+    stack = getattr(_local, "collectors", None)
+    if stack is None:
+        stack = _local.collectors = []
+    return stack
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """Count statements executed on this thread inside the block."""
+    stats = QueryStats()
+    _collectors().append(stats)
+    try:
+        yield stats
+    finally:
+        _collectors().remove(stats)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """Test helper: fail if the block runs more than `max_queries` statements."""
+    with collect_queries() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(_budget_message("block", stats, max_queries))
+
+
+def query_budget(max_queries: int):
+    """
+    Declare the most statements a view may run. Place it directly under the
+    route decorator: it then counts the view and every decorator below it,
+    including @jwt_required()'s user lookup on a cold user_cache. The tenant
+    lookup runs in a before_request hook, ahead of any view decorator, and is
+    not counted; g.sql_stats (Server-Timing) covers the whole request.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with collect_queries() as stats:
+                result = fn(*args, **kwargs)
+
+            if stats.count > max_queries:
+                message = _budget_message(request.endpoint or fn.__name__, stats, max_queries)
+                if current_app.config.get("SQL_QUERY_BUDGET_ENFORCE", False):
+                    raise QueryBudgetExceeded(message)
+                logger.warning(message, extra={"sql": stats.as_dict()})
+
+            return result
+
+        wrapper.query_budget = max_queries
+        return wrapper
+    return decorator
+
+
+def _budget_message(name: str, stats: QueryStats, max_queries: int) -> str:
+    return (
+        f"{name} ran {stats.count} queries (budget {max_queries}); "
+        f"slowest: {(stats.slowest_statement or '')[:SLOWEST_STATEMENT_CHARS]}"
+    )
+
+
+# -------------------------------
+# Engine events
+# -------------------------------
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _collectors():
+        conn.info.setdefault(START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(START_KEY)
+    if not starts:
+        return
+
+    elapsed = time.perf_counter() - starts.pop()
+    for stats in _collectors():
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(START_KEY):
+        conn.info[START_KEY].pop()
+
+
+def _listen() -> None:
+    global _listening
+    if _listening:
+        return
+
+    # On the Engine class, so replica engines are covered too
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _listening = True
+
+
+# -------------------------------
+# Flask wiring
+# -------------------------------
+
+def init_sql_metrics(app) -> None:
+    if not app.config.get("SQL_INSTRUMENTATION", True):
+        return
+
+    _listen()
+
+    server_timing = app.config.get("SQL_SERVER_TIMING", True)
+    slow_db_ms = app.config.get("SQL_SLOW_DB_MS", 200)
+
+    @app.before_request
+    def start_sql_metrics():
+        g.sql_stats = QueryStats()
+        g.sql_started = time.perf_counter()
+        _collectors().append(g.sql_stats)
+
+    @app.after_request
+    def report_sql_metrics(response):
+        stats = g.get("sql_stats")
+        if stats is None:
+            return response
+
+        app_ms = (time.perf_counter() - g.sql_started) * 1000
+        record = {
+            "method": request.method,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "app_ms": round(app_ms, 2),
+            "read_source": g.get("read_source", "primary"),
+            **stats.as_dict(),
+        }
+
+        if server_timing:
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={record["db_ms"]};desc="{stats.count} queries", '
+                f'db-slowest;dur={record["slowest_ms"]}, app;dur={record["app_ms"]}',
+            )
+
+        level = logging.WARNING if record["db_ms"] >= slow_db_ms else logging.INFO
+        logger.log(
+            level,
+            "%s %s: %d queries, %.1f ms db, %.1f ms slowest",
+            request.method, request.path, stats.count, record["db_ms"], record["slowest_ms"],
+            extra={"sql": record},
+        )
+        return response
+
+    @app.teardown_request
+    def stop_sql_metrics(exc):
+        stats = g.pop("sql_stats", None)
+        if stats is not None and stats in _collectors():
+            _collectors().remove(stats)
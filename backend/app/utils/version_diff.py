@@ -0,0 +1,212 @@
+# app/utils/version_diff.py
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from app.extensions import db
+from app.utils.cache import TTLCache, MISSING
+from app.utils.snapshots import SECTION_FIELDS, BLOCK_FIELDS, get_snapshot
+
+# (tenant_id, page_id, a, b) → diff. Versions are immutable, so a computed
+# diff never goes stale.
+version_diff_cache = TTLCache(max_size=256, ttl=3600)
+
+PAGE_FIELDS = ("title", "slug", "seo", "status")
+
+
+def get_version_diff(
+    *,
+    tenant_id: str,
+    page_id: str,
+    from_version: int,
+    to_version: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Diff between two versions of a page, or None if either does not exist
+    for this tenant. Results are cached per (a, b) pair.
+    """
+    key = (tenant_id, page_id, from_version, to_version)
+
+    cached = version_diff_cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    from app.models.page_version import PageVersion
+
+    found = {
+        version
+        for (version,) in db.session.query(PageVersion.version).filter(
+            PageVersion.tenant_id == tenant_id,
+            PageVersion.page_id == page_id,
+            PageVersion.version.in_([from_version, to_version]),
+        )
+    }
+
+    if found != {from_version, to_version}:
+        return None
+
+    diff = {
+        "page_id": page_id,
+        "from_version": from_version,
+        "to_version": to_version,
+        **diff_page_snapshots(
+            get_snapshot(page_id, from_version),
+            get_snapshot(page_id, to_version),
+        ),
+    }
+
+    version_diff_cache.set(key, diff)
+    return diff
+
+
+def diff_page_snapshots(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keyed tree diff between two page snapshots.
+
+    Sections and blocks are matched by id. Reports inserts, deletes,
+    moves (reordering within a parent, or a block changing section) and
+    field-level changes. Moves are the minimal set: items outside the
+    longest run that kept its relative order.
+
+    Runs in O(n log n) over the number of sections and blocks, not O(n):
+    the minimal move set is a longest increasing subsequence, which has no
+    known linear algorithm. The linear alternative, flagging every item whose
+    index changed, reports one moved block as every sibling after it
+    moving. The log factor is over one parent's children and is negligible
+    next to loading the two snapshots.
+    """
+    old_sections = {s["id"]: s for s in old["sections"]}
+    new_sections = {s["id"]: s for s in new["sections"]}
+
+    old_blocks = {b["id"]: (s["id"], b) for s in old["sections"] for b in s["blocks"]}
+    new_blocks = {b["id"]: (s["id"], b) for s in new["sections"] for b in s["blocks"]}
+
+    sections = _empty_changes()
+    blocks = _empty_changes()
+
+    # -------------------------------
+    # Sections
+    # -------------------------------
+    old_order = _ordered_ids(old["sections"])
+    new_order = _ordered_ids(new["sections"])
+    stable = _stable_ids(old_order, new_order)
+
+    for sid in new_order:
+        section = new_sections[sid]
+        before = old_sections.get(sid)
+
+        if before is None:
+            sections["inserted"].append(_summary(section, SECTION_FIELDS))
+            continue
+
+        if sid not in stable:
+            sections["moved"].append({
+                "id": sid,
+                "from_order": before.get("order"),
+                "to_order": section.get("order"),
+            })
+
+        fields = _field_changes(before, section, SECTION_FIELDS)
+        if fields:
+            sections["changed"].append({"id": sid, "fields": fields})
+
+    for sid in old_order:
+        if sid not in new_sections:
+            sections["deleted"].append(_summary(old_sections[sid], SECTION_FIELDS))
+
+    # -------------------------------
+    # Blocks
+    # -------------------------------
+    stable_blocks: Set[str] = set()
+    for sid, section in new_sections.items():
+        if sid in old_sections:
+            stable_blocks |= _stable_ids(
+                _ordered_ids(old_sections[sid]["blocks"]),
+                _ordered_ids(section["blocks"]),
+            )
+
+    for sid in new_order:
+        for bid in _ordered_ids(new_sections[sid]["blocks"]):
+            _, block = new_blocks[bid]
+            previous = old_blocks.get(bid)
+
+            if previous is None:
+                blocks["inserted"].append({"section_id": sid, **_summary(block, BLOCK_FIELDS)})
+                continue
+
+            old_sid, before = previous
+            if old_sid != sid or bid not in stable_blocks:
+                blocks["moved"].append({
+                    "id": bid,
+                    "from_section_id": old_sid,
+                    "to_section_id": sid,
+                    "from_order": before.get("order"),
+                    "to_order": block.get("order"),
+                })
+
+            fields = _field_changes(before, block, BLOCK_FIELDS)
+            if fields:
+                blocks["changed"].append({"id": bid, "section_id": sid, "fields": fields})
+
+    for bid, (old_sid, block) in old_blocks.items():
+        if bid not in new_blocks:
+            blocks["deleted"].append({"section_id": old_sid, **_summary(block, BLOCK_FIELDS)})
+
+    return {
+        "page": _field_changes(old["page"], new["page"], PAGE_FIELDS),
+        "sections": sections,
+        "blocks": blocks,
+    }
+
+
+def _empty_changes() -> Dict[str, List[Dict[str, Any]]]:
+    return {"inserted": [], "deleted": [], "moved": [], "changed": []}
+
+
+def _ordered_ids(items: Sequence[Dict[str, Any]]) -> List[str]:
+    return [item["id"] for item in sorted(items, key=lambda i: i.get("order") or 0)]
+
+
+def _summary(item: Dict[str, Any], fields) -> Dict[str, Any]:
+    return {"id": item["id"], **{f: item.get(f) for f in fields}}
+
+
+def _field_changes(before: Dict[str, Any], after: Dict[str, Any], fields) -> Dict[str, Any]:
+    """Field-level changes; `order` is reported through moves instead."""
+    return {
+        f: {"from": before.get(f), "to": after.get(f)}
+        for f in fields
+        if f != "order" and before.get(f) != after.get(f)
+    }
+
+
+def _stable_ids(old_ids: Sequence[str], new_ids: Sequence[str]) -> Set[str]:
+    """
+    Ids that kept their relative order: the longest increasing subsequence
+    of old positions, taken in new order (patience sorting, O(n log n)).
+    """
+    old_pos = {item_id: i for i, item_id in enumerate(old_ids)}
+    seq = [(old_pos[item_id], item_id) for item_id in new_ids if item_id in old_pos]
+
+    tails: List[int] = []      # smallest tail position per LIS length
+    tail_idx: List[int] = []   # index into seq of that tail
+    parent: List[int] = [-1] * len(seq)
+
+    for i, (pos, _) in enumerate(seq):
+        k = bisect_left(tails, pos)
+        if k == len(tails):
+            tails.append(pos)
+            tail_idx.append(i)
+        else:
+            tails[k] = pos
+            tail_idx[k] = i
+        parent[i] = tail_idx[k - 1] if k > 0 else -1
+
+    stable: Set[str] = set()
+    i = tail_idx[-1] if tail_idx else -1
+    while i != -1:
+        stable.add(seq[i][1])
+        i = parent[i]
+
+    return stable
@@ -29,12 +29,32 @@ def snapshot_page(page):
     }
 
 def next_version(page_id, tenant_id):
-    from app.models.page_version import PageVersion
-
-    last = (
-        PageVersion.query
-        .filter_by(page_id=page_id, tenant_id=tenant_id)
-        .order_by(PageVersion.version.desc())
-        .first()
-    )
-    return (last.version + 1) if last else 1
\ No newline at end of file
+    versions = allocate_versions([page_id], tenant_id)
+
+    if page_id not in versions:
+        raise ValueError("Page not found")
+
+    return versions[page_id]
+
+def allocate_versions(page_ids, tenant_id):
+    """
+    Atomically allocate the next version number for each page.
+
+    One UPDATE ... RETURNING on pages.version_counter: the row lock it takes
+    serializes concurrent publishers until commit, so two transactions can
+    never hand out the same number (no retries on uq_page_version).
+    """
+    from sqlalchemy import update
+    from app.extensions import db
+    from app.models.page import Page
+
+    pages = Page.__table__
+
+    rows = db.session.execute(
+        update(pages)
+        .where(pages.c.id.in_(page_ids), pages.c.tenant_id == tenant_id)
+        .values(version_counter=pages.c.version_counter + 1)
+        .returning(pages.c.id, pages.c.version_counter)
+    ).all()
+
+    return dict(rows)
\ No newline at end of file
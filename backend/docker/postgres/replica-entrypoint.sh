@@ -0,0 +1,13 @@
+#!/bin/bash
+# Hot standby of the `db` service, cloned with pg_basebackup on first start.
+set -e
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_isready -h db -U "$POSTGRES_USER"; do sleep 1; done
+    PGPASSWORD="$POSTGRES_PASSWORD" pg_basebackup \
+        -h db -U "$POSTGRES_USER" -D "$PGDATA" \
+        --write-recovery-conf --wal-method=stream --checkpoint=fast
+    chmod 0700 "$PGDATA"
+fi
+
+exec postgres -c hot_standby=on
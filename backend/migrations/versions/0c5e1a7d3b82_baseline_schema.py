@@ -0,0 +1,171 @@
+"""baseline schema
+
+Revision ID: 0c5e1a7d3b82
+Revises: 
+Create Date: 2026-10-17 09:05:10.412736
+
+The schema as it stood before the first migration, when tables were
+created with db.create_all(). Databases created that way already have
+it: run `flask db stamp 0c5e1a7d3b82` once before `flask db upgrade`.
+
+tenant_id references tenants.id (the models then pointed at a
+non-existent "tenant" table, which create_all could not have built).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0c5e1a7d3b82'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# BaseModel: every table indexes id, created_at and updated_at
+INDEXED_BASE_COLUMNS = ('id', 'created_at', 'updated_at')
+
+
+def _base_columns():
+    return [
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    ]
+
+
+def _tenant_id():
+    return sa.Column('tenant_id', sa.String(36), sa.ForeignKey('tenants.id'), nullable=False)
+
+
+def _create_indexes(table, columns):
+    for column in columns:
+        op.create_index(f'ix_{table}_{column}', table, [column])
+
+
+def upgrade():
+    op.create_table(
+        'tenants',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('slug', sa.String(255), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        *[
+            sa.Column(f'enable_{feature}', sa.Boolean(), nullable=True)
+            for feature in (
+                'ecommerce', 'bookings', 'cms', 'roles', 'sso', '2fa', 'blog', 'newsletter',
+                'seo_tools', 'analytics', 'subscriptions', 'coupons', 'inventory', 'shipping',
+                'calendar_sync', 'appointments', 'notifications', 'ai_assistant',
+                'multilingual', 'api_access',
+            )
+        ],
+        sa.Column('features', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_tenants_id', 'tenants', ['id'])
+    op.create_index('ix_tenants_slug', 'tenants', ['slug'], unique=True)
+
+    op.create_table(
+        'users',
+        *_base_columns(),
+        _tenant_id(),
+        sa.Column('email', sa.String(120), nullable=False),
+        sa.Column('password_hash', sa.String(128), nullable=False),
+        sa.Column('last_login_at', sa.DateTime(), nullable=True),
+        sa.Column('role', sa.String(50), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.UniqueConstraint('tenant_id', 'email', name='uq_user_email_per_tenant'),
+    )
+    _create_indexes('users', INDEXED_BASE_COLUMNS + ('tenant_id', 'role'))
+
+    op.create_table(
+        'pages',
+        *_base_columns(),
+        _tenant_id(),
+        sa.Column('title', sa.String(200), nullable=False),
+        sa.Column('slug', sa.String(200), nullable=False),
+        sa.Column('status', sa.String(50), nullable=True),
+        sa.Column('seo', sa.JSON(), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('tenant_id', 'slug', name='uq_page_slug_per_tenant'),
+    )
+    _create_indexes('pages', INDEXED_BASE_COLUMNS + ('tenant_id', 'slug', 'status', 'deleted_at'))
+
+    op.create_table(
+        'sections',
+        *_base_columns(),
+        _tenant_id(),
+        sa.Column('page_id', sa.String(36), sa.ForeignKey('pages.id'), nullable=False),
+        sa.Column('type', sa.String(100), nullable=False),
+        sa.Column('order', sa.Integer(), nullable=False),
+        sa.Column('settings', sa.JSON(), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('page_id', 'order', name='uq_page_section_order'),
+    )
+    _create_indexes('sections', INDEXED_BASE_COLUMNS + ('tenant_id', 'page_id', 'order', 'deleted_at'))
+    op.create_index('idx_section_page_order', 'sections', ['page_id', 'order'])
+
+    op.create_table(
+        'blocks',
+        *_base_columns(),
+        _tenant_id(),
+        sa.Column('section_id', sa.String(36), sa.ForeignKey('sections.id'), nullable=False),
+        sa.Column('type', sa.String(100), nullable=False),
+        sa.Column('order', sa.Integer(), nullable=False),
+        sa.Column('content', sa.JSON(), nullable=True),
+        sa.Column('media_url', sa.String(512), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('section_id', 'order', name='uq_section_block_order'),
+    )
+    _create_indexes('blocks', INDEXED_BASE_COLUMNS + ('tenant_id', 'section_id', 'order', 'deleted_at'))
+    op.create_index('idx_block_section_order', 'blocks', ['section_id', 'order'])
+
+    op.create_table(
+        'page_versions',
+        *_base_columns(),
+        _tenant_id(),
+        sa.Column('page_id', sa.String(36), sa.ForeignKey('pages.id'), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('snapshot', sa.JSON(), nullable=False),
+        sa.Column('created_by', sa.String(36), nullable=True),
+        sa.UniqueConstraint('page_id', 'version', name='uq_page_version'),
+    )
+    _create_indexes('page_versions', INDEXED_BASE_COLUMNS + ('tenant_id', 'page_id', 'version'))
+    op.create_index('idx_page_version_page', 'page_versions', ['page_id'])
+
+    op.create_table(
+        'page_drafts',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        _tenant_id(),
+        sa.Column('page_id', sa.String(36), sa.ForeignKey('pages.id'), nullable=False),
+        sa.Column('snapshot', sa.JSON(), nullable=False),
+        sa.Column('updated_by', sa.String(36), nullable=False),
+    )
+    _create_indexes('page_drafts', INDEXED_BASE_COLUMNS + ('tenant_id', 'page_id'))
+
+    op.create_table(
+        'audit_logs',
+        *_base_columns(),
+        _tenant_id(),
+        sa.Column('actor_id', sa.String(36), nullable=False),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('entity_type', sa.String(50), nullable=False),
+        sa.Column('entity_id', sa.String(36), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+    )
+    _create_indexes(
+        'audit_logs',
+        INDEXED_BASE_COLUMNS + ('tenant_id', 'actor_id', 'action', 'entity_type', 'entity_id'),
+    )
+    op.create_index('ix_audit_cursor', 'audit_logs', ['tenant_id', 'created_at', 'id'])
+    op.create_index('ix_audit_actor_action', 'audit_logs', ['tenant_id', 'actor_id', 'action'])
+
+
+def downgrade():
+    for table in (
+        'audit_logs', 'page_drafts', 'page_versions', 'blocks', 'sections', 'pages', 'users', 'tenants',
+    ):
+        op.drop_table(table)
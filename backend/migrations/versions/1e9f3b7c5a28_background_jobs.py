@@ -0,0 +1,50 @@
+"""background jobs
+
+Revision ID: 1e9f3b7c5a28
+Revises: 4c8d2f6a1b93
+Create Date: 2026-10-17 15:44:19.036527
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1e9f3b7c5a28'
+down_revision = '4c8d2f6a1b93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('tenant_id', sa.String(36), sa.ForeignKey('tenants.id'), nullable=False),
+        sa.Column('type', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('progress_done', sa.Integer(), nullable=False),
+        sa.Column('progress_total', sa.Integer(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+        sa.Column('created_by', sa.String(36), nullable=True),
+        sa.Column('worker_id', sa.String(100), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+    )
+
+    op.create_index('ix_jobs_id', 'jobs', ['id'])
+    op.create_index('ix_jobs_created_at', 'jobs', ['created_at'])
+    op.create_index('ix_jobs_updated_at', 'jobs', ['updated_at'])
+    op.create_index('ix_jobs_tenant_id', 'jobs', ['tenant_id'])
+
+    # Claim query: oldest queued job first
+    op.create_index('ix_job_status_created', 'jobs', ['status', 'created_at'])
+
+
+def downgrade():
+    op.drop_table('jobs')
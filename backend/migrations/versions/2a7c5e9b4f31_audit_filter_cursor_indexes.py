@@ -0,0 +1,52 @@
+"""audit filter cursor indexes
+
+Revision ID: 2a7c5e9b4f31
+Revises: 9d3a6f1e2c48
+Create Date: 2026-10-17 15:02:37.118492
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '2a7c5e9b4f31'
+down_revision = '9d3a6f1e2c48'
+branch_labels = None
+depends_on = None
+
+REDUNDANT_INDEXES = {
+    'ix_audit_logs_id': ['id'],
+    'ix_audit_logs_created_at': ['created_at'],
+    'ix_audit_logs_updated_at': ['updated_at'],
+    'ix_audit_logs_tenant_id': ['tenant_id'],
+    'ix_audit_logs_actor_id': ['actor_id'],
+    'ix_audit_logs_action': ['action'],
+    'ix_audit_logs_entity_type': ['entity_type'],
+    'ix_audit_logs_entity_id': ['entity_id'],
+    'ix_audit_actor_action': ['tenant_id', 'actor_id', 'action'],
+}
+
+CURSOR_INDEXES = {
+    'ix_audit_entity_type_cursor': ['tenant_id', 'entity_type', 'created_at', 'id'],
+    'ix_audit_entity_cursor': ['tenant_id', 'entity_id', 'created_at', 'id'],
+    'ix_audit_actor_cursor': ['tenant_id', 'actor_id', 'created_at', 'id'],
+    'ix_audit_action_cursor': ['tenant_id', 'action', 'created_at', 'id'],
+    'ix_audit_actor_action_cursor': ['tenant_id', 'actor_id', 'action', 'created_at', 'id'],
+}
+
+
+def upgrade():
+    # Created on the partitioned parent, so every partition gets its own copy
+    for name, columns in CURSOR_INDEXES.items():
+        op.create_index(name, 'audit_logs', columns)
+
+    for name in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name='audit_logs')
+
+
+def downgrade():
+    for name, columns in REDUNDANT_INDEXES.items():
+        op.create_index(name, 'audit_logs', columns)
+
+    for name in CURSOR_INDEXES:
+        op.drop_index(name, table_name='audit_logs')
@@ -0,0 +1,41 @@
+"""page version counter
+
+Revision ID: 3f6a9c1d2b7e
+Revises: 0c5e1a7d3b82
+Create Date: 2026-10-17 09:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6a9c1d2b7e'
+down_revision = '0c5e1a7d3b82'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'pages',
+        sa.Column('version_counter', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # Seed counters from existing history so allocation continues after it
+    op.execute(
+        """
+        UPDATE pages p
+        SET version_counter = v.max_version
+        FROM (
+            SELECT page_id, MAX(version) AS max_version
+            FROM page_versions
+            GROUP BY page_id
+        ) v
+        WHERE v.page_id = p.id
+        """
+    )
+
+
+def downgrade():
+    op.drop_column('pages', 'version_counter')
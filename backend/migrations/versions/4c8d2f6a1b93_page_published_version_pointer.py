@@ -0,0 +1,46 @@
+"""page published version pointer
+
+Revision ID: 4c8d2f6a1b93
+Revises: 2a7c5e9b4f31
+Create Date: 2026-10-17 15:31:48.260193
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c8d2f6a1b93'
+down_revision = '2a7c5e9b4f31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('pages', sa.Column('published_version_id', sa.String(36), nullable=True))
+    op.create_foreign_key(
+        'fk_page_published_version', 'pages', 'page_versions',
+        ['published_version_id'], ['id'],
+    )
+
+    # Live published pages point at their latest published version
+    op.execute(
+        """
+        UPDATE pages p
+        SET published_version_id = v.id
+        FROM (
+            SELECT DISTINCT ON (page_id) page_id, id
+            FROM page_versions
+            WHERE status = 'published'
+            ORDER BY page_id, version DESC
+        ) v
+        WHERE v.page_id = p.id
+          AND p.status = 'published'
+          AND p.deleted_at IS NULL
+        """
+    )
+
+
+def downgrade():
+    op.drop_constraint('fk_page_published_version', 'pages', type_='foreignkey')
+    op.drop_column('pages', 'published_version_id')
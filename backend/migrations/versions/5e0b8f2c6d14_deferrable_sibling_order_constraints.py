@@ -0,0 +1,37 @@
+"""deferrable sibling order constraints
+
+Revision ID: 5e0b8f2c6d14
+Revises: c41d7e93a5f2
+Create Date: 2026-10-17 12:08:51.227640
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b8f2c6d14'
+down_revision = 'c41d7e93a5f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_constraint('uq_page_section_order', 'sections', type_='unique')
+    op.create_unique_constraint(
+        'uq_page_section_order', 'sections', ['page_id', 'order'],
+        deferrable=True, initially='IMMEDIATE',
+    )
+
+    op.drop_constraint('uq_section_block_order', 'blocks', type_='unique')
+    op.create_unique_constraint(
+        'uq_section_block_order', 'blocks', ['section_id', 'order'],
+        deferrable=True, initially='IMMEDIATE',
+    )
+
+
+def downgrade():
+    op.drop_constraint('uq_section_block_order', 'blocks', type_='unique')
+    op.create_unique_constraint('uq_section_block_order', 'blocks', ['section_id', 'order'])
+
+    op.drop_constraint('uq_page_section_order', 'sections', type_='unique')
+    op.create_unique_constraint('uq_page_section_order', 'sections', ['page_id', 'order'])
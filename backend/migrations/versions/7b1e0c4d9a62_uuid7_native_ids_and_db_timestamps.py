@@ -0,0 +1,219 @@
+"""uuid7 native ids and db timestamps
+
+Revision ID: 7b1e0c4d9a62
+Revises: 1e9f3b7c5a28
+Create Date: 2026-10-17 16:40:12.502881
+
+Re-keys every table from random UUIDv4 strings to native UUIDv7 values
+minted from each row's created_at, so existing rows sort by creation time
+under id-only keyset pagination. References (FK columns, actor/creator
+columns, audit entity_id) and ids embedded in JSON documents (version
+snapshots, drafts, job payloads/results, audit payloads) are rewritten
+through the same mapping.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b1e0c4d9a62'
+down_revision = '1e9f3b7c5a28'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'tenants', 'users', 'pages', 'sections', 'blocks',
+    'page_versions', 'page_drafts', 'jobs', 'audit_logs',
+]
+
+# (table, column) converted to uuid through the id map
+ID_COLUMNS = [(table, 'id') for table in TABLES] + [
+    (table, 'tenant_id') for table in TABLES if table != 'tenants'
+] + [
+    ('sections', 'page_id'),
+    ('blocks', 'section_id'),
+    ('page_versions', 'page_id'),
+    ('page_versions', 'created_by'),
+    ('page_drafts', 'page_id'),
+    ('page_drafts', 'updated_by'),
+    ('pages', 'published_version_id'),
+    ('jobs', 'created_by'),
+    ('audit_logs', 'actor_id'),
+]
+
+JSON_COLUMNS = [
+    ('page_versions', 'snapshot'),
+    ('page_drafts', 'snapshot'),
+    ('jobs', 'payload'),
+    ('jobs', 'result'),
+    ('audit_logs', 'payload'),
+]
+
+# (table, column, referenced table, constraint name)
+FOREIGN_KEYS = [(table, 'tenant_id', 'tenants', f'fk_{table}_tenant_id') for table in TABLES if table != 'tenants'] + [
+    ('sections', 'page_id', 'pages', 'fk_sections_page_id'),
+    ('blocks', 'section_id', 'sections', 'fk_blocks_section_id'),
+    ('page_versions', 'page_id', 'pages', 'fk_page_versions_page_id'),
+    ('page_drafts', 'page_id', 'pages', 'fk_page_drafts_page_id'),
+    ('pages', 'published_version_id', 'page_versions', 'fk_page_published_version'),
+]
+
+AUDIT_CURSOR_INDEXES = {
+    'ix_audit_cursor': ['tenant_id'],
+    'ix_audit_entity_type_cursor': ['tenant_id', 'entity_type'],
+    'ix_audit_entity_cursor': ['tenant_id', 'entity_id'],
+    'ix_audit_actor_cursor': ['tenant_id', 'actor_id'],
+    'ix_audit_action_cursor': ['tenant_id', 'action'],
+    'ix_audit_actor_action_cursor': ['tenant_id', 'actor_id', 'action'],
+}
+
+UUID_RE = '[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+
+
+def _drop_foreign_keys():
+    op.execute(
+        f"""
+        DO $$
+        DECLARE r record;
+        BEGIN
+            FOR r IN
+                SELECT conrelid::regclass AS tbl, conname
+                FROM pg_constraint
+                WHERE contype = 'f'
+                  AND conparentid = 0
+                  AND conrelid = ANY (ARRAY[{', '.join(f"'{t}'" for t in TABLES)}]::regclass[])
+            LOOP
+                EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', r.tbl, r.conname);
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def upgrade():
+    # -------------------------------
+    # Helpers (session-local)
+    # -------------------------------
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.uuid7(ts timestamptz) RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(set_bit(
+                    overlay(uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM ts) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6),
+                    52, 1), 53, 1),
+                'hex')::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+
+    id_sources = " UNION ALL ".join(
+        f"SELECT id::text AS old_id, created_at::timestamptz AS created_at FROM {table}"
+        for table in TABLES
+    )
+    op.execute(
+        f"""
+        CREATE TEMP TABLE id_map AS
+        SELECT old_id, pg_temp.uuid7(COALESCE(created_at, now())) AS new_id
+        FROM ({id_sources}) ids
+        """
+    )
+    op.execute("ALTER TABLE id_map ADD PRIMARY KEY (old_id)")
+
+    # Unknown references (e.g. dangling actor ids) keep their value if it is a UUID
+    op.execute(
+        f"""
+        CREATE FUNCTION pg_temp.remap(old text) RETURNS uuid AS $$
+            SELECT COALESCE(
+                (SELECT new_id FROM id_map WHERE old_id = old),
+                CASE WHEN old ~* '^{UUID_RE}$' THEN old::uuid END
+            )
+        $$ LANGUAGE sql STABLE
+        """
+    )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION pg_temp.remap_text(doc text) RETURNS text AS $$
+        DECLARE
+            m text;
+            r uuid;
+        BEGIN
+            IF doc IS NULL THEN
+                RETURN NULL;
+            END IF;
+            FOR m IN SELECT DISTINCT (regexp_matches(doc, '{UUID_RE}', 'g'))[1] LOOP
+                SELECT new_id INTO r FROM id_map WHERE old_id = m;
+                IF r IS NOT NULL THEN
+                    doc := replace(doc, m, r::text);
+                END IF;
+            END LOOP;
+            RETURN doc;
+        END
+        $$ LANGUAGE plpgsql STABLE
+        """
+    )
+
+    # -------------------------------
+    # Ids and references → native uuid
+    # -------------------------------
+    _drop_foreign_keys()
+
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_id")
+
+    for table, column in ID_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING pg_temp.remap({column}::text)"
+        )
+
+    op.execute(
+        "UPDATE audit_logs SET entity_id = COALESCE(pg_temp.remap(entity_id)::text, entity_id)"
+    )
+
+    for table, column in JSON_COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column} = pg_temp.remap_text({column}::text)::json "
+            f"WHERE {column} IS NOT NULL"
+        )
+
+    for table, column, referenced, name in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referenced, [column], ['id'])
+
+    # -------------------------------
+    # Database-assigned timestamps
+    # -------------------------------
+    for table in TABLES:
+        for column in ('created_at', 'updated_at'):
+            op.execute(f"UPDATE {table} SET {column} = now() WHERE {column} IS NULL")
+            op.alter_column(table, column, server_default=sa.func.now(), nullable=False)
+
+    # -------------------------------
+    # Audit keyset indexes: (…, id) now that ids are time-ordered
+    # -------------------------------
+    for name, columns in AUDIT_CURSOR_INDEXES.items():
+        op.drop_index(name, table_name='audit_logs')
+        op.create_index(name, 'audit_logs', columns + ['id'])
+
+
+def downgrade():
+    for name, columns in AUDIT_CURSOR_INDEXES.items():
+        op.drop_index(name, table_name='audit_logs')
+        op.create_index(name, 'audit_logs', columns + ['created_at', 'id'])
+
+    for table in TABLES:
+        for column in ('created_at', 'updated_at'):
+            op.alter_column(table, column, server_default=None, nullable=True)
+
+    # Ids stay UUIDv7 values; only the column types are restored
+    _drop_foreign_keys()
+
+    for table, column in ID_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(36) USING {column}::text")
+
+    for table, column, referenced, name in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referenced, [column], ['id'])
+
+    for table in TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'])
@@ -0,0 +1,194 @@
+"""delta encoded page version snapshots
+
+Revision ID: 8b2e4d7a1c90
+Revises: 3f6a9c1d2b7e
+Create Date: 2026-10-17 10:03:27.551934
+
+
+The delta codec is copied from app/utils/snapshots.py as it was at this
+revision, so later changes to the app cannot alter what this migration
+writes or reads back.
+"""
+import json
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d7a1c90'
+down_revision = '3f6a9c1d2b7e'
+branch_labels = None
+depends_on = None
+
+# Same setting as the app. Readers start each chain at the nearest full
+# row, so history stays readable if the interval changes later.
+KEYFRAME_INTERVAL = int(os.getenv('SNAPSHOT_KEYFRAME_INTERVAL', 10))
+
+SECTION_FIELDS = ('type', 'order', 'settings')
+BLOCK_FIELDS = ('type', 'order', 'content', 'media_url')
+
+page_versions = sa.table(
+    'page_versions',
+    sa.column('id', sa.String(36)),
+    sa.column('page_id', sa.String(36)),
+    sa.column('version', sa.Integer),
+    sa.column('snapshot', sa.JSON),
+    sa.column('storage', sa.String(10)),
+    sa.column('base_version', sa.Integer),
+)
+
+
+def _page_ids(conn):
+    return [row[0] for row in conn.execute(sa.select(page_versions.c.page_id).distinct())]
+
+
+def _versions(conn, page_id):
+    return conn.execute(
+        sa.select(
+            page_versions.c.id,
+            page_versions.c.version,
+            page_versions.c.snapshot,
+            page_versions.c.storage,
+        )
+        .where(page_versions.c.page_id == page_id)
+        .order_by(page_versions.c.version)
+    ).all()
+
+
+def _load(value):
+    return json.loads(value) if isinstance(value, str) else value
+
+
+# -------------------------------
+# Delta codec (frozen copy)
+# -------------------------------
+
+def diff_snapshots(old, new):
+    old_sections = {s['id']: s for s in old['sections']}
+    old_blocks = {b['id']: b for s in old['sections'] for b in s['blocks']}
+
+    delta = {
+        'sections': [s['id'] for s in new['sections']],
+        'section_changes': {},
+        'blocks': {},
+        'block_changes': {},
+    }
+
+    if new['page'] != old['page']:
+        delta['page'] = new['page']
+
+    for section in new['sections']:
+        sid = section['id']
+        before = old_sections.get(sid)
+
+        changes = _changed_fields(before, section, SECTION_FIELDS)
+        if changes:
+            delta['section_changes'][sid] = changes
+
+        block_ids = [b['id'] for b in section['blocks']]
+        if before is None or block_ids != [b['id'] for b in before['blocks']]:
+            delta['blocks'][sid] = block_ids
+
+        for block in section['blocks']:
+            changes = _changed_fields(old_blocks.get(block['id']), block, BLOCK_FIELDS)
+            if changes:
+                delta['block_changes'][block['id']] = changes
+
+    return delta
+
+
+def apply_delta(base, delta):
+    base_sections = {s['id']: s for s in base['sections']}
+    base_blocks = {b['id']: b for s in base['sections'] for b in s['blocks']}
+
+    sections = []
+    for sid in delta['sections']:
+        before = base_sections.get(sid, {})
+
+        section = {'id': sid}
+        section.update({f: before[f] for f in SECTION_FIELDS if f in before})
+        section.update(delta['section_changes'].get(sid, {}))
+
+        if sid in delta['blocks']:
+            block_ids = delta['blocks'][sid]
+        else:
+            block_ids = [b['id'] for b in before.get('blocks', [])]
+
+        section['blocks'] = [
+            {'id': bid, **_without_id(base_blocks.get(bid, {})), **delta['block_changes'].get(bid, {})}
+            for bid in block_ids
+        ]
+        sections.append(section)
+
+    return {
+        'page': delta.get('page', base['page']),
+        'sections': sections,
+    }
+
+
+def _changed_fields(before, after, fields):
+    if before is None:
+        return {f: after.get(f) for f in fields}
+
+    return {f: after.get(f) for f in fields if before.get(f) != after.get(f)}
+
+
+def _without_id(data):
+    return {k: v for k, v in data.items() if k != 'id'}
+
+
+def upgrade():
+    op.add_column(
+        'page_versions',
+        sa.Column('storage', sa.String(length=10), nullable=False, server_default='full'),
+    )
+    op.add_column('page_versions', sa.Column('base_version', sa.Integer(), nullable=True))
+
+    conn = op.get_bind()
+
+    # Re-encode history page by page: keep keyframes, diff everything else
+    # against the previous version's full snapshot
+    for page_id in _page_ids(conn):
+        previous = None
+
+        for row in _versions(conn, page_id):
+            snapshot = _load(row.snapshot)
+            keyframe = (row.version - 1) % KEYFRAME_INTERVAL == 0
+
+            if previous is not None and previous[0] == row.version - 1 and not keyframe:
+                conn.execute(
+                    page_versions.update()
+                    .where(page_versions.c.id == row.id)
+                    .values(
+                        snapshot=diff_snapshots(previous[1], snapshot),
+                        storage='delta',
+                        base_version=row.version - 1,
+                    )
+                )
+
+            previous = (row.version, snapshot)
+
+
+def downgrade():
+    conn = op.get_bind()
+
+    for page_id in _page_ids(conn):
+        snapshot = None
+
+        for row in _versions(conn, page_id):
+            data = _load(row.snapshot)
+
+            if row.storage == 'delta':
+                snapshot = apply_delta(snapshot, data)
+                conn.execute(
+                    page_versions.update()
+                    .where(page_versions.c.id == row.id)
+                    .values(snapshot=snapshot)
+                )
+            else:
+                snapshot = data
+
+    op.drop_column('page_versions', 'base_version')
+    op.drop_column('page_versions', 'storage')
@@ -0,0 +1,125 @@
+"""partition audit_logs by month
+
+Revision ID: 9d3a6f1e2c48
+Revises: 5e0b8f2c6d14
+Create Date: 2026-10-17 14:21:05.774310
+
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3a6f1e2c48'
+down_revision = '5e0b8f2c6d14'
+branch_labels = None
+depends_on = None
+
+PREMAKE_MONTHS = 3
+
+INDEXES = {
+    'ix_audit_logs_id': ['id'],
+    'ix_audit_logs_created_at': ['created_at'],
+    'ix_audit_logs_updated_at': ['updated_at'],
+    'ix_audit_logs_tenant_id': ['tenant_id'],
+    'ix_audit_logs_actor_id': ['actor_id'],
+    'ix_audit_logs_action': ['action'],
+    'ix_audit_logs_entity_type': ['entity_type'],
+    'ix_audit_logs_entity_id': ['entity_id'],
+    'ix_audit_cursor': ['tenant_id', 'created_at', 'id'],
+    'ix_audit_actor_action': ['tenant_id', 'actor_id', 'action'],
+}
+
+
+def _add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    op.execute(
+        """
+        CREATE TABLE audit_logs_partitioned (
+            id VARCHAR(36) NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            tenant_id VARCHAR(36) NOT NULL REFERENCES tenants (id),
+            actor_id VARCHAR(36) NOT NULL,
+            action VARCHAR(50) NOT NULL,
+            entity_type VARCHAR(50) NOT NULL,
+            entity_id VARCHAR(36) NOT NULL,
+            payload JSON NOT NULL,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+
+    # One partition per month from the oldest row through the premake window
+    oldest = conn.execute(sa.text("SELECT min(created_at) FROM audit_logs")).scalar()
+    today = datetime.now(timezone.utc).date()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    last = _add_months(date(today.year, today.month, 1), PREMAKE_MONTHS)
+
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE audit_logs_p{month.year:04d}{month.month:02d} "
+            f"PARTITION OF audit_logs_partitioned "
+            f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs_partitioned DEFAULT")
+
+    op.execute(
+        """
+        INSERT INTO audit_logs_partitioned
+            (id, created_at, updated_at, tenant_id, actor_id, action, entity_type, entity_id, payload)
+        SELECT id, COALESCE(created_at, now()), updated_at, tenant_id, actor_id, action,
+               entity_type, entity_id, payload
+        FROM audit_logs
+        """
+    )
+
+    op.drop_table('audit_logs')
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME TO audit_logs")
+    op.execute("ALTER TABLE audit_logs RENAME CONSTRAINT audit_logs_partitioned_pkey TO audit_logs_pkey")
+
+    # Indexes on the parent cascade to every partition
+    for name, columns in INDEXES.items():
+        op.create_index(name, 'audit_logs', columns)
+
+
+def downgrade():
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+
+    op.create_table(
+        'audit_logs',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Column('tenant_id', sa.String(36), sa.ForeignKey('tenants.id'), nullable=False),
+        sa.Column('actor_id', sa.String(36), nullable=False),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('entity_type', sa.String(50), nullable=False),
+        sa.Column('entity_id', sa.String(36), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+    )
+
+    op.execute(
+        """
+        INSERT INTO audit_logs
+            (id, created_at, updated_at, tenant_id, actor_id, action, entity_type, entity_id, payload)
+        SELECT id, created_at, updated_at, tenant_id, actor_id, action, entity_type, entity_id, payload
+        FROM audit_logs_partitioned
+        """
+    )
+
+    # Drops every attached partition with it
+    op.execute("DROP TABLE audit_logs_partitioned")
+
+    for name, columns in INDEXES.items():
+        op.create_index(name, 'audit_logs', columns)
@@ -0,0 +1,31 @@
+"""job leases
+
+Revision ID: b3d5f8a2c719
+Revises: e6c2a9d04b17
+Create Date: 2026-10-17 19:12:36.584120
+
+Running jobs hold a lease (locked_until) their worker keeps extending;
+workers reclaim running jobs whose lease expired.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d5f8a2c719'
+down_revision = 'e6c2a9d04b17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobs', sa.Column('locked_until', sa.DateTime(), nullable=True))
+    op.create_index('ix_job_status_locked_until', 'jobs', ['status', 'locked_until'])
+
+    # Jobs running under pre-lease workers get one generous lease to finish
+    op.execute("UPDATE jobs SET locked_until = now() + interval '15 minutes' WHERE status = 'running'")
+
+
+def downgrade():
+    op.drop_index('ix_job_status_locked_until', table_name='jobs')
+    op.drop_column('jobs', 'locked_until')
@@ -0,0 +1,52 @@
+"""release order slots of soft deleted rows
+
+Revision ID: c41d7e93a5f2
+Revises: 8b2e4d7a1c90
+Create Date: 2026-10-17 11:26:05.904318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7e93a5f2'
+down_revision = '8b2e4d7a1c90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('sections', 'order', existing_type=sa.Integer(), nullable=True)
+    op.alter_column('blocks', 'order', existing_type=sa.Integer(), nullable=True)
+
+    # Tombstones no longer occupy (parent, order) slots
+    op.execute('UPDATE sections SET "order" = NULL WHERE deleted_at IS NOT NULL')
+    op.execute('UPDATE blocks SET "order" = NULL WHERE deleted_at IS NOT NULL')
+
+
+def downgrade():
+    # Park tombstones on unique negative orders so NOT NULL can be restored
+    op.execute(
+        """
+        UPDATE sections s SET "order" = -t.rn
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY page_id ORDER BY deleted_at, id) AS rn
+            FROM sections WHERE "order" IS NULL
+        ) t
+        WHERE s.id = t.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE blocks b SET "order" = -t.rn
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY section_id ORDER BY deleted_at, id) AS rn
+            FROM blocks WHERE "order" IS NULL
+        ) t
+        WHERE b.id = t.id
+        """
+    )
+
+    op.alter_column('blocks', 'order', existing_type=sa.Integer(), nullable=False)
+    op.alter_column('sections', 'order', existing_type=sa.Integer(), nullable=False)
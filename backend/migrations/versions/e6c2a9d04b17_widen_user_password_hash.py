@@ -0,0 +1,36 @@
+"""widen users.password_hash
+
+Revision ID: e6c2a9d04b17
+Revises: 7b1e0c4d9a62
+Create Date: 2026-10-17 18:05:44.270913
+
+werkzeug's default scrypt hashes are 162 characters; String(128) could not
+hold them, nor the upgraded hashes written on login.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6c2a9d04b17'
+down_revision = '7b1e0c4d9a62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'users', 'password_hash',
+        existing_type=sa.String(length=128),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'users', 'password_hash',
+        existing_type=sa.String(length=255),
+        type_=sa.String(length=128),
+        existing_nullable=False,
+    )
@@ -1,6 +1,14 @@
+import os
 from app import create_app
-
-app = create_app("development")
+from app.jobs import start_job_runner
 
 if __name__ == "__main__":
+    # Built here, not at import: spawned helper processes (password hashing
+    # pool) re-import this module as __mp_main__ and must not build an app
+    app = create_app("development")
+
+    # With the reloader on, only the serving child (not the watcher) runs jobs
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_job_runner(app)
+
     app.run(debug=True, host="0.0.0.0", port=5000)
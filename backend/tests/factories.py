@@ -0,0 +1,54 @@
+# tests/factories.py
+from uuid import uuid4
+from flask_jwt_extended import create_access_token
+from app.extensions import db
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.models.page import Page
+from app.models.section import Section
+from app.models.block import Block
+
+
+def make_tenant(**fields) -> Tenant:
+    suffix = uuid4().hex[:8]
+    tenant = Tenant(name=f"Tenant {suffix}", slug=f"tenant-{suffix}", **fields)
+    db.session.add(tenant)
+    db.session.commit()
+    return tenant
+
+
+def make_user(tenant, *, role: str = "admin", password: str = "secret", **fields) -> User:
+    fields.setdefault("email", f"user-{uuid4().hex[:8]}@example.com")
+    user = User(tenant_id=tenant.id, role=role, is_active=True, **fields)
+    user.set_password(password)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def auth_headers(user) -> dict:
+    """Headers of an authenticated request by `user`, as issued by /auth/login."""
+    token = create_access_token(
+        identity=user.id,
+        additional_claims={"tenant_id": user.tenant_id, "role": user.role},
+    )
+    return {"Authorization": f"Bearer {token}", "X-Tenant-ID": user.tenant_id}
+
+
+def make_page(tenant, *, sections: int = 0, blocks_per_section: int = 0, **fields) -> Page:
+    """A page with `sections` sections of `blocks_per_section` text blocks each."""
+    fields.setdefault("title", "Page")
+    fields.setdefault("slug", f"page-{uuid4().hex[:8]}")
+    page = Page(tenant_id=tenant.id, seo={}, **fields)
+
+    for i in range(sections):
+        section = Section(tenant_id=tenant.id, type="content", order=i + 1, settings={})
+        section.blocks = [
+            Block(tenant_id=tenant.id, type="text", order=j + 1, content={"text": f"{i}.{j}"})
+            for j in range(blocks_per_section)
+        ]
+        page.sections.append(section)
+
+    db.session.add(page)
+    db.session.commit()
+    return page
@@ -0,0 +1,46 @@
+# tests/test_audit_partitions.py
+from datetime import date
+from sqlalchemy import text
+from app.extensions import db
+from app.utils.audit_partitions import DEFAULT_PARTITION, PARENT, ensure_partitions, partition_name
+from tests.factories import make_tenant
+
+MONTH = date(2001, 1, 1)
+
+
+def _audit_rows(tenant_id, created_at, count):
+    db.session.execute(
+        text(
+            f"""
+            INSERT INTO {PARENT} (id, created_at, updated_at, tenant_id, actor_id, action, entity_type, entity_id, payload)
+            SELECT gen_random_uuid(), :created_at, :created_at, :tenant_id, gen_random_uuid(),
+                   'page.update', 'page', gen_random_uuid()::text, '{{}}'
+            FROM generate_series(1, :count)
+            """
+        ),
+        {"tenant_id": tenant_id, "created_at": created_at, "count": count},
+    )
+    db.session.commit()
+
+
+def _count(table, where="TRUE"):
+    return db.session.execute(text(f"SELECT count(*) FROM {table} WHERE {where}")).scalar()
+
+
+def test_new_partition_takes_over_rows_from_the_default(db_session):
+    tenant = make_tenant()
+    name = partition_name(MONTH)
+    _audit_rows(tenant.id, "2001-01-10", 5)
+    _audit_rows(tenant.id, "2002-06-10", 3)  # no partition for it: stays in default
+
+    try:
+        assert ensure_partitions(months_ahead=0, today=MONTH) == [name]
+
+        assert _count(name) == 5
+        assert _count(DEFAULT_PARTITION) == 3
+        assert _count(PARENT) == 8
+        assert not db.session.execute(text(f"SELECT to_regclass('{DEFAULT_PARTITION}_moving')")).scalar()
+    finally:
+        db.session.rollback()
+        db.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        db.session.commit()
@@ -0,0 +1,41 @@
+# tests/test_bulk_publish.py
+from app.application.cms.bulk_publish import bulk_publish_pages
+from app.models.page import Page
+from app.extensions import db
+from tests.factories import auth_headers, make_tenant, make_page, make_user
+
+
+def test_malformed_ids_fail_alone(db_session):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=1, blocks_per_section=1)
+    page_id = page.id
+
+    result = bulk_publish_pages(
+        tenant_id=tenant.id,
+        page_ids=["not-a-uuid", page_id.upper(), page_id, 42],
+        action="publish",
+        actor_id=None,
+    )
+
+    assert result["count"] == 1
+    assert [r["page_id"] for r in result["results"]] == ["not-a-uuid", page_id, 42]
+    assert result["failed"] == [
+        {"page_id": "not-a-uuid", "error": "Invalid page id"},
+        {"page_id": 42, "error": "Invalid page id"},
+    ]
+
+    db.session.expire_all()
+    assert db.session.get(Page, page_id).status == "published"
+
+
+def test_route_rejects_a_list_without_valid_ids(db_session, client):
+    tenant = make_tenant()
+    headers = auth_headers(make_user(tenant))
+
+    response = client.post(
+        "/api/v1/pages/bulk/publish",
+        json={"page_ids": ["nope", 7], "action": "publish"},
+        headers=headers,
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,49 @@
+# tests/test_invariants.py
+import pytest
+from app.extensions import db
+from app.domain.invariants.aggregate import validate_scope
+from app.domain.invariants.exceptions import InvariantViolation
+from app.models.block import Block
+from tests.factories import make_tenant, make_page
+
+
+@pytest.fixture(params=["sql", "memory"])
+def validation(request, app, monkeypatch):
+    monkeypatch.setitem(app.config, "INVARIANT_VALIDATION", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("block_type, media_url, valid", [
+    ("image", None, False),
+    ("image", "", False),
+    ("image", "/uploads/a.png", True),
+    ("text", None, True),
+    ("text", "", True),
+    ("text", "/uploads/a.png", False),
+])
+def test_sql_and_memory_media_rules_agree(db_session, validation, block_type, media_url, valid):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=1, blocks_per_section=1)
+    section_id = page.sections[0].id
+
+    block = db.session.get(Block, page.sections[0].blocks[0].id)
+    block.type = block_type
+    block.media_url = media_url
+    db.session.flush()
+
+    if valid:
+        validate_scope(tenant_id=tenant.id, section_ids=[section_id])
+    else:
+        with pytest.raises(InvariantViolation):
+            validate_scope(tenant_id=tenant.id, section_ids=[section_id])
+
+
+def test_tombstoned_sections_are_out_of_scope(db_session, validation):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=2, blocks_per_section=1)
+    section = page.sections[0]
+    section.blocks[0].soft_delete()
+    section.soft_delete()
+    db.session.flush()
+
+    validate_scope(tenant_id=tenant.id, section_ids=[section.id])
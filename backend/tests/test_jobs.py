@@ -0,0 +1,39 @@
+# tests/test_jobs.py
+from datetime import timedelta
+from sqlalchemy import func
+from app.extensions import db
+from app.jobs.runner import claim_next_job
+from app.models.job import Job
+from tests.factories import make_tenant
+
+
+def _running_job(tenant, *, lease_offset: timedelta) -> str:
+    job = Job(
+        tenant_id=tenant.id,
+        type="cms.bulk_publish",
+        status="running",
+        payload={},
+        worker_id="crashed-host:1:0",
+        locked_until=func.now() + lease_offset,
+    )
+    db.session.add(job)
+    db.session.commit()
+    return job.id
+
+
+def test_running_job_with_expired_lease_is_reclaimed(db_session):
+    tenant = make_tenant()
+    job_id = _running_job(tenant, lease_offset=timedelta(seconds=-5))
+
+    assert claim_next_job("live-host:1:0", lease_seconds=30) == job_id
+
+    job = db.session.get(Job, job_id)
+    assert job.status == "running"
+    assert job.worker_id == "live-host:1:0"
+
+
+def test_running_job_with_live_lease_is_left_alone(db_session):
+    tenant = make_tenant()
+    _running_job(tenant, lease_offset=timedelta(seconds=30))
+
+    assert claim_next_job("live-host:1:0", lease_seconds=30) is None
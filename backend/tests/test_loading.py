@@ -0,0 +1,63 @@
+# tests/test_loading.py
+import pytest
+from sqlalchemy import select
+from app.extensions import db
+from app.models.page import Page
+from app.utils.loading import page_tree_options
+from app.utils.sql_metrics import assert_max_queries
+from tests.factories import make_tenant, make_page
+
+# pages, sections, blocks: one SELECT each, however large the tree
+TREE_QUERIES = 3
+
+
+@pytest.mark.parametrize("sections, blocks", [(1, 1), (10, 5), (40, 25)])
+def test_page_tree_loads_in_constant_queries(db_session, sections, blocks):
+    tenant = make_tenant()
+    page_id = make_page(tenant, sections=sections, blocks_per_section=blocks).id
+    db.session.expunge_all()
+
+    with assert_max_queries(TREE_QUERIES) as stats:
+        page = db.session.execute(
+            select(Page).options(page_tree_options()).where(Page.id == page_id)
+        ).scalar_one()
+        tree = [[block.id for block in section.blocks] for section in page.sections]
+
+    assert stats.count == TREE_QUERIES
+    assert len(tree) == sections
+    assert all(len(block_ids) == blocks for block_ids in tree)
+
+
+def test_many_page_trees_load_in_constant_queries(db_session):
+    tenant = make_tenant()
+    for _ in range(8):
+        make_page(tenant, sections=4, blocks_per_section=3)
+    db.session.expunge_all()
+
+    with assert_max_queries(TREE_QUERIES) as stats:
+        pages = db.session.execute(
+            select(Page).options(page_tree_options()).where(Page.tenant_id == tenant.id)
+        ).scalars().all()
+        blocks = sum(len(section.blocks) for page in pages for section in page.sections)
+
+    assert stats.count == TREE_QUERIES
+    assert blocks == 8 * 4 * 3
+
+
+def test_soft_deleted_rows_stay_out_of_the_tree(db_session):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=2, blocks_per_section=2)
+    page.sections[0].blocks[0].soft_delete()
+    page.sections[1].soft_delete()
+    db.session.commit()
+    page_id = page.id
+    db.session.expunge_all()
+
+    with assert_max_queries(TREE_QUERIES):
+        page = db.session.execute(
+            select(Page).options(page_tree_options()).where(Page.id == page_id)
+        ).scalar_one()
+        tree = [[block.id for block in section.blocks] for section in page.sections]
+
+    assert len(tree) == 1
+    assert len(tree[0]) == 1
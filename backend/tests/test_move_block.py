@@ -0,0 +1,62 @@
+# tests/test_move_block.py
+from uuid import uuid4
+import pytest
+from app.extensions import db
+from app.application.cms.move_block import move_block
+from app.models.block import Block
+from tests.factories import auth_headers, make_tenant, make_page, make_user
+
+
+def test_block_moves_to_another_section_of_its_page(db_session):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=2, blocks_per_section=2)
+    block_id = page.sections[0].blocks[0].id
+    target_id = page.sections[1].id
+
+    result = move_block(tenant_id=tenant.id, block_id=block_id, actor_id=None, section_id=target_id)
+
+    assert result["section_id"] == target_id
+    assert db.session.get(Block, block_id).section_id == target_id
+
+
+def test_block_cannot_move_to_a_section_of_another_page(db_session):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=1, blocks_per_section=2)
+    other = make_page(tenant, sections=1, blocks_per_section=1)
+    block_id = page.sections[0].blocks[0].id
+    source_id = page.sections[0].id
+
+    with pytest.raises(ValueError, match="same page"):
+        move_block(tenant_id=tenant.id, block_id=block_id, actor_id=None, section_id=other.sections[0].id)
+
+    db.session.expire_all()
+    assert db.session.get(Block, block_id).section_id == source_id
+
+
+def test_move_route_maps_service_errors_to_client_errors(db_session, client):
+    tenant = make_tenant()
+    headers = auth_headers(make_user(tenant))
+    page = make_page(tenant, sections=1, blocks_per_section=2)
+    other = make_page(tenant, sections=1, blocks_per_section=1)
+    block_id = page.sections[0].blocks[0].id
+
+    response = client.post(
+        f"/api/v1/blocks/{block_id}/move",
+        json={"section_id": other.sections[0].id},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        f"/api/v1/blocks/{block_id}/move",
+        json={"after_id": page.sections[0].blocks[0].id},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        f"/api/v1/blocks/{block_id}/move",
+        json={"section_id": str(uuid4())},
+        headers=headers,
+    )
+    assert response.status_code == 404
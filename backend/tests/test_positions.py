@@ -0,0 +1,67 @@
+# tests/test_positions.py
+import pytest
+from app.extensions import db
+from app.models.section import Section
+from app.utils.order import compact_order
+from tests.factories import auth_headers, make_tenant, make_page, make_user
+
+GAP = 1024
+
+
+@pytest.fixture(autouse=True)
+def sparse_ordering(app, monkeypatch):
+    monkeypatch.setitem(app.config, "ORDERING_MODE", "sparse")
+    monkeypatch.setitem(app.config, "ORDER_GAP", GAP)
+
+
+def _spread(rows):
+    """Sparse keys, as ORDERING_MODE="sparse" stores them."""
+    for i, row in enumerate(rows, start=1):
+        row.order = i * GAP
+
+
+def test_listings_expose_positions_not_sparse_keys(db_session, client):
+    tenant = make_tenant()
+    headers = auth_headers(make_user(tenant))
+    page = make_page(tenant, sections=3, blocks_per_section=3)
+    _spread(page.sections)
+    _spread(page.sections[0].blocks)
+    db.session.commit()
+
+    response = client.get(f"/api/v1/pages/{page.id}/sections", headers=headers)
+    assert response.status_code == 200
+    assert sorted(item["order"] for item in response.get_json()["items"]) == [1, 2, 3]
+
+    response = client.get(f"/api/v1/sections/{page.sections[0].id}/blocks", headers=headers)
+    assert response.status_code == 200
+    assert sorted(item["order"] for item in response.get_json()["items"]) == [1, 2, 3]
+
+
+def test_created_block_reports_its_position(db_session, client):
+    tenant = make_tenant()
+    headers = auth_headers(make_user(tenant))
+    page = make_page(tenant, sections=1, blocks_per_section=2)
+    _spread(page.sections[0].blocks)
+    db.session.commit()
+
+    response = client.post(
+        f"/api/v1/sections/{page.sections[0].id}/blocks",
+        data={"type": "text"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    assert response.get_json()["order"] == 3
+
+
+def test_rebalance_only_rewrites_rows_off_the_grid(db_session):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=3)
+    _spread(page.sections)
+    db.session.commit()
+
+    query = Section.query.filter(Section.page_id == page.id, Section.deleted_at.is_(None))
+    assert compact_order(query, step=GAP) == 0
+
+    page.sections[2].order = 2 * GAP + 1
+    db.session.commit()
+    assert compact_order(query, step=GAP) == 1
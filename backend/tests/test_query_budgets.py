@@ -0,0 +1,60 @@
+# tests/test_query_budgets.py
+"""
+Every @query_budget route, hit with cold caches and a tree large enough
+that an N+1 would blow the budget. TestingConfig turns
+SQL_QUERY_BUDGET_ENFORCE on, so going over raises QueryBudgetExceeded out
+of the test client.
+"""
+import pytest
+from app.extensions import db
+from app.application.cms.publish_page import publish_page
+from app.middleware.auth_context import user_cache
+from app.middleware.tenant_middleware import tenant_cache
+from tests.factories import auth_headers, make_tenant, make_page, make_user
+
+BUDGETED_ROUTES = {
+    "v1.cms.get_page": ("GET", "/api/v1/pages/{slug}"),
+    "v1.cms.get_page_by_id": ("GET", "/api/v1/pages/id/{page_id}"),
+    "v1.cms.list_pages": ("GET", "/api/v1/pages"),
+    "v1.cms.list_sections": ("GET", "/api/v1/pages/{page_id}/sections"),
+    "v1.cms.list_versions": ("GET", "/api/v1/pages/{page_id}/versions"),
+    "v1.cms.rollback_page_route": ("POST", "/api/v1/pages/{page_id}/rollback/1"),
+    "v1.cms.list_blocks": ("GET", "/api/v1/sections/{section_id}/blocks"),
+}
+
+
+@pytest.fixture
+def published_tree(db_session):
+    tenant = make_tenant()
+    user = make_user(tenant, role="admin")
+    pages = [make_page(tenant, sections=6, blocks_per_section=5) for _ in range(4)]
+
+    for page in pages:
+        publish_page(tenant_id=tenant.id, page_id=page.id, actor_id=user.id)
+
+    page = pages[0]
+    values = {"slug": page.slug, "page_id": page.id, "section_id": page.sections[0].id}
+    headers = auth_headers(user)
+    db.session.expunge_all()
+    return values, headers
+
+
+def test_every_budgeted_route_is_covered(app):
+    budgeted = {
+        endpoint for endpoint, view in app.view_functions.items()
+        if hasattr(view, "query_budget")
+    }
+    assert budgeted == set(BUDGETED_ROUTES)
+
+
+@pytest.mark.parametrize("endpoint", sorted(BUDGETED_ROUTES))
+def test_budgeted_route_stays_within_budget_with_cold_caches(client, published_tree, endpoint):
+    values, headers = published_tree
+    method, path = BUDGETED_ROUTES[endpoint]
+
+    user_cache.clear()
+    tenant_cache.clear()
+
+    response = client.open(path.format(**values), method=method, headers=headers)
+
+    assert response.status_code < 400, response.get_data(as_text=True)
@@ -0,0 +1,48 @@
+# tests/test_snapshots.py
+from app.extensions import db
+from app.models.page_version import PageVersion
+from app.utils.snapshots import get_snapshot, get_snapshots, snapshot_cache, store_snapshot
+from app.utils.sql_metrics import assert_max_queries
+from app.utils.versioning import snapshot_page
+from tests.factories import make_tenant, make_page
+
+VERSIONS = 4
+
+
+def _publish_versions(page, count):
+    """Store `count` versions, editing the first block between them."""
+    for number in range(1, count + 1):
+        page.sections[0].blocks[0].content = {"text": f"v{number}"}
+        version = PageVersion(
+            page_id=page.id, tenant_id=page.tenant_id, version=number, status="published",
+        )
+        store_snapshot(version, snapshot_page(page))
+        db.session.add(version)
+        db.session.commit()
+
+
+def test_get_snapshots_loads_every_chain_in_one_query(db_session):
+    tenant = make_tenant()
+    pages = [make_page(tenant, sections=2, blocks_per_section=2) for _ in range(5)]
+    for page in pages:
+        _publish_versions(page, VERSIONS)
+
+    snapshot_cache.clear()
+    with assert_max_queries(1):
+        snapshots = get_snapshots({page.id: VERSIONS for page in pages})
+
+    for page in pages:
+        assert snapshots[page.id]["sections"][0]["blocks"][0]["content"] == {"text": f"v{VERSIONS}"}
+
+    snapshot_cache.clear()
+    for page in pages:
+        assert get_snapshot(page.id, VERSIONS) == snapshots[page.id]
+
+
+def test_get_snapshots_reports_missing_versions(db_session):
+    tenant = make_tenant()
+    page = make_page(tenant, sections=1, blocks_per_section=1)
+    _publish_versions(page, 2)
+
+    snapshot_cache.clear()
+    assert get_snapshots({page.id: 3}) == {page.id: None}
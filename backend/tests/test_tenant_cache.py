@@ -0,0 +1,25 @@
+# tests/test_tenant_cache.py
+from app.extensions import db
+from app.models.tenant import Tenant
+from tests.factories import auth_headers, make_tenant, make_user
+
+
+def test_non_canonical_header_shares_the_invalidated_entry(db_session, client):
+    tenant = make_tenant()
+    headers = auth_headers(make_user(tenant))
+    headers["X-Tenant-ID"] = "{" + tenant.id.upper() + "}"
+
+    assert client.get("/api/v1/pages", headers=headers).status_code == 200
+
+    db.session.get(Tenant, tenant.id).is_active = False
+    db.session.commit()
+
+    assert client.get("/api/v1/pages", headers=headers).status_code == 404
+
+
+def test_malformed_header_is_rejected(db_session, client):
+    tenant = make_tenant()
+    headers = auth_headers(make_user(tenant))
+    headers["X-Tenant-ID"] = "tenant-1"
+
+    assert client.get("/api/v1/pages", headers=headers).status_code == 400
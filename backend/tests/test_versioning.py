@@ -0,0 +1,97 @@
+# tests/test_versioning.py
+import threading
+import time
+from sqlalchemy import select
+from app.extensions import db
+from app.models.page import Page
+from app.models.page_version import PageVersion
+from app.utils.versioning import next_version
+from tests.factories import make_tenant, make_page
+
+WRITERS = 8
+
+
+def _write_version(app, page_id, tenant_id, *, before_commit=None):
+    """Allocate and insert one PageVersion in its own session/transaction."""
+    with app.app_context():
+        try:
+            version = PageVersion(
+                page_id=page_id,
+                tenant_id=tenant_id,
+                version=next_version(page_id, tenant_id),
+                status="published",
+                snapshot={"page": {"id": page_id}, "sections": []},
+            )
+            db.session.add(version)
+            db.session.flush()
+
+            if before_commit:
+                before_commit()
+
+            db.session.commit()
+            return version.version
+        finally:
+            db.session.remove()
+
+
+def test_concurrent_publishers_get_distinct_versions(app, db_session):
+    tenant = make_tenant()
+    page_id = make_page(tenant).id
+    tenant_id = tenant.id
+
+    start = threading.Barrier(WRITERS)
+    allocated, errors = [], []
+
+    def writer():
+        start.wait()
+        try:
+            allocated.append(_write_version(app, page_id, tenant_id))
+        except Exception as exc:  # surfaced by the assertions below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer) for _ in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert errors == []
+    assert sorted(allocated) == list(range(1, WRITERS + 1))
+
+    db.session.expire_all()
+    assert db.session.get(Page, page_id).version_counter == WRITERS
+    stored = db.session.execute(
+        select(PageVersion.version).where(PageVersion.page_id == page_id)
+    ).scalars().all()
+    assert sorted(stored) == list(range(1, WRITERS + 1))
+
+
+def test_second_publisher_waits_for_the_first_to_commit(app, db_session):
+    tenant = make_tenant()
+    page_id = make_page(tenant).id
+    tenant_id = tenant.id
+
+    first_allocated = threading.Event()
+    results = {}
+
+    def slow_commit():
+        first_allocated.set()
+        time.sleep(0.3)  # hold the counter row lock
+        results["first_committed_at"] = time.monotonic()
+
+    def first():
+        results["first"] = _write_version(app, page_id, tenant_id, before_commit=slow_commit)
+
+    def second():
+        first_allocated.wait(timeout=10)
+        results["second"] = _write_version(app, page_id, tenant_id)
+        results["second_done_at"] = time.monotonic()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert (results["first"], results["second"]) == (1, 2)
+    assert results["second_done_at"] >= results["first_committed_at"]
@@ -1,3 +1,7 @@
 from app import create_app
+from app.jobs import start_job_runner
 
-app = create_app("production")
\ No newline at end of file
+app = create_app("production")
+
+# Imported once per gunicorn worker (without preload_app)
+start_job_runner(app)